@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Sri Lanka Parliament MP Name Matcher
+====================================
+Resolves MP display names from any parliament.lk page (house-attendance
+listings, Hansard, committee pages) to the profile ids in the MP directory.
+
+The same MP shows up as "Hon. Anura Kumara Dissanayake", "A. K. Dissanayake",
+"Dissanayake, Anura Kumara" or with a transliteration drift
+("Wickremesinghe" / "Wickramasinghe"). Names are matched in four passes,
+cheapest first, each backed by a precomputed index so resolving 225 MPs
+against hundreds of sittings never compares every name with every other:
+
+    1. exact        normalised name (honorifics, punctuation, case removed)
+    2. tokens       the same words in any order
+    3. initials     surname + leading initials, through a trie
+    4. fuzzy        trigram-blocked similarity ratio above a threshold, among
+                    directory names whose given names don't conflict
+
+Usage:
+    from mp_matcher import MPNameMatcher
+
+    matcher = MPNameMatcher(mps)            # [{"id": ..., "name": ...}, ...]
+    result = matcher.match("A. K. Dissanayake")
+    result.mp_id, result.method, result.score
+
+    mapping, unresolved, ambiguous = matcher.resolve_all(names)
+"""
+
+import re
+from collections import defaultdict, namedtuple
+from difflib import SequenceMatcher
+
+HONORIFICS = {
+    "hon", "honourable", "honorable", "rt", "dr", "prof", "professor",
+    "mr", "mrs", "ms", "miss", "ven", "venerable", "rev", "attorney", "at", "law",
+    "pc", "mp",
+}
+NAME_PARTICLES = {"de", "da", "di", "du", "la", "le", "bin"}  # short words that are not initials
+FUZZY_THRESHOLD = 0.85  # minimum SequenceMatcher ratio for a fuzzy match
+FUZZY_MARGIN = 0.02     # runner-up this close to the best makes it ambiguous
+FUZZY_CANDIDATES = 10   # trigram-blocked candidates scored per query
+
+MatchResult = namedtuple("MatchResult", ["name", "mp_id", "method", "score", "candidates"])
+
+
+def name_tokens(name):
+    """Lowercase word tokens of a name, honorifics dropped.
+
+    Initials written together without spaces ("AK.") are split into one
+    token per letter so they line up with spelled-out given names.
+    """
+    tokens = []
+    for raw in re.findall(r"[^\W_]+\.?", name.lower()):
+        word = raw.rstrip(".")
+        if word in HONORIFICS:
+            continue
+        if raw.endswith(".") and len(word) == 2 and word not in NAME_PARTICLES:
+            tokens.extend(word)
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def _has_initials(tokens):
+    return any(len(t) == 1 for t in tokens)
+
+
+def normalise_name(name):
+    """Reduce a display name to lowercase words, without honorifics."""
+    return " ".join(name_tokens(name))
+
+
+def _split_name(tokens):
+    """Split tokens into (surname, initials of the other name parts).
+
+    Directory names are written given-names-first, but some listings put the
+    surname first followed by a comma; callers pass names through this after
+    handling the comma, so the surname is the last multi-letter token.
+    """
+    words = [t for t in tokens if len(t) > 1]
+    if not words:
+        return None, ""
+    surname = words[-1]
+    index = len(tokens) - 1 - tokens[::-1].index(surname)
+    initials = "".join(t[0] for i, t in enumerate(tokens) if i != index)
+    return surname, initials
+
+
+def _given_names(tokens):
+    """Every token but the surname (as chosen by _split_name), in order."""
+    surname, _ = _split_name(tokens)
+    if surname is None:
+        return list(tokens)
+    index = len(tokens) - 1 - tokens[::-1].index(surname)
+    return tokens[:index] + tokens[index + 1:]
+
+
+def _given_names_agree(ours, theirs):
+    """Whether two given-name lists could belong to the same person.
+
+    Names are compared position by position: initials must match the first
+    letter, and two spelled-out names must be near-identical (a
+    transliteration drift, not "Nimal" against "Nalin"). Extra names on
+    either side are not a conflict.
+    """
+    for a, b in zip(ours, theirs):
+        if a[0] != b[0]:
+            return False
+        if len(a) > 1 and len(b) > 1 and SequenceMatcher(None, a, b).ratio() < FUZZY_THRESHOLD:
+            return False
+    return True
+
+
+def _trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class InitialsTrie:
+    """Trie over surname followed by initials, one letter per level.
+
+    Looking up "perera" + "ak" walks perera → a → k and returns every MP id
+    stored at or below that node, so an abbreviated name still resolves when
+    the directory spells out more given names than the listing does.
+    """
+
+    def __init__(self):
+        self.root = {}
+
+    def insert(self, surname, initials, mp_id):
+        node = self.root.setdefault(surname, {})
+        node.setdefault("$", set()).add(mp_id)
+        for letter in initials:
+            node = node.setdefault(letter, {})
+            node.setdefault("$", set()).add(mp_id)
+
+    def lookup(self, surname, initials):
+        node = self.root.get(surname)
+        if node is None:
+            return set()
+        for letter in initials:
+            node = node.get(letter)
+            if node is None:
+                return set()
+        return set(node.get("$", ()))
+
+
+class MPNameMatcher:
+    """Precomputed name → MP id index over a directory listing."""
+
+    def __init__(self, mps, threshold=FUZZY_THRESHOLD):
+        self.threshold = threshold
+        self.names = {}
+        self.exact = defaultdict(set)
+        self.token_sets = defaultdict(set)
+        self.trie = InitialsTrie()
+        self.trigram_index = defaultdict(set)
+        self.normalised = {}
+        self.given = {}  # mp_id -> given names, for the fuzzy pass's conflict check
+        self.abbreviated = set()  # MPs listed with initials in the directory
+        self.memo = {}
+
+        for mp in mps:
+            mp_id = mp["id"]
+            self.names[mp_id] = mp["name"]
+            for tokens in self._variants(mp["name"]):
+                if _has_initials(tokens):
+                    self.abbreviated.add(mp_id)
+                key = " ".join(tokens)
+                self.exact[key].add(mp_id)
+                self.token_sets[" ".join(sorted(tokens))].add(mp_id)
+                surname, initials = _split_name(tokens)
+                if surname:
+                    self.trie.insert(surname, initials, mp_id)
+            key = normalise_name(mp["name"])
+            self.normalised[mp_id] = key
+            variants = self._variants(mp["name"])
+            self.given[mp_id] = _given_names(variants[-1]) if variants else []
+            for gram in _trigrams(key):
+                self.trigram_index[gram].add(mp_id)
+
+    @staticmethod
+    def _variants(name):
+        """Token lists for a name, plus the reordered "Surname, Given" form."""
+        variants = [name_tokens(name)]
+        if "," in name:
+            surname, _, given = name.partition(",")
+            variants.append(name_tokens(given) + name_tokens(surname))
+        return [v for v in variants if v]
+
+    def match(self, name):
+        """Resolve one display name. Results are memoised per raw name."""
+        if name not in self.memo:
+            self.memo[name] = self._match(name)
+        return self.memo[name]
+
+    def _match(self, name):
+        variants = self._variants(name)
+        if not variants:
+            return MatchResult(name, None, "unresolved", 0.0, [])
+
+        for method, lookup in (
+            ("exact", lambda tokens: self.exact.get(" ".join(tokens), set())),
+            ("tokens", lambda tokens: self.token_sets.get(" ".join(sorted(tokens)), set())),
+            ("initials", lambda tokens: self.trie.lookup(*_split_name(tokens))),
+        ):
+            ids = set()
+            for tokens in variants:
+                ids |= lookup(tokens)
+            if (method == "initials" and _split_name(variants[0])[1]
+                    and not any(_has_initials(t) for t in variants)):
+                # "Ajith Perera" must not claim "Anura Perera" just because the
+                # initials agree; only abbreviated directory names can.
+                ids &= self.abbreviated
+            if len(ids) == 1:
+                return MatchResult(name, ids.pop(), method, 1.0, [])
+            if ids:
+                return MatchResult(name, None, "ambiguous", 1.0, sorted(ids))
+
+        return self._fuzzy(name, variants[-1])
+
+    def _fuzzy(self, name, tokens):
+        # Similar strings are not enough: "A. B. Perera" is close to
+        # "A. C. Perera" and "Nimal Fernando" to "Nalin Fernando", but those
+        # are different people (often an MP who has since left the
+        # directory). Candidates whose given names conflict are set aside
+        # and only reported as the closest misses.
+        key = " ".join(tokens)
+        given = _given_names(tokens)
+        shared = defaultdict(int)
+        for gram in _trigrams(key):
+            for mp_id in self.trigram_index.get(gram, ()):
+                shared[mp_id] += 1
+        candidates = sorted(shared, key=shared.get, reverse=True)[:FUZZY_CANDIDATES]
+        scored = sorted(
+            ((SequenceMatcher(None, key, self.normalised[mp_id]).ratio(), mp_id) for mp_id in candidates),
+            reverse=True,
+        )
+        closest = scored
+        scored = [(s, m) for s, m in scored if _given_names_agree(given, self.given[m])]
+        if not scored or scored[0][0] < self.threshold:
+            best = closest[0][0] if closest else 0.0
+            return MatchResult(name, None, "unresolved", round(best, 3), [m for _, m in closest[:3]])
+        best_score, best_id = scored[0]
+        if len(scored) > 1 and best_score - scored[1][0] < FUZZY_MARGIN:
+            close = [m for s, m in scored if best_score - s < FUZZY_MARGIN]
+            return MatchResult(name, None, "ambiguous", round(best_score, 3), close)
+        return MatchResult(name, best_id, "fuzzy", round(best_score, 3), [])
+
+    def resolve_all(self, names):
+        """Resolve many names at once.
+
+        Returns ({name: mp_id}, [unresolved MatchResult], [ambiguous MatchResult]).
+        """
+        mapping, unresolved, ambiguous = {}, [], []
+        for name in dict.fromkeys(names):
+            result = self.match(name)
+            if result.mp_id is not None:
+                mapping[name] = result.mp_id
+            elif result.method == "ambiguous":
+                ambiguous.append(result)
+            else:
+                unresolved.append(result)
+        return mapping, unresolved, ambiguous
+
+    def describe(self, result):
+        """One-line human-readable explanation of a failed match."""
+        candidates = ", ".join(f"{self.names[m]} ({m})" for m in result.candidates)
+        if result.method == "ambiguous":
+            return f"{result.name!r} is ambiguous between {candidates}"
+        suffix = f"; closest: {candidates} at {result.score}" if candidates else ""
+        return f"{result.name!r} matched no MP{suffix}"
@@ -6,22 +6,80 @@ Scrapes all 225 MPs' attendance records from parliament.lk
 Run quarterly to refresh the dashboard data.
 
 Usage:
-    python mp_scraper.py
+    python mp_scraper.py                    # 4 MPs in flight, 2 req/s per host
+    python mp_scraper.py --no-cache         # ignore the conditional-GET cache
+    python mp_scraper.py --incremental      # only fetch sittings newer than last run
+    python mp_scraper.py --resume           # pick up a crashed run from its journal
+    python mp_scraper.py --mode by-date     # one listing page per few sittings, not per MP
+    python mp_scraper.py --mode cross-check # run both crawls and diff them (exit 2 on mismatch)
+    python mp_scraper.py --legislatures 995,994,993   # parallel historical backfill
+    python mp_scraper.py --concurrency 1    # original one-MP-at-a-time crawl
+    python mp_scraper.py --concurrency 8 --rate 1.5
+    python mp_scraper.py --engine pipeline  # fetch/parse/aggregate stages + bottleneck report
+    python mp_scraper.py --prometheus-textfile /var/lib/node_exporter/mp_scraper.prom
+    python mp_scraper.py --reparse-from archive   # rebuild the output from archived pages, offline
+    python mp_scraper.py --record cassette        # capture every HTTP exchange ...
+    python mp_scraper.py --replay cassette --replay-latency 1   # ... and run offline against it
+
+Requires:
+    pip install numpy
+    pip install brotli   (optional — for the br figure in the size report)
 
 Output:
     ../public/data/mp_attendance.json
+    ../public/data/mp_attendance.min.json       (minified, deterministic key order)
+    ../public/data/mp_attendance.records.json   (per-MP daily records)
+    ../public/data/mp_attendance.matrix.json    (MP × sitting 2-bit status matrix)
+    ../public/data/mp_attendance.delta.json     (what changed since the previous run)
+    ../public/data/mp_attendance/index.json     (summaries + rankings, for first paint)
+    ../public/data/mp_attendance/members/<id>.<hash>.json   (one MP's full history)
+
+    ./attendance.sqlite   (SQLite store: mps, sittings, attendance + summary views)
+    ./.cache/metrics.json (latency/status/retry/byte/parse/stage metrics of the last run)
+    ./archive/            (every fetched page, gzip + sha256-addressed, for --reparse-from)
+
+    With --legislatures, each legislature is written to
+    ../public/data/mp_attendance.<id>.json (+ .records/.matrix and an
+    mp_attendance.<id>/ shard directory) and listed in
+    ../public/data/mp_attendance.manifest.json
 """
 
+import argparse
+import base64
+import gzip
+import hashlib
 import json
+import multiprocessing
 import time
+import queue
 import re
 import os
+import random
+import sqlite3
 import sys
-from datetime import datetime, timedelta
+import threading
+import zlib
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from html.parser import HTMLParser
-from urllib.request import urlopen, Request
+from http.client import HTTPConnection, HTTPMessage, HTTPSConnection, HTTPException, responses
 from urllib.error import URLError, HTTPError
-from urllib.parse import urlencode
+from urllib.parse import urlencode, urljoin, urlparse
+
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: pip install numpy")
+    sys.exit(1)
+
+try:
+    import brotli  # optional: the size report skips br without it
+except ImportError:
+    brotli = None
+
+from mp_matcher import MPNameMatcher
 
 # ── Configuration ───────────────────────────────────────────────────────────
 BASE_URL = "https://www.parliament.lk"
@@ -29,19 +87,62 @@ DIRECTORY_URL = f"{BASE_URL}/en/members-of-parliament/mp-listing"
 ATTENDANCE_URL = f"{BASE_URL}/en/members-of-parliament/house-attendance"
 PROFILE_URL = f"{BASE_URL}/en/members-of-parliament/mp-profile"
 LEGISLATURE_ID = "995"  # 10th Parliament (2024-present)
+LEGISLATURE_NAMES = {
+    "995": "10th Parliament of the D.S.R. of Sri Lanka (2024-present)",
+}
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "public", "data")
 OUTPUT_FILE = os.path.join(OUTPUT_DIR, "mp_attendance.json")
+RECORDS_FILE = os.path.join(OUTPUT_DIR, "mp_attendance.records.json")  # per-MP daily records
+MATRIX_FILE = os.path.join(OUTPUT_DIR, "mp_attendance.matrix.json")  # MP × sitting 2-bit codes
+DELTA_FILE = os.path.join(OUTPUT_DIR, "mp_attendance.delta.json")  # changes since the previous run
+JOURNAL_FILE = os.path.join(os.path.dirname(__file__), ".cache", "attendance.journal.jsonl")
+CROSSCHECK_FILE = os.path.join(os.path.dirname(__file__), ".cache", "crosscheck.json")
+METRICS_FILE = os.path.join(os.path.dirname(__file__), ".cache", "metrics.json")  # last run's metrics
+MANIFEST_FILE = os.path.join(OUTPUT_DIR, "mp_attendance.manifest.json")  # --legislatures shards
+DB_FILE = os.path.join(os.path.dirname(__file__), "attendance.sqlite")  # analyst query store
+SHARD_DIR = os.path.join(OUTPUT_DIR, "mp_attendance")  # index.json + members/<id>.<hash>.json
+SHARD_HASH_LENGTH = 12  # hex digits of sha256 in member shard file names
+MAX_HOUSE_ATTENDANCE_PAGES = 200  # safety cap on the by-date listing
+MAX_DIRECTORY_PAGES = 9  # safety cap on the MP directory
+MAX_PAGES_PER_MP = 19  # safety cap on one MP's attendance listing
 REQUEST_DELAY = 0.5  # seconds between requests to be polite
+REQUEST_RATE = 1 / REQUEST_DELAY  # sustained requests/second allowed per host
+REQUEST_BURST = 2  # requests a host may receive back-to-back before throttling
+ADAPTIVE_INITIAL_WINDOW = 2  # requests in flight per host before the AIMD controller has measured
+ADAPTIVE_MAX_WINDOW = 16  # ceiling on requests in flight per host
+LATENCY_SPIKE = 3.0  # a response this many times slower than the running average counts as congestion
+BACKOFF_BASE = 1.0  # seconds; retry n sleeps a random 0..BACKOFF_BASE * 2**n ("full jitter")
+BACKOFF_CAP = 30.0  # seconds; longest jittered backoff
+MAX_RETRY_AFTER = 300  # seconds; longer Retry-After values are clamped to this
+DEFAULT_CONCURRENCY = 4  # MPs scraped in parallel (1 = original sequential crawl)
+DEFAULT_PAGE_CONCURRENCY = 3  # pages of one MP's listing fetched in parallel
+DEFAULT_PARSE_PROCESSES = max(1, min(4, (os.cpu_count() or 2) // 2))  # --engine pipeline parsers
+PIPELINE_QUEUE_SIZE = 16  # raw pages buffered between the fetch and parse stages
+ROLLING_WINDOW = 30  # sittings in the rolling absentee-rate window
+QUORUM = 20  # members (Speaker included) needed for a sitting of Parliament
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; MPTracker/1.0; +https://analyst.rizrazak.com)",
     "Accept": "text/html,application/xhtml+xml",
     "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
 }
+REQUEST_TIMEOUT = 30  # seconds per request
+MAX_REDIRECTS = 5
+CACHE_DIR = os.path.join(os.path.dirname(__file__), ".cache", "http")
+CACHE_MAX_MB = 200  # LRU-evicted beyond this many MB of cached bodies
+ARCHIVE_DIR = os.path.join(os.path.dirname(__file__), "archive")  # every page parsed, content-addressed
 
 
 # ── HTML Parsers ────────────────────────────────────────────────────────────
 
+def link_page_number(href):
+    """Page number of a pagination link (its ?page=N), or None."""
+    match = re.search(r"[?&]page=(\d+)", href or "")
+    return int(match.group(1)) if match else None
+
+
 class MPDirectoryParser(HTMLParser):
     """Parses MP directory pages to extract MP profiles."""
 
@@ -57,10 +158,17 @@ class MPDirectoryParser(HTMLParser):
         self.capture_text = False
         self.text_buffer = ""
         self.last_text = ""
+        self.page_count = 1
+        self.paginated = False  # True once any page-link has been seen
 
     def handle_starttag(self, tag, attrs):
         attrs_dict = dict(attrs)
-        if tag == "a" and "href" in attrs_dict:
+        if tag == "a" and "page-link" in attrs_dict.get("class", ""):
+            page = link_page_number(attrs_dict.get("href"))
+            if page:
+                self.paginated = True
+                self.page_count = max(self.page_count, page)
+        elif tag == "a" and "href" in attrs_dict:
             href = attrs_dict["href"]
             if "/mp-profile/" in href:
                 mp_id = href.split("/mp-profile/")[-1].split("?")[0].split("/")[0]
@@ -114,11 +222,19 @@ class AttendancePageParser(HTMLParser):
         self.current_date_idx = -1
         self.text_buffer = ""
         self.table_count = 0
+        self.page_count = 1
+        self.paginated = False  # True once any page-link has been seen
 
     def handle_starttag(self, tag, attrs):
         attrs_dict = dict(attrs)
         cls = attrs_dict.get("class", "")
 
+        if tag == "a" and "page-link" in cls:
+            page = link_page_number(attrs_dict.get("href"))
+            if page:
+                self.paginated = True
+                self.page_count = max(self.page_count, page)
+
         if tag == "button" and "accordion-button" in cls:
             self.in_accordion_button = True
             self.text_buffer = ""
@@ -185,6 +301,7 @@ class MemberAttendanceParser(HTMLParser):
         self.current_row = {}
         self.text_buffer = ""
         self.page_count = 1
+        self.paginated = False  # True once any page-link has been seen
 
     def handle_starttag(self, tag, attrs):
         attrs_dict = dict(attrs)
@@ -200,9 +317,13 @@ class MemberAttendanceParser(HTMLParser):
             self.in_cell = True
             self.text_buffer = ""
 
-        # Check pagination for total pages
+        # Check pagination for total pages — the highest ?page=N linked
+        # (including any "Last" link) is the final page.
         if tag == "a" and "page-link" in cls:
-            pass
+            page = link_page_number(attrs_dict.get("href"))
+            if page:
+                self.paginated = True
+                self.page_count = max(self.page_count, page)
 
     def handle_endtag(self, tag):
         if tag == "td" and self.in_cell:
@@ -227,119 +348,1903 @@ class MemberAttendanceParser(HTMLParser):
             self.text_buffer += data
 
 
+# ── Rate Limiting ───────────────────────────────────────────────────────────
+
+class TokenBucket:
+    """Thread-safe token bucket: refills `rate` tokens/second, holds `burst`."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then spend it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class AdaptiveWindow:
+    """AIMD limit on one host's requests in flight, as TCP does for packets.
+
+    Every healthy response widens the window by 1/window (about one request
+    per round trip); a 429, a 5xx, a timeout or a latency spike halves it, at
+    most once per round trip so one burst of failures counts once. A
+    Retry-After pauses the whole host, not just the request that got it.
+    """
+
+    def __init__(self, initial=ADAPTIVE_INITIAL_WINDOW, maximum=ADAPTIVE_MAX_WINDOW):
+        self.limit = float(initial)
+        self.maximum = maximum
+        self.in_flight = 0
+        self.latency = None  # running average of healthy responses, seconds
+        self.paused_until = 0.0
+        self.last_decrease = 0.0
+        self.decreases = 0
+        self.peak = self.limit
+        self.cond = threading.Condition()
+
+    def enter(self):
+        with self.cond:
+            while True:
+                wait = self.paused_until - time.monotonic()
+                if wait > 0:
+                    self.cond.wait(wait)
+                elif self.in_flight >= int(self.limit):
+                    self.cond.wait()
+                else:
+                    break
+            self.in_flight += 1
+
+    def exit(self, latency=None, congested=False, retry_after=None):
+        with self.cond:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if retry_after:
+                self.paused_until = max(self.paused_until, now + retry_after)
+            if latency is not None and not congested:
+                if self.latency is not None and latency > LATENCY_SPIKE * max(self.latency, 0.05):
+                    congested = True
+                else:
+                    self.limit = min(self.maximum, self.limit + 1 / self.limit)
+                    self.peak = max(self.peak, self.limit)
+                # Spikes are averaged in too: if the site has just become
+                # slower for good, the average catches up and later responses
+                # stop counting as congestion instead of pinning the window at 1.
+                self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+            if congested and now - self.last_decrease > max(2 * (self.latency or 0), 1.0):
+                self.limit = max(1.0, self.limit / 2)
+                self.last_decrease = now
+                self.decreases += 1
+            self.cond.notify_all()
+
+
+class HostRateLimiter:
+    """One token bucket per host, so every worker shares the same budget.
+
+    The bucket's rate is a hard politeness ceiling. When `adaptive`, each
+    host also gets an AdaptiveWindow, so how many requests are in flight
+    follows what the site is currently tolerating, and the fixed pauses of
+    the sequential crawl are skipped (see polite_delay). The window can only
+    hold the crawl below the bucket's rate, never push it above.
+    """
+
+    def __init__(self, rate=REQUEST_RATE, burst=REQUEST_BURST, adaptive=True):
+        self.rate = rate
+        self.burst = burst
+        self.adaptive = adaptive
+        self.buckets = {}
+        self.windows = {}
+        self.lock = threading.Lock()
+
+    def configure(self, rate=None, burst=None, adaptive=None):
+        with self.lock:
+            if rate is not None:
+                self.rate = rate
+            if burst is not None:
+                self.burst = burst
+            if adaptive is not None:
+                self.adaptive = adaptive
+            self.buckets = {}
+            self.windows = {}
+
+    def acquire(self, url):
+        """Wait for a window slot (adaptive mode) and a token for `url`'s host.
+
+        In adaptive mode every acquire must be paired with a release().
+        """
+        host = urlparse(url).netloc
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                bucket = self.buckets[host] = TokenBucket(self.rate, self.burst)
+            window = self.windows.get(host)
+            if window is None and self.adaptive:
+                window = self.windows[host] = AdaptiveWindow()
+        if window is not None:
+            window.enter()
+        bucket.acquire()
+
+    def release(self, url, latency=None, congested=False, retry_after=None):
+        """Report how the request went: `latency` if it succeeded, else whether it signalled congestion."""
+        window = self.windows.get(urlparse(url).netloc)
+        if window is not None:
+            window.exit(latency, congested, retry_after)
+
+    def summary(self):
+        if not self.adaptive:
+            return {}
+        with self.lock:
+            return {host: {"window": round(w.limit, 2), "peak_window": round(w.peak, 2),
+                           "decreases": w.decreases,
+                           "avg_latency": round(w.latency, 4) if w.latency is not None else None}
+                    for host, w in self.windows.items()}
+
+
+RATE_LIMITER = HostRateLimiter()
+
+
+def polite_delay(seconds):
+    """The fixed pause of the original sequential crawl; the adaptive window replaces it."""
+    if not RATE_LIMITER.adaptive:
+        time.sleep(seconds)
+
+
+# ── HTTP Session ────────────────────────────────────────────────────────────
+
+Response = namedtuple("Response", ["url", "status", "headers", "body"])
+
+
+def decode_body(raw, encoding):
+    """Undo a gzip/deflate Content-Encoding; anything else passes through."""
+    encoding = (encoding or "").strip().lower()
+    if encoding in ("gzip", "x-gzip"):
+        return gzip.decompress(raw)
+    if encoding == "deflate":
+        # Servers disagree on whether "deflate" means zlib-wrapped or raw.
+        try:
+            return zlib.decompress(raw)
+        except zlib.error:
+            return zlib.decompress(raw, -zlib.MAX_WBITS)
+    return raw
+
+
+class HTTPSession:
+    """Keep-alive HTTP client with a small connection pool per host.
+
+    Connections are checked out for one request at a time, so a session can
+    be shared by every worker thread. Tracks body bytes on the wire against
+    decoded bytes so the gzip saving shows up in the run summary.
+    """
+
+    def __init__(self, headers=HEADERS, timeout=REQUEST_TIMEOUT):
+        self.headers = dict(headers)
+        self.timeout = timeout
+        self.idle = {}  # (scheme, netloc) -> [connection, ...]
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+        self.bytes_wire = 0
+        self.bytes_decoded = 0
+
+    def _checkout(self, key, fresh=False):
+        """Return (connection, reused) — an idle pooled one unless `fresh`."""
+        with self.lock:
+            pool = self.idle.setdefault(key, [])
+            if pool and not fresh:
+                return pool.pop(), True
+            self.connections_opened += 1
+        scheme, netloc = key
+        cls = HTTPSConnection if scheme == "https" else HTTPConnection
+        return cls(netloc, timeout=self.timeout), False
+
+    def _checkin(self, key, conn):
+        with self.lock:
+            self.idle.setdefault(key, []).append(conn)
+
+    def _send(self, url, headers):
+        parts = urlparse(url)
+        key = (parts.scheme, parts.netloc)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        # A pooled connection may have been closed by the server while idle;
+        # that surfaces as a failed request, so retry once on a new socket.
+        for fresh in (False, True):
+            conn, reused = self._checkout(key, fresh)
+            try:
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+                raw = resp.read()
+            except (HTTPException, OSError):
+                conn.close()
+                if reused and not fresh:
+                    continue
+                raise
+            break
+
+        if resp.will_close:
+            conn.close()
+        else:
+            self._checkin(key, conn)
+
+        body = decode_body(raw, resp.getheader("Content-Encoding"))
+        with self.lock:
+            self.requests += 1
+            self.bytes_wire += len(raw)
+            self.bytes_decoded += len(body)
+        return Response(url, resp.status, resp.headers, body)
+
+    def get(self, url, headers=None):
+        """GET `url`, following redirects. Raises HTTPError for 4xx/5xx."""
+        merged = dict(self.headers)
+        merged.update(headers or {})
+        for _ in range(MAX_REDIRECTS + 1):
+            resp = self._send(url, merged)
+            location = resp.headers.get("Location")
+            if resp.status in (301, 302, 303, 307, 308) and location:
+                url = urljoin(url, location)
+                continue
+            if resp.status >= 400:
+                raise HTTPError(url, resp.status, responses.get(resp.status, ""), resp.headers, None)
+            return resp
+        raise HTTPError(url, resp.status, "Too many redirects", resp.headers, None)
+
+    def close(self):
+        with self.lock:
+            for pool in self.idle.values():
+                for conn in pool:
+                    conn.close()
+            self.idle = {}
+
+    def transfer_summary(self):
+        wire_kb = self.bytes_wire / 1024
+        decoded_kb = self.bytes_decoded / 1024
+        saved = (1 - self.bytes_wire / self.bytes_decoded) * 100 if self.bytes_decoded else 0
+        return (f"{self.requests} requests over {self.connections_opened} connections, "
+                f"{wire_kb:.0f} KB on the wire / {decoded_kb:.0f} KB decoded ({saved:.0f}% saved)")
+
+
+SESSION = HTTPSession()
+
+
+# ── Cassettes ───────────────────────────────────────────────────────────────
+
+class CassetteMiss(LookupError):
+    """A replayed run asked for a URL the cassette never recorded."""
+
+
+class CassetteSession(HTTPSession):
+    """HTTPSession that records every exchange to, or replays it from, a directory.
+
+        <root>/interactions.jsonl     {"url", "status", "headers", "sha256", "latency"} or {"url", "error"}
+        <root>/bodies/ab/<sha256>.gz  response bodies, content-addressed
+
+    Errors are recorded too, so retries, Retry-After and the adaptive window
+    behave the same on replay. A URL fetched several times replays its
+    responses in recorded order, then repeats the last one. `latency` scales
+    the recorded response times on replay (0 = as fast as possible, 1 = as
+    recorded), so our own code can be timed with the network held constant.
+    """
+
+    def __init__(self, root, replay=False, latency=0.0):
+        super().__init__()
+        self.root = root
+        self.replay = replay
+        self.latency = latency
+        self.log_path = os.path.join(root, "interactions.jsonl")
+        self.tapes = {}  # url -> [interaction, ...] still to replay
+        if replay:
+            with open(self.log_path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        interaction = json.loads(line)
+                        self.tapes.setdefault(interaction["url"], []).append(interaction)
+
+    def _body_path(self, digest):
+        return os.path.join(self.root, "bodies", digest[:2], f"{digest}.gz")
+
+    def _record(self, url, started, status=None, headers=None, body=b"", error=None):
+        interaction = {"url": url, "latency": round(time.monotonic() - started, 4)}
+        if error is not None:
+            interaction["error"] = error
+        else:
+            digest = hashlib.sha256(body).hexdigest()
+            path = self._body_path(digest)
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                _write_bytes_atomic(path, gzip.compress(body, mtime=0))
+            interaction.update(status=status, headers=list(headers.items()) if headers else [], sha256=digest)
+        with self.lock:
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(interaction) + "\n")
+
+    def get(self, url, headers=None):
+        if self.replay:
+            return self._replay(url)
+        started = time.monotonic()
+        try:
+            resp = super().get(url, headers)
+        except HTTPError as e:
+            self._record(url, started, e.code, e.headers)
+            raise
+        except (HTTPException, OSError) as e:
+            self._record(url, started, error=str(e) or type(e).__name__)
+            raise
+        self._record(url, started, resp.status, resp.headers, resp.body)
+        return resp
+
+    def _replay(self, url):
+        with self.lock:
+            tape = self.tapes.get(url)
+            if not tape:
+                raise CassetteMiss(f"{url} is not in the cassette at {self.root}")
+            interaction = tape.pop(0) if len(tape) > 1 else tape[0]
+        if self.latency:
+            time.sleep(interaction["latency"] * self.latency)
+        if "error" in interaction:
+            raise OSError(interaction["error"])
+
+        headers = HTTPMessage()
+        for name, value in interaction["headers"]:
+            headers[name] = value
+        with open(self._body_path(interaction["sha256"]), "rb") as f:
+            body = gzip.decompress(f.read())
+        with self.lock:
+            self.requests += 1
+            self.bytes_wire += len(body)
+            self.bytes_decoded += len(body)
+        if interaction["status"] >= 400:
+            raise HTTPError(url, interaction["status"], responses.get(interaction["status"], ""), headers, None)
+        return Response(url, interaction["status"], headers, body)
+
+
+# ── Response Cache ──────────────────────────────────────────────────────────
+
+CachedPage = namedtuple("CachedPage", ["url", "etag", "last_modified", "body"])
+
+
+class ResponseCache:
+    """On-disk conditional-GET cache keyed by URL.
+
+    Each entry is `<sha256(url)>.body` (decoded bytes) plus a `.json` sidecar
+    holding the URL and its ETag / Last-Modified validators; the sidecar is
+    written last, so a half-written entry is never read back. The sidecar's
+    mtime doubles as the LRU clock: hits touch it, and once the bodies exceed
+    `max_bytes` the least recently used entries are evicted.
+    """
+
+    def __init__(self, directory, max_bytes=CACHE_MAX_MB * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        os.makedirs(directory, exist_ok=True)
+        self.size = sum(
+            os.path.getsize(os.path.join(directory, name))
+            for name in os.listdir(directory) if name.endswith(".body")
+        )
+        if self.size > self.max_bytes:
+            with self.lock:
+                self._evict()
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, key)
+        return base + ".json", base + ".body"
+
+    def get(self, url):
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None
+        return CachedPage(url, meta.get("etag"), meta.get("last_modified"), body)
+
+    def conditional_headers(self, cached):
+        headers = {}
+        if cached is None:
+            return headers
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+        return headers
+
+    def touch(self, cached):
+        """Record a hit: bump the entry to most-recently-used."""
+        meta_path, _ = self._paths(cached.url)
+        try:
+            os.utime(meta_path)
+        except OSError:
+            pass
+        with self.lock:
+            self.hits += 1
+
+    def put(self, url, resp):
+        """Store a 200 response for `url` if it carries a validator worth revalidating.
+
+        `url` is the URL that was requested, not `resp.url`: after a redirect
+        the two differ, and lookups are always by the requested URL.
+        """
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        with self.lock:
+            self.misses += 1
+        if not (etag or last_modified):
+            return
+        meta_path, body_path = self._paths(url)
+        old_size = os.path.getsize(body_path) if os.path.exists(body_path) else 0
+        _write_bytes_atomic(body_path, resp.body)
+        meta = {"url": url, "etag": etag, "last_modified": last_modified,
+                "stored_at": datetime.now().isoformat()}
+        _write_bytes_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        with self.lock:
+            self.size += len(resp.body) - old_size
+            if self.size > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Drop least-recently-used entries until under budget. Holds lock."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                path = os.path.join(self.directory, name)
+                try:
+                    entries.append((os.path.getmtime(path), path))
+                except OSError:
+                    continue
+        entries.sort()
+        target = self.max_bytes * 0.9  # leave headroom so we don't evict every put
+        for _, meta_path in entries:
+            if self.size <= target:
+                break
+            body_path = meta_path[:-len(".json")] + ".body"
+            try:
+                freed = os.path.getsize(body_path)
+                os.remove(meta_path)
+                os.remove(body_path)
+            except OSError:
+                continue
+            self.size -= freed
+            self.evicted += 1
+
+    def summary(self):
+        return (f"{self.hits} served from cache (304), {self.misses} downloaded, "
+                f"{self.evicted} evicted, {self.size / 1024 / 1024:.1f} MB on disk")
+
+
+CACHE = None  # ResponseCache, set up by main() unless --no-cache
+
+
+def _write_bytes_atomic(path, data, durable=False):
+    """Write via a temp file + rename so readers never see a partial file.
+
+    `durable` also fsyncs before the rename, for files a crash must not lose.
+    """
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _write_json_atomic(path, data, **dump_kwargs):
+    _write_bytes_atomic(path, json.dumps(data, **dump_kwargs).encode("utf-8"), durable=True)
+
+
+# ── Page Archive ────────────────────────────────────────────────────────────
+
+class PageArchive:
+    """Every page fetch_page handed to a parser, gzip-compressed and content-addressed.
+
+        <root>/objects/ab/<sha256>.html.gz   one file per distinct page body
+        <root>/index.jsonl                   {"url", "sha256", "fetched_at", "bytes"} per fetch
+
+    A page that has not changed since the last crawl costs an index line, not
+    another copy. After load(), lookup(url) returns the newest body fetched
+    at or before `as_of`, which is how --reparse-from rebuilds the output
+    from the exact bytes a run saw, with no network at all.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.index_path = os.path.join(root, "index.jsonl")
+        self.index = None  # url -> newest entry, once load() has run
+        self.lock = threading.Lock()
+        self.stored = 0
+        self.unchanged = 0
+
+    def _object_path(self, digest):
+        return os.path.join(self.root, "objects", digest[:2], f"{digest}.html.gz")
+
+    def store(self, url, body):
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._object_path(digest)
+        entry = {"url": url, "sha256": digest, "fetched_at": datetime.now().isoformat(timespec="seconds"),
+                 "bytes": len(body)}
+        with self.lock:
+            if os.path.exists(path):
+                self.unchanged += 1
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                _write_bytes_atomic(path, gzip.compress(body, mtime=0))
+                self.stored += 1
+            # One write per line in append mode, so processes sharing the
+            # archive (--legislatures) do not interleave entries.
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+
+    def load(self, as_of=None):
+        """Index the newest fetch of every URL at or before `as_of` (ISO timestamp prefix)."""
+        index = {}
+        with open(self.index_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # torn last line of an interrupted run
+                if as_of and entry["fetched_at"] > as_of:
+                    continue
+                if entry["url"] not in index or entry["fetched_at"] >= index[entry["url"]]["fetched_at"]:
+                    index[entry["url"]] = entry
+        self.index = index
+        return len(index)
+
+    def lookup(self, url):
+        entry = self.index.get(url)
+        if entry is None:
+            raise URLError(f"{url} is not in the archive at {self.root}")
+        with open(self._object_path(entry["sha256"]), "rb") as f:
+            return gzip.decompress(f.read())
+
+    def summary(self):
+        return f"{self.stored} new pages, {self.unchanged} unchanged → {self.root}"
+
+
+ARCHIVE = None  # PageArchive every fetched page is written to, unless --no-archive
+REPARSE = None  # PageArchive that answers fetch_page instead of the network (--reparse-from)
+
+
+# ── Metrics ─────────────────────────────────────────────────────────────────
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)  # seconds per HTTP attempt
+PARSE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5)  # seconds per page parse
+PAGES_BUCKETS = (1, 2, 3, 5, 8, 13, MAX_PAGES_PER_MP)  # listing pages fetched per MP
+
+
+def _histogram(samples, buckets):
+    """Cumulative Prometheus-style histogram plus p50/p95/p99 of `samples`."""
+    values = np.asarray(samples, dtype=float)
+    counts = np.searchsorted(np.sort(values), buckets, side="right") if values.size else [0] * len(buckets)
+    summary = {
+        "count": int(values.size),
+        "sum": round(float(values.sum()), 6),
+        "buckets": {str(b): int(c) for b, c in zip(buckets, counts)},
+    }
+    if values.size:
+        p50, p95, p99 = np.percentile(values, [50, 95, 99])
+        summary.update(p50=round(float(p50), 6), p95=round(float(p95), 6), p99=round(float(p99), 6),
+                       max=round(float(values.max()), 6))
+    return summary
+
+
+class ScrapeMetrics:
+    """Counters and timings for one legislature's run, shared by all threads.
+
+    Split so a slow run can be attributed: `throttle` is time spent waiting on
+    our own rate limiter, `latency` is the site plus the network, `parse` is
+    our HTML parsing, and `stages` is wall time per step of run_legislature.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self, legislature=LEGISLATURE_ID):
+        with self.lock:
+            self.legislature = legislature
+            self.started = time.time()
+            self.latency = []
+            self.throttle = []
+            self.status = {}
+            self.retries = 0
+            self.failures = 0
+            self.bytes_body = 0
+            self.parse = {}  # page kind -> [seconds, ...]
+            self.pages = {}  # mp id -> member listing pages fetched
+            self.stages = {}
+            self.session_base = (SESSION.requests, SESSION.bytes_wire, SESSION.bytes_decoded)
+
+    def observe_request(self, seconds, status, throttled=0.0, size=0):
+        with self.lock:
+            self.latency.append(seconds)
+            self.throttle.append(throttled)
+            self.status[str(status)] = self.status.get(str(status), 0) + 1
+            self.bytes_body += size
+
+    def observe_retry(self, final=False):
+        with self.lock:
+            if final:
+                self.failures += 1
+            else:
+                self.retries += 1
+
+    def observe_parse(self, kind, seconds):
+        with self.lock:
+            self.parse.setdefault(kind, []).append(seconds)
+
+    def observe_page(self, mp_id):
+        with self.lock:
+            self.pages[mp_id] = self.pages.get(mp_id, 0) + 1
+
+    def stage(self, name):
+        """Context manager timing one step; repeated names accumulate."""
+        metrics = self
+
+        class _Stage:
+            def __enter__(self):
+                self.started = time.monotonic()
+
+            def __exit__(self, *exc):
+                with metrics.lock:
+                    metrics.stages[name] = metrics.stages.get(name, 0.0) + time.monotonic() - self.started
+
+        return _Stage()
+
+    def snapshot(self):
+        with self.lock:
+            requests, wire, decoded = (now - base for now, base in zip(
+                (SESSION.requests, SESSION.bytes_wire, SESSION.bytes_decoded), self.session_base))
+            return {
+                "legislature_id": self.legislature,
+                "started_at": datetime.fromtimestamp(self.started).isoformat(),
+                "elapsed_seconds": round(time.time() - self.started, 3),
+                "requests": {
+                    "attempts": len(self.latency),
+                    "by_status": dict(sorted(self.status.items())),
+                    "retries": self.retries,
+                    "failures": self.failures,
+                    "network_requests": requests,
+                },
+                "bytes": {"wire": wire, "decoded": decoded, "bodies_returned": self.bytes_body},
+                "latency_seconds": _histogram(self.latency, LATENCY_BUCKETS),
+                "throttle_wait_seconds": _histogram(self.throttle, LATENCY_BUCKETS),
+                "parse_seconds": {kind: _histogram(times, PARSE_BUCKETS)
+                                  for kind, times in sorted(self.parse.items())},
+                "pages_per_mp": _histogram(list(self.pages.values()), PAGES_BUCKETS),
+                "stage_seconds": {name: round(seconds, 3) for name, seconds in self.stages.items()},
+                "adaptive": RATE_LIMITER.summary(),
+            }
+
+    def write_json(self, path, snapshot=None):
+        _write_json_atomic(path, snapshot or self.snapshot(), indent=2)
+
+    def write_prometheus(self, path, snapshot=None):
+        """Write a node_exporter textfile-collector file (atomically, as it requires)."""
+        snap = snapshot or self.snapshot()
+        leg = f'legislature="{snap["legislature_id"]}"'
+        lines = []
+
+        def metric(name, kind, help_text):
+            lines.extend([f"# HELP mp_scraper_{name} {help_text}", f"# TYPE mp_scraper_{name} {kind}"])
+
+        def histogram(name, hist, labels=leg):
+            for bound, count in hist["buckets"].items():
+                lines.append(f'mp_scraper_{name}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'mp_scraper_{name}_bucket{{{labels},le="+Inf"}} {hist["count"]}')
+            lines.append(f"mp_scraper_{name}_sum{{{labels}}} {hist['sum']}")
+            lines.append(f"mp_scraper_{name}_count{{{labels}}} {hist['count']}")
+
+        metric("requests_total", "counter", "HTTP attempts by status (error = no response).")
+        for status, count in snap["requests"]["by_status"].items():
+            lines.append(f'mp_scraper_requests_total{{{leg},status="{status}"}} {count}')
+        metric("retries_total", "counter", "HTTP attempts that were retried.")
+        lines.append(f"mp_scraper_retries_total{{{leg}}} {snap['requests']['retries']}")
+        metric("failures_total", "counter", "URLs given up on after every retry.")
+        lines.append(f"mp_scraper_failures_total{{{leg}}} {snap['requests']['failures']}")
+        metric("bytes_total", "counter", "Response body bytes, on the wire and decoded.")
+        for kind in ("wire", "decoded"):
+            lines.append(f'mp_scraper_bytes_total{{{leg},kind="{kind}"}} {snap["bytes"][kind]}')
+        metric("request_latency_seconds", "histogram", "Latency of one HTTP attempt.")
+        histogram("request_latency_seconds", snap["latency_seconds"])
+        metric("throttle_wait_seconds", "histogram", "Time waiting on the per-host rate limiter.")
+        histogram("throttle_wait_seconds", snap["throttle_wait_seconds"])
+        metric("parse_seconds", "histogram", "HTML parse time per page.")
+        for kind, hist in snap["parse_seconds"].items():
+            histogram("parse_seconds", hist, f'{leg},page="{kind}"')
+        metric("pages_per_mp", "histogram", "Attendance listing pages fetched per MP.")
+        histogram("pages_per_mp", snap["pages_per_mp"])
+        metric("stage_seconds", "gauge", "Wall time of each step of the last run.")
+        for name, seconds in snap["stage_seconds"].items():
+            lines.append(f'mp_scraper_stage_seconds{{{leg},stage="{name}"}} {seconds}')
+        metric("adaptive_window", "gauge", "Requests in flight the AIMD controller allows per host.")
+        for host, window in snap["adaptive"].items():
+            lines.append(f'mp_scraper_adaptive_window{{{leg},host="{host}"}} {window["window"]}')
+        metric("adaptive_decreases_total", "counter", "Times the AIMD window was halved.")
+        for host, window in snap["adaptive"].items():
+            lines.append(f'mp_scraper_adaptive_decreases_total{{{leg},host="{host}"}} {window["decreases"]}')
+        metric("last_run_timestamp_seconds", "gauge", "When the last run finished.")
+        lines.append(f"mp_scraper_last_run_timestamp_seconds{{{leg}}} {int(time.time())}")
+        _write_bytes_atomic(path, ("\n".join(lines) + "\n").encode("utf-8"))
+
+    def summary(self, snapshot=None):
+        snap = snapshot or self.snapshot()
+        lat = snap["latency_seconds"]
+        if not lat["count"]:
+            return "no requests"
+        statuses = ", ".join(f"{s}×{n}" for s, n in snap["requests"]["by_status"].items())
+        windows = "".join(f", {host} window {w['window']:g} (peak {w['peak_window']:g}, "
+                          f"halved {w['decreases']}×)" for host, w in snap["adaptive"].items())
+        return (f"{lat['count']} attempts ({statuses}), {snap['requests']['retries']} retries, "
+                f"latency p50 {lat['p50'] * 1000:.0f} ms / p95 {lat['p95'] * 1000:.0f} ms / "
+                f"p99 {lat['p99'] * 1000:.0f} ms{windows}")
+
+
+METRICS = ScrapeMetrics()
+
+
+def parse_html(parser, html, kind):
+    """Feed `html` to `parser`, timing it under `kind` in METRICS. Returns the parser."""
+    started = time.monotonic()
+    parser.feed(html)
+    METRICS.observe_parse(kind, time.monotonic() - started)
+    return parser
+
+
 # ── HTTP Helpers ────────────────────────────────────────────────────────────
 
-def fetch_page(url, retries=3):
-    """Fetch a URL with retries and polite delays."""
+def classify_error(exc):
+    """How fetch_page should treat a failed request.
+
+    permanent  4xx other than 408/425/429 — retrying cannot help, fail fast
+    congested  429, 5xx or a timeout — back off and shrink the window
+    transient  anything else (reset connection, 408, ...) — retry as is
+    """
+    if isinstance(exc, HTTPError):
+        if exc.code == 429 or exc.code >= 500:
+            return "congested"
+        if 400 <= exc.code < 500 and exc.code not in (408, 425):
+            return "permanent"
+        return "transient"
+    if isinstance(exc, TimeoutError) or "timed out" in str(exc):
+        return "congested"
+    return "transient"
+
+
+def retry_after_seconds(exc):
+    """Seconds asked for by a Retry-After header (delta or HTTP date), clamped, or None."""
+    value = exc.headers.get("Retry-After") if isinstance(exc, HTTPError) and exc.headers else None
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+def fetch_page(url, retries=5):
+    """Fetch a URL with retries and polite delays.
+
+    Every attempt first goes through the per-host limiter, so the load on
+    parliament.lk stays bounded however many workers are calling this, and
+    reports back so the adaptive window can grow or shrink. Failures are
+    classified: permanent ones raise at once, the rest are retried after a
+    jittered exponential backoff, or after Retry-After when the site sends
+    one. When the response cache is on, the request is made conditional and
+    a 304 is answered from disk. Whatever is returned is also written to the
+    page archive; under --reparse-from the archive answers instead.
+    """
+    if REPARSE:
+        body = REPARSE.lookup(url)
+        METRICS.observe_request(0.0, "archive", size=len(body))
+        return body.decode("utf-8", errors="replace")
+
+    cached = CACHE.get(url) if CACHE else None
     for attempt in range(retries):
+        waited = time.monotonic()
+        RATE_LIMITER.acquire(url)
+        started = time.monotonic()
+        resp = error = None
         try:
-            req = Request(url, headers=HEADERS)
-            with urlopen(req, timeout=30) as resp:
-                return resp.read().decode("utf-8", errors="replace")
-        except (URLError, HTTPError) as e:
-            print(f"  ⚠ Attempt {attempt+1} failed for {url}: {e}")
-            if attempt < retries - 1:
-                time.sleep(2 ** attempt)
+            headers = CACHE.conditional_headers(cached) if CACHE else None
+            resp = SESSION.get(url, headers)
+        except (URLError, HTTPError, HTTPException, OSError) as e:
+            error = e
+        finally:
+            # Give the slot back whatever happened, including errors handled
+            # further up (a CassetteMiss, a corrupt gzip body): a leaked slot
+            # shrinks the window for good, and enough of them hang the run.
+            if resp is not None:
+                latency = time.monotonic() - started
+                RATE_LIMITER.release(url, latency=latency)
+            elif error is not None:
+                kind = classify_error(error)
+                retry_after = retry_after_seconds(error)
+                RATE_LIMITER.release(url, congested=kind == "congested", retry_after=retry_after)
             else:
-                raise
+                RATE_LIMITER.release(url)
+
+        if error is not None:
+            METRICS.observe_request(time.monotonic() - started, getattr(error, "code", None) or "error",
+                                    started - waited)
+            print(f"  ⚠ Attempt {attempt+1} failed for {url}: {error} ({kind})")
+            if kind == "permanent" or attempt == retries - 1:
+                METRICS.observe_retry(final=True)
+                raise error
+            METRICS.observe_retry()
+            # With Retry-After the limiter holds the host until then; the
+            # jitter spreads out the workers that all resume at that moment.
+            time.sleep(random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt)))
+            continue
+
+        METRICS.observe_request(latency, resp.status, started - waited, len(resp.body))
+        if resp.status == 304 and cached is not None:
+            CACHE.touch(cached)
+            body = cached.body
+        else:
+            if CACHE:
+                CACHE.put(url, resp)
+            body = resp.body
+        if ARCHIVE:
+            ARCHIVE.store(url, body)
+        return body.decode("utf-8", errors="replace")
     return ""
 
 
+# ── Daily Records ───────────────────────────────────────────────────────────
+
+SITTING_DATE_FORMATS = ("%Y-%m-%d", "%d-%m-%Y", "%d/%m/%Y", "%d.%m.%Y",
+                        "%d %B %Y", "%d %b %Y", "%B %d, %Y", "%b %d, %Y")
+
+
+def sitting_date(value):
+    """Normalise a sitting date as shown on parliament.lk to ISO, or None."""
+    value = (value or "").strip()
+    for fmt in SITTING_DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+def merge_records(previous, fresh):
+    """Merge newly scraped rows into an MP's previous daily records.
+
+    Rows are keyed by sitting date, a fresh row replacing a previous one for
+    the same day. The result is newest-first, like the site's own listing;
+    rows whose date can't be parsed are kept at the end in their old order.
+    """
+    by_date = {}
+    undated = []
+    for r in list(previous) + list(fresh):
+        key = sitting_date(r.get("date"))
+        if key is None:
+            if r not in undated:
+                undated.append(r)
+        else:
+            by_date[key] = r
+    return [by_date[k] for k in sorted(by_date, reverse=True)] + undated
+
+
+def load_checkpoints(path):
+    """Load previous daily records as {mp_id: (newest_sitting, records)}."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    checkpoints = {}
+    for mp_id, records in previous.get("members", {}).items():
+        dates = [d for d in (sitting_date(r.get("date")) for r in records) if d]
+        checkpoints[mp_id] = (max(dates) if dates else None, records)
+    return checkpoints
+
+
+# ── Attendance Matrix ───────────────────────────────────────────────────────
+
+# 2-bit status codes. UNKNOWN means no row for that MP on that sitting
+# (not yet sworn in, or missing from the site); OTHER is any status that
+# isn't Present/Absent.
+STATUS_UNKNOWN, STATUS_PRESENT, STATUS_ABSENT, STATUS_OTHER = 0, 1, 2, 3
+STATUS_CODES = {"Present": STATUS_PRESENT, "Absent": STATUS_ABSENT}
+CODE_NAMES = ["unknown", "present", "absent", "other"]
+
+
+def pack_codes(codes):
+    """Pack 2-bit codes four to a byte; sitting i sits in bits 2*(i%4) of byte i//4."""
+    packed = bytearray((len(codes) + 3) // 4)
+    for i, code in enumerate(codes):
+        packed[i >> 2] |= code << ((i & 3) * 2)
+    return bytes(packed)
+
+
+def unpack_codes(packed, count):
+    return [(packed[i >> 2] >> ((i & 3) * 2)) & 3 for i in range(count)]
+
+
+def attendance_matrix(mps, attendance):
+    """Build the MP × sitting code matrix.
+
+    Returns (dates, rows): `dates` is the sorted list of every sitting date
+    any MP has a record for, and `rows[mp_id][i]` is that MP's code on
+    dates[i]. Dates are ISO where sitting_date can parse them; any other is
+    kept under its raw string, as the SQLite store does, so no sitting is
+    dropped from the counts.
+    """
+    per_mp = {}
+    all_dates = set()
+    for mp in mps:
+        statuses = {}
+        for r in attendance.get(mp["id"], {}).get("records", []):
+            date = sitting_date(r["date"]) or r["date"]
+            statuses[date] = STATUS_CODES.get(r["status"], STATUS_OTHER)
+        per_mp[mp["id"]] = statuses
+        all_dates.update(statuses)
+
+    dates = sorted(all_dates)
+    rows = {mp_id: [statuses.get(d, STATUS_UNKNOWN) for d in dates] for mp_id, statuses in per_mp.items()}
+    return dates, rows
+
+
+def encode_attendance_matrix(mps, attendance, metadata):
+    """Full per-day history as one compact document.
+
+    Each MP's row is a base64 string of packed 2-bit codes, so the whole
+    legislature costs about MPs × sittings / 4 bytes. A client finds any
+    MP/date in O(1): i = dates.indexOf(date), then byte i >> 2, shift (i & 3) * 2.
+    """
+    dates, rows = attendance_matrix(mps, attendance)
+    return {
+        "metadata": {
+            **metadata,
+            "encoding": "base64 of 2-bit codes, 4 sittings per byte, "
+                        "sitting i at bits 2*(i%4) of byte i//4",
+        },
+        "codes": CODE_NAMES,
+        "dates": dates,
+        "members": {
+            mp_id: base64.b64encode(pack_codes(codes)).decode("ascii")
+            for mp_id, codes in rows.items()
+        },
+    }
+
+
+def decode_attendance_matrix(doc):
+    """Inverse of encode_attendance_matrix: {mp_id: {date: code}} without UNKNOWN cells."""
+    dates = doc["dates"]
+    decoded = {}
+    for mp_id, encoded in doc["members"].items():
+        codes = unpack_codes(base64.b64decode(encoded), len(dates))
+        decoded[mp_id] = {d: c for d, c in zip(dates, codes) if c != STATUS_UNKNOWN}
+    return decoded
+
+
+# ── SQLite Store ────────────────────────────────────────────────────────────
+
+STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mps (
+    legislature_id TEXT NOT NULL,
+    mp_id          TEXT NOT NULL,
+    name           TEXT NOT NULL,
+    party          TEXT,
+    district       TEXT,
+    updated_at     TEXT,
+    PRIMARY KEY (legislature_id, mp_id)
+);
+CREATE INDEX IF NOT EXISTS idx_mps_party ON mps (party);
+CREATE INDEX IF NOT EXISTS idx_mps_district ON mps (district);
+
+CREATE TABLE IF NOT EXISTS sittings (
+    legislature_id TEXT NOT NULL,
+    date           TEXT NOT NULL,  -- ISO date where parseable, else as shown
+    PRIMARY KEY (legislature_id, date)
+);
+
+CREATE TABLE IF NOT EXISTS attendance (
+    legislature_id TEXT NOT NULL,
+    mp_id          TEXT NOT NULL,
+    date           TEXT NOT NULL,
+    status         TEXT NOT NULL,
+    raw_date       TEXT NOT NULL,  -- the date string as parliament.lk printed it
+    PRIMARY KEY (legislature_id, mp_id, date)
+);
+CREATE INDEX IF NOT EXISTS idx_attendance_date ON attendance (legislature_id, date);
+CREATE INDEX IF NOT EXISTS idx_attendance_status ON attendance (status, date);
+
+CREATE VIEW IF NOT EXISTS mp_summary AS
+    SELECT m.legislature_id, m.mp_id, m.name, m.party, m.district,
+           COALESCE(SUM(a.status = 'Present'), 0) AS present,
+           COALESCE(SUM(a.status = 'Absent'), 0)  AS absent
+    FROM mps m
+    LEFT JOIN attendance a ON a.legislature_id = m.legislature_id AND a.mp_id = m.mp_id
+    GROUP BY m.legislature_id, m.mp_id;
+
+CREATE VIEW IF NOT EXISTS party_summary AS
+    SELECT legislature_id, COALESCE(NULLIF(party, ''), 'Unknown') AS party,
+           SUM(present) AS present, SUM(absent) AS absent, COUNT(*) AS members
+    FROM mp_summary GROUP BY legislature_id, 2;
+
+CREATE VIEW IF NOT EXISTS district_summary AS
+    SELECT legislature_id, COALESCE(NULLIF(district, ''), 'Unknown') AS district,
+           SUM(present) AS present, SUM(absent) AS absent, COUNT(*) AS members
+    FROM mp_summary GROUP BY legislature_id, 2;
+
+CREATE VIEW IF NOT EXISTS sitting_summary AS
+    SELECT legislature_id, date,
+           SUM(status = 'Present') AS present, SUM(status = 'Absent') AS absent
+    FROM attendance GROUP BY legislature_id, date;
+"""
+
+
+class AttendanceStore:
+    """Local SQLite copy of everything scraped, across legislatures.
+
+    Scrapes are upserted, so re-running a refresh is idempotent, and the
+    dashboard's per-MP, per-party, per-district and per-sitting figures are
+    read back out of the summary views. Each legislature holds only the
+    current directory of MPs, and after a full scrape only the rows that
+    scrape returned, so the views agree with a --no-db run. Analysts can
+    query the same file directly, e.g.:
+
+        SELECT m.name, a.date FROM attendance a JOIN mps m USING (legislature_id, mp_id)
+        WHERE a.status = 'Absent' AND a.date BETWEEN '2025-11-07' AND '2025-12-05';
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # WAL + a generous busy timeout let --legislatures workers share one file.
+        self.conn = sqlite3.connect(path, timeout=60)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(STORE_SCHEMA)
+
+    def upsert(self, legislature, mps, attendance, prune=False):
+        """Insert or update the directory and every scraped attendance row.
+
+        MPs no longer in the directory are deleted along with their rows,
+        since the directory is always scraped in full. With `prune` (a full,
+        non-incremental scrape) so is every attendance row and sitting the
+        scrape did not return — a sitting the site dropped, or a row an
+        earlier parse filed under the wrong date. Returns (upserted, deleted)
+        attendance row counts.
+        """
+        now = datetime.now().isoformat()
+        rows = [
+            (legislature, mp_id, sitting_date(r["date"]) or r["date"], r["status"], r["date"])
+            for mp_id, att in attendance.items() for r in att.get("records", [])
+        ]
+        deleted = 0
+        with self.conn:
+            self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS scraped (mp_id TEXT NOT NULL, date TEXT NOT NULL, "
+                              "PRIMARY KEY (mp_id, date))")
+            self.conn.execute("DELETE FROM scraped")
+            self.conn.executemany("INSERT OR IGNORE INTO scraped (mp_id, date) VALUES (?, '')",
+                                  [(mp["id"],) for mp in mps])
+            deleted += self.conn.execute(
+                "DELETE FROM attendance WHERE legislature_id = ? AND mp_id NOT IN "
+                "(SELECT mp_id FROM scraped)", (legislature,)).rowcount
+            self.conn.execute("DELETE FROM mps WHERE legislature_id = ? AND mp_id NOT IN "
+                              "(SELECT mp_id FROM scraped)", (legislature,))
+            if prune:
+                self.conn.execute("DELETE FROM scraped")
+                self.conn.executemany("INSERT OR IGNORE INTO scraped (mp_id, date) VALUES (?, ?)",
+                                      [(row[1], row[2]) for row in rows])
+                deleted += self.conn.execute(
+                    "DELETE FROM attendance WHERE legislature_id = ? AND NOT EXISTS "
+                    "(SELECT 1 FROM scraped s WHERE s.mp_id = attendance.mp_id AND s.date = attendance.date)",
+                    (legislature,)).rowcount
+                self.conn.execute(
+                    "DELETE FROM sittings WHERE legislature_id = ? AND date NOT IN "
+                    "(SELECT date FROM scraped)", (legislature,))
+            self.conn.executemany(
+                """INSERT INTO mps (legislature_id, mp_id, name, party, district, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?)
+                   ON CONFLICT (legislature_id, mp_id) DO UPDATE SET
+                       name = excluded.name, party = excluded.party,
+                       district = excluded.district, updated_at = excluded.updated_at""",
+                [(legislature, mp["id"], mp["name"], mp["party"], mp["district"], now) for mp in mps],
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO sittings (legislature_id, date) VALUES (?, ?)",
+                sorted({(legislature, row[2]) for row in rows}),
+            )
+            self.conn.executemany(
+                """INSERT INTO attendance (legislature_id, mp_id, date, status, raw_date)
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT (legislature_id, mp_id, date) DO UPDATE SET
+                       status = excluded.status, raw_date = excluded.raw_date""",
+                rows,
+            )
+        return len(rows), deleted
+
+    def load_attendance(self, legislature, mps):
+        """Rebuild scrape_all_attendance's {mp_id: summary} shape from the store.
+
+        Counts come from the mp_summary view; daily records are newest-first.
+        """
+        records = {mp["id"]: [] for mp in mps}
+        for mp_id, raw_date, status in self.conn.execute(
+            "SELECT mp_id, raw_date, status FROM attendance WHERE legislature_id = ? "
+            "ORDER BY mp_id, date DESC", (legislature,)
+        ):
+            if mp_id in records:
+                records[mp_id].append({"date": raw_date, "status": status})
+
+        attendance = {}
+        for mp_id, present, absent in self.conn.execute(
+            "SELECT mp_id, present, absent FROM mp_summary WHERE legislature_id = ?", (legislature,)
+        ):
+            if mp_id not in records:
+                continue
+            total = present + absent
+            attendance[mp_id] = {
+                "total_sittings": total,
+                "present": present,
+                "absent": absent,
+                "absentee_rate": round((absent / total * 100), 1) if total > 0 else 0,
+                "records": records[mp_id],
+            }
+        return attendance
+
+    def group_totals(self, legislature, view):
+        """Per-group totals from party_summary or district_summary, shaped like _grouped_totals."""
+        column = {"party_summary": "party", "district_summary": "district"}[view]
+        totals = {}
+        for group, present, absent, members in self.conn.execute(
+            f"SELECT {column}, present, absent, members FROM {view} WHERE legislature_id = ?", (legislature,)
+        ):
+            total = present + absent
+            totals[group] = {
+                "present": present,
+                "absent": absent,
+                "members": members,
+                "absentee_rate": round(absent / total * 100, 1) if total > 0 else 0,
+            }
+        return totals
+
+    def sitting_totals(self, legislature):
+        """{date: (present, absent)} from the sitting_summary view."""
+        return {date: (present, absent) for date, present, absent in self.conn.execute(
+            "SELECT date, present, absent FROM sitting_summary WHERE legislature_id = ?", (legislature,)
+        )}
+
+    def close(self):
+        self.conn.close()
+
+
+# ── Run Journal ─────────────────────────────────────────────────────────────
+
+class AttendanceJournal:
+    """Append-only JSONL log of finished MPs, so a crashed run can resume.
+
+    The first line names the legislature; every later line is one MP's full
+    daily records, flushed and fsynced as soon as that MP completes.
+    """
+
+    def __init__(self, path, legislature=LEGISLATURE_ID, resume=False):
+        self.path = path
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.completed = self.load(path, legislature) if resume else {}
+        self.file = open(path, "a" if self.completed else "w", encoding="utf-8")
+        if not self.completed:
+            self._write({"legislature_id": legislature, "started_at": datetime.now().isoformat()})
+
+    @staticmethod
+    def load(path, legislature):
+        """Return {mp_id: records} from a journal, or {} if it doesn't match.
+
+        A run killed mid-write leaves a truncated last line; it is skipped
+        and that MP is simply scraped again.
+        """
+        completed = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return completed
+        for i, line in enumerate(lines):
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if i == 0:
+                if entry.get("legislature_id") != legislature:
+                    return {}
+                continue
+            completed[entry["mp_id"]] = entry["records"]
+        return completed
+
+    def _write(self, entry):
+        with self.lock:
+            self.file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self.file.flush()
+            os.fsync(self.file.fileno())
+
+    def record(self, mp_id, records):
+        self._write({"mp_id": mp_id, "records": records})
+
+    def finish(self):
+        """Close and delete the journal once the final output is safely written."""
+        self.file.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
 # ── Scraper Functions ───────────────────────────────────────────────────────
 
-def scrape_mp_directory():
-    """Scrape all MPs from the directory (paginated, 32 per page)."""
+def scrape_mp_directory(concurrency=1, legislature=LEGISLATURE_ID):
+    """Scrape all MPs from the directory (paginated, 32 per page).
+
+    Page 1's pagination links give the last page; with `concurrency` > 1 the
+    remaining pages are then fetched in parallel. Every page's links can
+    extend that (pagers that only show a window of pages). If the page shows
+    no pagination, fall back to probing page by page until one adds no MPs.
+    """
     print("\n📋 Scraping MP directory...")
     all_mps = []
     seen_ids = set()
 
-    for page in range(1, 10):  # Max 10 pages
-        url = f"{DIRECTORY_URL}?itemCount=32&page={page}"
-        print(f"  Page {page}...", end=" ")
-
-        html = fetch_page(url)
+    def parse(page):
         parser = MPDirectoryParser()
-        parser.feed(html)
+        url = f"{DIRECTORY_URL}?itemCount=32&page={page}"
+        if legislature != LEGISLATURE_ID:
+            # The listing defaults to the sitting Parliament; earlier ones
+            # have to be asked for by id.
+            url += f"&legislature={legislature}"
+        return parse_html(parser, fetch_page(url), "directory")
 
+    def collect(page, parser):
         new_count = 0
         for mp in parser.mps:
             if mp["id"] not in seen_ids:
                 seen_ids.add(mp["id"])
                 all_mps.append(mp)
                 new_count += 1
+        print(f"  Page {page}... {new_count} new MPs")
+        return new_count
+
+    first = parse(1)
+    last = min(first.page_count, MAX_DIRECTORY_PAGES) if first.paginated else MAX_DIRECTORY_PAGES
+
+    if first.paginated and concurrency > 1 and last > 1:
+        # A windowed pager ("1 2 3 Next") only links a few pages ahead, so
+        # each round of pages can reveal more; keep going until none do.
+        parsers = [first]
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            while len(parsers) < last:
+                parsers.extend(pool.map(parse, range(len(parsers) + 1, last + 1)))
+                last = min(max(p.page_count for p in parsers), MAX_DIRECTORY_PAGES)
+        for page, parser in enumerate(parsers, 1):
+            collect(page, parser)
+    else:
+        parser = first
+        page = 1
+        while page <= last:
+            if page > 1:
+                polite_delay(REQUEST_DELAY)
+                parser = parse(page)
+            if collect(page, parser) == 0:
+                break
+            if parser.paginated:
+                last = min(max(last, parser.page_count), MAX_DIRECTORY_PAGES)
+            page += 1
 
-        print(f"{new_count} new MPs")
+    print(f"  ✅ Total: {len(all_mps)} MPs")
+    return all_mps
 
-        if new_count == 0:
-            break
 
-        time.sleep(REQUEST_DELAY)
+def member_attendance_url(mp_id, legislature, page):
+    return f"{BASE_URL}/en/members-of-parliament/house-attendance/{mp_id}?legislature={legislature}&page={page}"
 
-    print(f"  ✅ Total: {len(all_mps)} MPs")
-    return all_mps
 
+def scrape_attendance_for_mp(mp_id, mp_name, legislature=LEGISLATURE_ID, delay=REQUEST_DELAY * 0.5,
+                             since=None, page_concurrency=1):
+    """Scrape all attendance records for a single MP.
 
-def scrape_attendance_for_mp(mp_id, mp_name, legislature=LEGISLATURE_ID):
-    """Scrape all attendance records for a single MP."""
-    all_records = []
+    `delay` is the pause between pages on the sequential path; concurrent
+    callers pass 0 and leave pacing to RATE_LIMITER. With `since` (an ISO
+    sitting date), only rows newer than it are returned, and paging stops at
+    the first page that reaches it — the listing is newest-first.
 
-    for page in range(1, 20):  # Max 20 pages per MP
-        url = f"{BASE_URL}/en/members-of-parliament/house-attendance/{mp_id}?legislature={legislature}&page={page}"
+    Pagination links say how many pages there are, so no request is made
+    past the end; every fetched page's links can extend the count, since a
+    windowed pager only links a few pages ahead. On a full scrape with
+    `page_concurrency` > 1 the remaining pages are fetched in parallel.
+    """
+    all_records = []
 
+    def parse(page):
         try:
-            html = fetch_page(url)
+            html = fetch_page(member_attendance_url(mp_id, legislature, page))
+        except CassetteMiss:
+            raise  # a replay that diverged from its recording; never truncate silently
         except Exception:
+            return None
+        METRICS.observe_page(mp_id)
+        return parse_html(MemberAttendanceParser(), html, "member")
+
+    def take(parser):
+        """Keep one page's rows; False once paging should stop."""
+        if parser is None or not parser.records:
+            return False
+        if since is None:
+            all_records.extend(parser.records)
+            return True
+        newer = [r for r in parser.records if (sitting_date(r["date"]) or "9999") > since]
+        all_records.extend(newer)
+        return len(newer) == len(parser.records)
+
+    first = parse(1)
+    if not take(first):
+        return all_records
+
+    last = min(first.page_count, MAX_PAGES_PER_MP) if first.paginated else MAX_PAGES_PER_MP
+
+    if first.paginated and since is None and page_concurrency > 1 and last > 1:
+        fetched = 1
+        with ThreadPoolExecutor(max_workers=page_concurrency) as pool:
+            while fetched < last:
+                batch = list(pool.map(parse, range(fetched + 1, last + 1)))
+                for parser in batch:
+                    if not take(parser):
+                        return all_records
+                fetched = last
+                last = min(max([last] + [p.page_count for p in batch]), MAX_PAGES_PER_MP)
+        return all_records
+
+    page = 2
+    while page <= last:
+        if delay:
+            polite_delay(delay)
+        parser = parse(page)
+        if not take(parser):
             break
+        if parser.paginated:
+            last = min(max(last, parser.page_count), MAX_PAGES_PER_MP)
+        page += 1
+
+    return all_records
+
+
+def summarise_attendance(records):
+    """Reduce one MP's daily records to the per-MP summary block."""
+    present = sum(1 for r in records if r["status"] == "Present")
+    absent = sum(1 for r in records if r["status"] == "Absent")
+    total_sittings = present + absent
+    absentee_rate = round((absent / total_sittings * 100), 1) if total_sittings > 0 else 0
+
+    return {
+        "total_sittings": total_sittings,
+        "present": present,
+        "absent": absent,
+        "absentee_rate": absentee_rate,
+        "records": records  # Full day-by-day breakdown
+    }
 
-        parser = MemberAttendanceParser()
-        parser.feed(html)
 
-        if not parser.records:
+def scrape_house_attendance(legislature=LEGISLATURE_ID, since=None):
+    """Scrape the house-attendance listing — every MP's status per sitting.
+
+    Each page holds a few sittings (one accordion + table per date), so the
+    whole legislature costs a page per handful of sittings instead of a page
+    per MP. With `since`, rows on or before that ISO date are dropped and
+    paging stops once the listing reaches it.
+    """
+    print("\n📅 Scraping house attendance by sitting date...")
+    rows = []
+    seen_dates = set()
+
+    last = None  # unknown until a page shows pagination links
+    for page in range(1, MAX_HOUSE_ATTENDANCE_PAGES + 1):
+        if last is not None and page > last:
             break
+        url = f"{ATTENDANCE_URL}?legislature={legislature}&page={page}"
+        print(f"  Page {page}...", end=" ")
 
-        all_records.extend(parser.records)
-        time.sleep(REQUEST_DELAY * 0.5)
+        parser = parse_html(AttendancePageParser(), fetch_page(url), "house")
 
-    return all_records
+        if parser.paginated:
+            # Taken from every page, not just the first: a windowed pager
+            # only links a few pages ahead of the current one.
+            last = max(last or 0, parser.page_count)
+        new_dates = [d for d in parser.dates if d not in seen_dates]
+        print(f"{len(new_dates)} sittings, {len(parser.records)} rows")
+        if not new_dates:
+            break
+        seen_dates.update(new_dates)
+
+        if since is None:
+            rows.extend(parser.records)
+        else:
+            newer = [r for r in parser.records if (sitting_date(r["date"]) or "9999") > since]
+            rows.extend(newer)
+            if len(newer) < len(parser.records):
+                break
+
+        polite_delay(REQUEST_DELAY)
+
+    print(f"  ✅ Total: {len(seen_dates)} sittings, {len(rows)} rows")
+    return rows
+
+
+def join_attendance_rows(mps, rows):
+    """Attach name-keyed house-attendance rows to directory MP ids.
+
+    Each distinct display name is resolved once through MPNameMatcher, so
+    hundreds of sittings cost one lookup per name, not per row. Returns
+    ({mp_id: [{date, status}, ...]}, [human-readable unmatched-name notes]).
+    """
+    matcher = MPNameMatcher(mps)
+    mapping, unresolved, ambiguous = matcher.resolve_all(row["name"] for row in rows)
+    joined = {mp["id"]: [] for mp in mps}
+    for row in rows:
+        mp_id = mapping.get(row["name"])
+        if mp_id is not None:
+            joined[mp_id].append({"date": row["date"], "status": row["status"]})
+    return joined, [matcher.describe(r) for r in ambiguous + unresolved]
+
+
+def attendance_by_date(mps, legislature=LEGISLATURE_ID, checkpoints=None, journal=None, skip=()):
+    """Date-major equivalent of scrape_all_attendance, same return shape.
+
+    On an incremental run the listing is paged back to the oldest of the
+    MPs' checkpoints, so nobody misses a sitting; merge_records drops the
+    overlap. `mps` must be the whole directory, since every name in the
+    listing is resolved against it; MP ids in `skip` (already finished in a
+    resumed journal) are matched but neither journalled nor returned.
+    """
+    checkpoints = checkpoints or {}
+    known = [since for since, _ in checkpoints.values() if since]
+    rows = scrape_house_attendance(legislature, since=min(known) if known else None)
+    joined, unresolved = join_attendance_rows(mps, rows)
+    if unresolved:
+        print(f"  ⚠ {len(unresolved)} names not matched to the directory:")
+        for note in unresolved[:10]:
+            print(f"     {note}")
+        if len(unresolved) > 10:
+            print(f"     … and {len(unresolved) - 10} more")
+
+    results = {}
+    for mp in mps:
+        if mp["id"] in skip:
+            continue
+        _, previous = checkpoints.get(mp["id"], (None, []))
+        records = merge_records(previous, joined[mp["id"]])
+        if journal:
+            journal.record(mp["id"], records)
+        results[mp["id"]] = summarise_attendance(records)
+    return results
 
 
-def scrape_all_attendance(mps):
-    """Scrape attendance for all MPs — the main heavy-lifting function."""
+def cross_check_attendance(mps, by_mp, by_date):
+    """Diff MP-major and date-major results sitting by sitting.
+
+    Returns a list of {mp_id, name, date, by_mp, by_date} mismatches, where a
+    None status means that side has no row for the sitting.
+    """
+    mismatches = []
+    for mp in mps:
+        sides = []
+        for results in (by_mp, by_date):
+            records = results.get(mp["id"], {}).get("records", [])
+            sides.append({sitting_date(r["date"]) or r["date"]: r["status"] for r in records})
+        mp_major, date_major = sides
+        for date in sorted(set(mp_major) | set(date_major)):
+            if mp_major.get(date) != date_major.get(date):
+                mismatches.append({
+                    "mp_id": mp["id"],
+                    "name": mp["name"],
+                    "date": date,
+                    "by_mp": mp_major.get(date),
+                    "by_date": date_major.get(date),
+                })
+    return mismatches
+
+
+def scrape_all_attendance(mps, concurrency=1, checkpoints=None, journal=None,
+                          page_concurrency=DEFAULT_PAGE_CONCURRENCY, legislature=LEGISLATURE_ID):
+    """Scrape attendance for all MPs — the main heavy-lifting function.
+
+    With `concurrency` > 1, MPs are scraped on a bounded thread pool and
+    request pacing is left entirely to the per-host RATE_LIMITER, and each
+    MP's pages fan out over up to `page_concurrency` more requests.
+    `checkpoints` ({mp_id: (newest_sitting, records)}, from load_checkpoints)
+    switches to an incremental refresh: each MP is only paged back to its
+    newest known sitting and the new rows are merged into the old ones.
+    Each finished MP is appended to `journal` (an AttendanceJournal) if given.
+    """
+    checkpoints = checkpoints or {}
+
+    def scrape(mp, delay):
+        since, previous = checkpoints.get(mp["id"], (None, []))
+        records = scrape_attendance_for_mp(mp["id"], mp["name"], legislature, delay=delay, since=since,
+                                           page_concurrency=1 if delay else page_concurrency)
+        if since:
+            records = merge_records(previous, records)
+        if journal:
+            journal.record(mp["id"], records)
+        return records
+
     print(f"\n📊 Scraping attendance for {len(mps)} MPs...")
-    print("   (This may take 15-20 minutes. Be patient.)\n")
+    if concurrency <= 1:
+        print("   (This may take 15-20 minutes. Be patient.)\n")
+    else:
+        print(f"   ({concurrency} MPs in flight, ≤{RATE_LIMITER.rate:g} req/s per host)\n")
 
     results = {}
     total = len(mps)
 
-    for i, mp in enumerate(mps):
-        mp_id = mp["id"]
-        mp_name = mp["name"]
-        progress = f"[{i+1}/{total}]"
-        print(f"  {progress} {mp_name}...", end=" ", flush=True)
-
-        records = scrape_attendance_for_mp(mp_id, mp_name)
-
-        present = sum(1 for r in records if r["status"] == "Present")
-        absent = sum(1 for r in records if r["status"] == "Absent")
-        total_sittings = present + absent
-        absentee_rate = round((absent / total_sittings * 100), 1) if total_sittings > 0 else 0
-
-        results[mp_id] = {
-            "total_sittings": total_sittings,
-            "present": present,
-            "absent": absent,
-            "absentee_rate": absentee_rate,
-            "records": records  # Full day-by-day breakdown
+    if concurrency <= 1:
+        for i, mp in enumerate(mps):
+            mp_id = mp["id"]
+            mp_name = mp["name"]
+            progress = f"[{i+1}/{total}]"
+            print(f"  {progress} {mp_name}...", end=" ", flush=True)
+
+            summary = summarise_attendance(scrape(mp, REQUEST_DELAY * 0.5))
+            results[mp_id] = summary
+
+            print(f"✓ {summary['present']}/{summary['total_sittings']} present "
+                  f"({summary['absentee_rate']}% absent)")
+            polite_delay(REQUEST_DELAY)
+        return results
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {
+            pool.submit(scrape, mp, 0): mp
+            for mp in mps
         }
+        for done, future in enumerate(as_completed(futures), 1):
+            mp = futures[future]
+            summary = summarise_attendance(future.result())
+            results[mp["id"]] = summary
+            print(f"  [{done}/{total}] {mp['name']}... ✓ {summary['present']}/"
+                  f"{summary['total_sittings']} present ({summary['absentee_rate']}% absent)",
+                  flush=True)
+
+    return results
+
 
-        print(f"✓ {present}/{total_sittings} present ({absentee_rate}% absent)")
-        time.sleep(REQUEST_DELAY)
+# ── Staged Pipeline ─────────────────────────────────────────────────────────
+
+def parse_member_page(html):
+    """Parser-stage worker: (records, page_count, paginated) for one page.
+
+    Runs in a separate process, so it returns plain data rather than the
+    parser object.
+    """
+    parser = MemberAttendanceParser()
+    parser.feed(html)
+    return parser.records, parser.page_count, parser.paginated
+
+
+def _timed_parse(html):
+    started = time.monotonic()
+    result = parse_member_page(html)
+    return time.monotonic() - started, result
+
+
+class StageStats:
+    """Item count, busy time and input-queue depth for one pipeline stage."""
+
+    def __init__(self, name, workers=1, queue=None):
+        self.name = name
+        self.workers = workers
+        self.queue = queue
+        self.items = 0
+        self.busy = 0.0
+        self.depth_total = 0
+        self.depth_samples = 0
+        self.depth_max = 0
+        self.lock = threading.Lock()
+
+    def record(self, seconds):
+        with self.lock:
+            self.items += 1
+            self.busy += seconds
+
+    def sample(self):
+        if self.queue is None:
+            return
+        depth = self.queue.qsize()
+        with self.lock:
+            self.depth_total += depth
+            self.depth_samples += 1
+            self.depth_max = max(self.depth_max, depth)
+
+    def report(self, elapsed):
+        rate = self.items / elapsed if elapsed else 0
+        utilisation = self.busy / (elapsed * self.workers) * 100 if elapsed else 0
+        line = (f"{self.name:<10} {self.items:>6} items {rate:7.1f}/s  "
+                f"{utilisation:5.1f}% busy ({self.workers} worker{'s' if self.workers != 1 else ''})")
+        if self.queue is not None:
+            mean = self.depth_total / self.depth_samples if self.depth_samples else 0
+            line += f"  queue avg {mean:.1f} max {self.depth_max}"
+        return line
+
+
+class _MPPages:
+    """Aggregator-side state for one MP: which pages are out and what came back."""
+
+    def __init__(self, mp, since, previous):
+        self.mp = mp
+        self.since = since
+        self.previous = previous
+        self.pages = {}
+        self.pending = {1}
+        self.last = MAX_PAGES_PER_MP
+        self.parallel = False
+
+    def continues(self, parsed):
+        """Whether paging should go on after this page (see scrape_attendance_for_mp)."""
+        if parsed is None or not parsed[0]:
+            return False
+        if self.since is None:
+            return True
+        return all((sitting_date(r["date"]) or "9999") > self.since for r in parsed[0])
+
+    def records(self):
+        rows = []
+        for page in sorted(self.pages):
+            parsed = self.pages[page]
+            if parsed is None or not parsed[0]:
+                break
+            if self.since is None:
+                rows.extend(parsed[0])
+                continue
+            newer = [r for r in parsed[0] if (sitting_date(r["date"]) or "9999") > self.since]
+            rows.extend(newer)
+            if len(newer) < len(parsed[0]):
+                break
+        return merge_records(self.previous, rows) if self.since else rows
+
+
+def _drain(q):
+    """Discard everything waiting on queue `q`."""
+    while True:
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            return
+
+
+def scrape_all_attendance_pipeline(mps, fetchers=DEFAULT_CONCURRENCY, parsers=DEFAULT_PARSE_PROCESSES,
+                                   checkpoints=None, journal=None, legislature=LEGISLATURE_ID):
+    """Staged equivalent of scrape_all_attendance, same return shape.
+
+    fetch      `fetchers` threads pull (mp, page) tasks and put raw HTML on a
+               bounded queue — when the parsers fall behind, fetching pauses
+    parse      a process pool turns pages into rows off the GIL
+    aggregate  this thread decides which pages each MP still needs (all the
+               rest at once once pagination is known, one at a time when
+               probing or paging back to an incremental checkpoint), then
+               merges, journals and summarises finished MPs
+
+    Each stage's throughput, busy share and queue depth is printed at the end;
+    the stage that is near 100% busy with a full input queue is the bottleneck.
+    """
+    checkpoints = checkpoints or {}
+    print(f"\n📊 Scraping attendance for {len(mps)} MPs (pipeline: {fetchers} fetchers, "
+          f"{parsers} parser processes, ≤{RATE_LIMITER.rate:g} req/s per host)\n")
+
+    fetch_queue = queue.Queue()
+    raw_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    parsed_queue = queue.Queue()
+    stats = {
+        "fetch": StageStats("fetch", fetchers, fetch_queue),
+        "parse": StageStats("parse", parsers, raw_queue),
+        "aggregate": StageStats("aggregate", 1, parsed_queue),
+    }
+    parse_slots = threading.BoundedSemaphore(parsers * 2)
+    stop = threading.Event()
+
+    def fetch_worker():
+        while True:
+            task = fetch_queue.get()
+            if task is None or stop.is_set():
+                return
+            mp_id, page = task
+            started = time.monotonic()
+            try:
+                html = fetch_page(member_attendance_url(mp_id, legislature, page))
+            except CassetteMiss as e:
+                parsed_queue.put((mp_id, page, e))  # the aggregator re-raises it
+                continue
+            except Exception:
+                html = None
+            stats["fetch"].record(time.monotonic() - started)
+            if stop.is_set():
+                return
+            raw_queue.put((mp_id, page, html))
+
+    def parsed(mp_id, page, future):
+        result = None
+        if not future.cancelled() and future.exception() is None:
+            seconds, result = future.result()
+            stats["parse"].record(seconds)
+            METRICS.observe_parse("member", seconds)
+        parse_slots.release()
+        parsed_queue.put((mp_id, page, result))
+
+    def dispatcher(pool):
+        while True:
+            stats["parse"].sample()
+            item = raw_queue.get()
+            if item is None or stop.is_set():
+                return
+            mp_id, page, html = item
+            if html is None:
+                parsed_queue.put((mp_id, page, None))
+                continue
+            METRICS.observe_page(mp_id)
+            parse_slots.acquire()
+            future = pool.submit(_timed_parse, html)
+            future.add_done_callback(lambda f, m=mp_id, p=page: parsed(m, p, f))
+
+    states = {}
+    for mp in mps:
+        since, previous = checkpoints.get(mp["id"], (None, []))
+        states[mp["id"]] = _MPPages(mp, since, previous)
+        fetch_queue.put((mp["id"], 1))
 
+    results = {}
+    start = time.monotonic()
+    pool = ProcessPoolExecutor(max_workers=parsers, mp_context=multiprocessing.get_context("spawn"))
+    threads = [threading.Thread(target=fetch_worker, daemon=True) for _ in range(fetchers)]
+    threads.append(threading.Thread(target=dispatcher, args=(pool,), daemon=True))
+    for thread in threads:
+        thread.start()
+
+    try:
+        while len(results) < len(mps):
+            stats["aggregate"].sample()
+            stats["fetch"].sample()
+            mp_id, page, result = parsed_queue.get()
+            if isinstance(result, CassetteMiss):
+                raise result
+            started = time.monotonic()
+            state = states[mp_id]
+            state.pending.discard(page)
+            state.pages[page] = result
+
+            follow = []
+            if page == 1 and state.continues(result):
+                records, page_count, paginated = result
+                if paginated:
+                    state.last = min(page_count, MAX_PAGES_PER_MP)
+                state.parallel = paginated and state.since is None
+                follow = list(range(2, state.last + 1)) if state.parallel else [2]
+            elif page > 1 and state.continues(result):
+                # A windowed pager only links a few pages ahead, so any page
+                # may push the last page further out.
+                _, page_count, paginated = result
+                known = state.last
+                if paginated:
+                    state.last = min(max(state.last, page_count), MAX_PAGES_PER_MP)
+                if state.parallel:
+                    follow = list(range(known + 1, state.last + 1))
+                else:
+                    follow = [page + 1]
+            follow = [p for p in follow if p <= state.last]
+
+            for next_page in follow:
+                state.pending.add(next_page)
+                fetch_queue.put((mp_id, next_page))
+
+            if not state.pending:
+                records = state.records()
+                if journal:
+                    journal.record(mp_id, records)
+                summary = results[mp_id] = summarise_attendance(records)
+                print(f"  [{len(results)}/{len(mps)}] {state.mp['name']}... ✓ {summary['present']}/"
+                      f"{summary['total_sittings']} present ({summary['absentee_rate']}% absent)",
+                      flush=True)
+            stats["aggregate"].record(time.monotonic() - started)
+    finally:
+        # On an abort the queues still hold work: drop it before sending the
+        # sentinels, and keep raw_queue drained until the fetchers are gone,
+        # or one blocked putting a page on it never sees its sentinel.
+        stop.set()
+        _drain(fetch_queue)
+        for _ in range(fetchers):
+            fetch_queue.put(None)
+        for thread in threads[:-1]:
+            while thread.is_alive():
+                _drain(raw_queue)
+                thread.join(0.1)
+        _drain(raw_queue)
+        raw_queue.put(None)
+        threads[-1].join()
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    elapsed = time.monotonic() - start
+    print(f"\n  ⏱  Pipeline stages over {elapsed:.1f}s:")
+    for stage in stats.values():
+        print(f"     {stage.report(elapsed)}")
     return results
 
 
-def compute_statistics(mps, attendance):
-    """Compute aggregate stats for the dashboard."""
+def _grouped_totals(labels, present, absent):
+    """Per-group present/absent/member totals, groups in first-seen order."""
+    groups = list(dict.fromkeys(labels))
+    index = {g: i for i, g in enumerate(groups)}
+    codes = np.fromiter((index[label] for label in labels), dtype=np.int64, count=len(labels))
+    n = len(groups)
+    present_sum = np.bincount(codes, weights=present, minlength=n).astype(np.int64).tolist()
+    absent_sum = np.bincount(codes, weights=absent, minlength=n).astype(np.int64).tolist()
+    members = np.bincount(codes, minlength=n).tolist()
+
+    totals = {}
+    for g, p, a, m in zip(groups, present_sum, absent_sum, members):
+        total = p + a
+        totals[g] = {
+            "present": p,
+            "absent": a,
+            "members": m,
+            "absentee_rate": round(a / total * 100, 1) if total > 0 else 0,
+        }
+    return totals
+
+
+def _rates(absent, known):
+    """Absentee percentage per cell, 0 where nothing is known."""
+    out = np.zeros(absent.shape, dtype=np.float64)
+    np.divide(absent * 100.0, known, out=out, where=known > 0)
+    return np.round(out, 1)
+
+
+def _longest_runs(mask):
+    """Length of the longest run of True along each row of a 2-D bool array."""
+    if mask.shape[1] == 0:
+        return np.zeros(mask.shape[0], dtype=np.int64)
+    counts = np.cumsum(mask, axis=1, dtype=np.int64)
+    # At every False cell remember the count so far; subtracting the latest
+    # such checkpoint leaves the length of the current run of Trues.
+    resets = np.maximum.accumulate(np.where(mask, 0, counts), axis=1)
+    return (counts - resets).max(axis=1)
+
+
+def compute_statistics(mps, attendance, legislature=LEGISLATURE_ID, store=None):
+    """Compute aggregate stats for the dashboard.
+
+    Everything is reduced from an MPs × sittings int8 matrix of status codes
+    (see attendance_matrix) plus per-MP present/absent vectors, so the cost
+    is a handful of array passes however many MPs or legislatures are
+    loaded. Besides the party/district/overall totals it adds a rolling
+    ROLLING_WINDOW-sitting absentee rate, per-sitting quorum counts and each
+    MP's longest run of consecutive absences. With `store` (an
+    AttendanceStore holding this legislature), the party, district and
+    per-sitting totals are read from its summary views instead.
+    """
     stats = {
         "by_party": {},
         "by_district": {},
@@ -348,8 +2253,19 @@ def compute_statistics(mps, attendance):
         "overall": {}
     }
 
+    dates, rows = attendance_matrix(mps, attendance)
+    matrix = np.array([rows[mp["id"]] for mp in mps], dtype=np.int8).reshape(len(mps), len(dates))
+    is_present = matrix == STATUS_PRESENT
+    is_absent = matrix == STATUS_ABSENT
+    known = is_present | is_absent
+
+    # Trailing window of the last ROLLING_WINDOW sittings, per MP and house-wide
+    window = slice(max(len(dates) - ROLLING_WINDOW, 0), None)
+    recent_rate = _rates(is_absent[:, window].sum(axis=1), known[:, window].sum(axis=1)).tolist()
+    absence_streaks = _longest_runs(is_absent).tolist()
+
     mp_stats = []
-    for mp in mps:
+    for i, mp in enumerate(mps):
         mp_id = mp["id"]
         att = attendance.get(mp_id, {})
         mp_stats.append({
@@ -359,97 +2275,471 @@ def compute_statistics(mps, attendance):
             "absent": att.get("absent", 0),
             "absentee_rate": att.get("absentee_rate", 0),
             "attendance_rate": round(100 - att.get("absentee_rate", 0), 1),
+            "rolling_absentee_rate": recent_rate[i],
+            "longest_absence_streak": absence_streaks[i],
             "photo_url": f"https://www.parliament.lk/uploads/images/members/profile_images/thumbs/{mp_id}.jpg",
             "profile_url": f"https://www.parliament.lk/en/members-of-parliament/mp-profile/{mp_id}",
-            "attendance_url": f"https://www.parliament.lk/en/members-of-parliament/house-attendance/{mp_id}?legislature={LEGISLATURE_ID}",
+            "attendance_url": f"https://www.parliament.lk/en/members-of-parliament/house-attendance/{mp_id}?legislature={legislature}",
             "daily_records": att.get("records", [])
         })
 
-    # Sort for worst/best
-    ranked = sorted(mp_stats, key=lambda x: x["absentee_rate"], reverse=True)
-    stats["worst_absentees"] = [m["id"] for m in ranked[:20]]
-    stats["best_attendees"] = [m["id"] for m in ranked[-20:]]
-
-    # By party
-    party_map = {}
-    for mp in mp_stats:
-        party = mp["party"] or "Unknown"
-        if party not in party_map:
-            party_map[party] = {"present": 0, "absent": 0, "members": 0}
-        party_map[party]["present"] += mp["present"]
-        party_map[party]["absent"] += mp["absent"]
-        party_map[party]["members"] += 1
-
-    for party, data in party_map.items():
-        total = data["present"] + data["absent"]
-        data["absentee_rate"] = round(data["absent"] / total * 100, 1) if total > 0 else 0
-    stats["by_party"] = party_map
-
-    # By district
-    district_map = {}
-    for mp in mp_stats:
-        district = mp["district"] or "Unknown"
-        if district not in district_map:
-            district_map[district] = {"present": 0, "absent": 0, "members": 0}
-        district_map[district]["present"] += mp["present"]
-        district_map[district]["absent"] += mp["absent"]
-        district_map[district]["members"] += 1
-
-    for district, data in district_map.items():
-        total = data["present"] + data["absent"]
-        data["absentee_rate"] = round(data["absent"] / total * 100, 1) if total > 0 else 0
-    stats["by_district"] = district_map
+    present = np.array([m["present"] for m in mp_stats], dtype=np.int64)
+    absent = np.array([m["absent"] for m in mp_stats], dtype=np.int64)
+    rates = np.array([m["absentee_rate"] for m in mp_stats], dtype=np.float64)
+
+    # Sort for worst/best (stable, so ties keep directory order as before)
+    ranked = np.argsort(-rates, kind="stable").tolist()
+    stats["worst_absentees"] = [mp_stats[i]["id"] for i in ranked[:20]]
+    stats["best_attendees"] = [mp_stats[i]["id"] for i in ranked[-20:]]
+
+    parties = [m["party"] or "Unknown" for m in mp_stats]
+    districts = [m["district"] or "Unknown" for m in mp_stats]
+    if store is None:
+        stats["by_party"] = _grouped_totals(parties, present, absent)
+        stats["by_district"] = _grouped_totals(districts, present, absent)
+    else:
+        for key, view, labels in (("by_party", "party_summary", parties),
+                                  ("by_district", "district_summary", districts)):
+            totals = store.group_totals(legislature, view)
+            order = {g: i for i, g in enumerate(dict.fromkeys(labels))}
+            stats[key] = {g: totals[g] for g in sorted(totals, key=lambda g: (order.get(g, len(order)), g))}
+
+    # Per sitting: headcount, quorum, and the house-wide rolling absentee rate
+    if store is None:
+        present_by_sitting = is_present.sum(axis=0)
+        absent_by_sitting = is_absent.sum(axis=0)
+    else:
+        totals = store.sitting_totals(legislature)
+        present_by_sitting = np.array([totals.get(d, (0, 0))[0] for d in dates], dtype=np.int64)
+        absent_by_sitting = np.array([totals.get(d, (0, 0))[1] for d in dates], dtype=np.int64)
+    known_by_sitting = present_by_sitting + absent_by_sitting
+    cum_absent = np.concatenate(([0], np.cumsum(absent_by_sitting)))
+    cum_known = np.concatenate(([0], np.cumsum(known_by_sitting)))
+    start = np.maximum(np.arange(1, len(dates) + 1) - ROLLING_WINDOW, 0)
+    rolling = _rates(cum_absent[1:] - cum_absent[start], cum_known[1:] - cum_known[start])
+
+    stats["by_sitting"] = {
+        "dates": dates,
+        "present": present_by_sitting.tolist(),
+        "absent": absent_by_sitting.tolist(),
+        "quorum_met": (present_by_sitting >= QUORUM).tolist(),
+        "rolling_absentee_rate": rolling.tolist(),
+    }
 
     # Overall
-    total_present = sum(m["present"] for m in mp_stats)
-    total_absent = sum(m["absent"] for m in mp_stats)
+    total_present = int(present.sum())
+    total_absent = int(absent.sum())
     total_all = total_present + total_absent
 
-    # Determine total sitting days
-    all_dates = set()
-    for mp in mp_stats:
-        for r in mp.get("daily_records", []):
-            all_dates.add(r["date"])
-
     stats["overall"] = {
         "total_mps": len(mps),
-        "total_sitting_days": len(all_dates),
+        "total_sitting_days": len(dates),
         "avg_absentee_rate": round(total_absent / total_all * 100, 1) if total_all > 0 else 0,
         "avg_attendance_rate": round(total_present / total_all * 100, 1) if total_all > 0 else 0,
+        "sittings_without_quorum": int((present_by_sitting < QUORUM).sum()),
+        "rolling_window": ROLLING_WINDOW,
     }
 
     return mp_stats, stats
 
 
+# ── Change Feed ─────────────────────────────────────────────────────────────
+
+def _field_changes(old, new, skip=()):
+    """{field: [old, new]} for every top-level field that differs."""
+    return {
+        key: [old.get(key), new.get(key)]
+        for key in dict.fromkeys(list(old) + list(new))
+        if key not in skip and old.get(key) != new.get(key)
+    }
+
+
+def _group_changes(old, new):
+    """Per-group changes for by_party/by_district: field diffs, None if removed."""
+    changes = {}
+    for group in dict.fromkeys(list(old) + list(new)):
+        if group not in new:
+            changes[group] = None
+        elif group not in old:
+            changes[group] = {key: [None, value] for key, value in new[group].items()}
+        else:
+            diff = _field_changes(old[group], new[group])
+            if diff:
+                changes[group] = diff
+    return changes
+
+
+def compute_delta(previous_output, previous_matrix, output, matrix):
+    """Describe what changed between two runs' outputs.
+
+    Everything is keyed so a client holding the previous snapshot can patch
+    it in place: `[old, new]` pairs give the value to write (new) and, for
+    editors, what it replaced. Sections:
+
+        sittings     added / removed sitting dates
+        cells        {mp_id: {date: [old_code, new_code]}} (codes as in the matrix
+                     file; "unknown" means no row), covering new sittings too
+        members      added (full member objects), departed (ids), and
+                     changed {mp_id: {field: [old, new]}}
+        statistics   overall/by_party/by_district field diffs; the ranking
+                     lists and by_sitting are given whole when they change
+    """
+    old_cells = decode_attendance_matrix(previous_matrix) if previous_matrix else {}
+    new_cells = decode_attendance_matrix(matrix)
+    old_dates = set(previous_matrix["dates"]) if previous_matrix else set()
+    new_dates = set(matrix["dates"])
+
+    cells = {}
+    for mp_id in dict.fromkeys(list(old_cells) + list(new_cells)):
+        old_row, new_row = old_cells.get(mp_id, {}), new_cells.get(mp_id, {})
+        moved = {
+            date: [CODE_NAMES[old_row.get(date, STATUS_UNKNOWN)], CODE_NAMES[new_row.get(date, STATUS_UNKNOWN)]]
+            for date in sorted(set(old_row) | set(new_row))
+            if old_row.get(date) != new_row.get(date)
+        }
+        if moved:
+            cells[mp_id] = moved
+
+    old_members = {m["id"]: m for m in previous_output.get("members", [])}
+    new_members = {m["id"]: m for m in output["members"]}
+    changed = {}
+    for mp_id, member in new_members.items():
+        if mp_id in old_members:
+            diff = _field_changes(old_members[mp_id], member)
+            if diff:
+                changed[mp_id] = diff
+
+    old_stats, new_stats = previous_output.get("statistics", {}), output["statistics"]
+    statistics = {
+        "overall": _field_changes(old_stats.get("overall", {}), new_stats["overall"]),
+        "by_party": _group_changes(old_stats.get("by_party", {}), new_stats["by_party"]),
+        "by_district": _group_changes(old_stats.get("by_district", {}), new_stats["by_district"]),
+    }
+    for key in ("worst_absentees", "best_attendees", "by_sitting"):
+        if old_stats.get(key) != new_stats.get(key):
+            statistics[key] = new_stats.get(key)
+
+    return {
+        "metadata": {
+            "legislature_id": output["metadata"]["legislature_id"],
+            "from_scraped_at": previous_output.get("metadata", {}).get("scraped_at"),
+            "to_scraped_at": output["metadata"]["scraped_at"],
+        },
+        "sittings": {"added": sorted(new_dates - old_dates), "removed": sorted(old_dates - new_dates)},
+        "cells": cells,
+        "members": {
+            "added": [m for mp_id, m in new_members.items() if mp_id not in old_members],
+            "departed": [mp_id for mp_id in old_members if mp_id not in new_members],
+            "changed": changed,
+        },
+        "statistics": statistics,
+    }
+
+
+def _load_json(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def print_delta_summary(delta, members):
+    """The editors' "what moved" digest."""
+    names = {m["id"]: m["name"] for m in members}
+    d_members = delta["members"]
+    print(f"\n🆕 Since {delta['metadata']['from_scraped_at']}: "
+          f"{len(delta['sittings']['added'])} new sittings, "
+          f"{sum(len(c) for c in delta['cells'].values())} MP/sitting cells changed, "
+          f"{len(d_members['added'])} new / {len(d_members['departed'])} departed members")
+    movers = sorted(
+        ((mp_id, diff["absentee_rate"]) for mp_id, diff in d_members["changed"].items()
+         if "absentee_rate" in diff),
+        key=lambda item: abs(item[1][1] - item[1][0]),
+        reverse=True,
+    )
+    for mp_id, (old, new) in movers[:5]:
+        print(f"   {names.get(mp_id, mp_id)}: absentee rate {old}% → {new}%")
+    overall = delta["statistics"]["overall"].get("avg_absentee_rate")
+    if overall:
+        print(f"   House average: {overall[0]}% → {overall[1]}%")
+
+
+# ── Compressed Output ───────────────────────────────────────────────────────
+
+def write_compressed_variants(path, data, minified_copy=True):
+    """Write `<stem>.min.json` and measure what the payload costs on the wire.
+
+    The minified form uses sorted keys and no whitespace, so identical data
+    produces a byte-identical file (and an unchanged ETag) from one run to
+    the next. Pass `minified_copy=False` for a file already written minified
+    (the shard index), which is then only measured. The gzip and brotli
+    sizes are computed, not written: Cloudflare compresses JSON at the edge
+    and nothing on the site would serve precompressed files with a
+    Content-Encoding. Returns {"raw", "min", "gz", "br"} sizes in bytes;
+    "br" is None without brotli.
+    """
+    minified = json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    stem = path[:-len(".json")] if path.endswith(".json") else path
+    if minified_copy:
+        _write_bytes_atomic(f"{stem}.min.json", minified)
+    for stale in (f"{stem}.min.json", f"{stem}.min.json.gz", f"{stem}.min.json.br")[minified_copy:]:
+        # Left behind by earlier runs, and would now serve outdated data
+        if os.path.exists(stale):
+            os.remove(stale)
+
+    return {
+        "raw": os.path.getsize(path) if os.path.exists(path) else None,
+        "min": len(minified),
+        "gz": len(gzip.compress(minified, compresslevel=9, mtime=0)),
+        "br": len(brotli.compress(minified, quality=11)) if brotli is not None else None,
+    }
+
+
+def format_size_report(label, sizes):
+    def kb(n):
+        return f"{n / 1024:.1f} KB" if n is not None else "—"
+    line = f"{label}: raw {kb(sizes['raw'])} · min {kb(sizes['min'])} · gz {kb(sizes['gz'])} · br {kb(sizes['br'])}"
+    if sizes["br"] is None:
+        line += " (pip install brotli for br)"
+    return line
+
+
+# ── Sharded Output ──────────────────────────────────────────────────────────
+
+def write_member_shards(shard_dir, output, records):
+    """Write the lazy-loading layout: a small index plus one file per MP.
+
+    `index.json` carries the metadata, statistics and every MP's summary
+    fields, with `shard` pointing at `members/<id>.<hash>.json`, which holds
+    that MP's summary plus full daily history. Shards are serialised
+    deterministically and named by content hash, so an MP whose record didn't
+    change keeps the same URL across runs and stays cached at the edge.
+    Superseded shards are removed one run late: the previous index's shards
+    are kept, so a client still holding the old `index.json` can load them.
+    Returns the index document.
+    """
+    members_dir = os.path.join(shard_dir, "members")
+    index_path = os.path.join(shard_dir, "index.json")
+    os.makedirs(members_dir, exist_ok=True)
+
+    previous = set()
+    try:
+        with open(index_path, encoding="utf-8") as f:
+            previous = {os.path.basename(m["shard"]) for m in json.load(f).get("members", []) if m.get("shard")}
+    except (OSError, ValueError):
+        pass
+
+    index_members = []
+    written = set()
+    for member in output["members"]:
+        shard = {**member, "daily_records": records["members"].get(member["id"], [])}
+        data = json.dumps(shard, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()[:SHARD_HASH_LENGTH]
+        name = f"{member['id']}.{digest}.json"
+        path = os.path.join(members_dir, name)
+        if not os.path.exists(path):
+            _write_bytes_atomic(path, data)
+        written.add(name)
+        index_members.append({**member, "shard": f"members/{name}"})
+
+    index = {**output, "members": index_members}
+    _write_json_atomic(index_path, index, ensure_ascii=False, separators=(",", ":"))
+
+    for name in os.listdir(members_dir):
+        if name.endswith(".json") and name not in written and name not in previous:
+            os.remove(os.path.join(members_dir, name))
+    return index
+
+
 # ── Main ────────────────────────────────────────────────────────────────────
 
-def main():
-    print("=" * 60)
-    print("  Sri Lanka Parliament — MP Attendance Scraper")
-    print("  10th Parliament of the D.S.R. of Sri Lanka")
-    print("=" * 60)
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape Sri Lanka Parliament MP attendance.")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"MPs scraped in parallel (default {DEFAULT_CONCURRENCY}; "
+                             "1 = original sequential crawl)")
+    parser.add_argument("--page-concurrency", type=int, default=DEFAULT_PAGE_CONCURRENCY,
+                        help="Pages of one MP's listing fetched in parallel once the page "
+                             f"count is known (default {DEFAULT_PAGE_CONCURRENCY})")
+    parser.add_argument("--engine", choices=("threads", "pipeline"), default="threads",
+                        help="threads: one worker per MP (default); pipeline: fetch threads → "
+                             "parser processes → aggregator, with per-stage throughput report")
+    parser.add_argument("--parse-processes", type=int, default=DEFAULT_PARSE_PROCESSES,
+                        help=f"Parser processes for --engine pipeline (default {DEFAULT_PARSE_PROCESSES})")
+    parser.add_argument("--rate", type=float, default=REQUEST_RATE,
+                        help=f"Max requests/second per host (default {REQUEST_RATE:g}); a hard "
+                             "ceiling the adaptive window only ever slows the crawl below")
+    parser.add_argument("--no-adaptive", action="store_true",
+                        help="Disable the AIMD in-flight window and use the original fixed "
+                             "pauses between sequential requests (always so with --concurrency 1)")
+    parser.add_argument("--burst", type=int, default=REQUEST_BURST,
+                        help=f"Requests a host may receive back-to-back (default {REQUEST_BURST})")
+    parser.add_argument("--cache-dir", default=CACHE_DIR,
+                        help="Conditional-GET response cache directory (default scraper/.cache/http)")
+    parser.add_argument("--cache-max-mb", type=float, default=CACHE_MAX_MB,
+                        help=f"LRU-evict cached pages beyond this size (default {CACHE_MAX_MB} MB)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Download every page in full, ignoring the response cache")
+    parser.add_argument("--archive-dir", default=ARCHIVE_DIR,
+                        help="Content-addressed archive every fetched page is written to "
+                             "(default scraper/archive)")
+    parser.add_argument("--no-archive", action="store_true",
+                        help="Do not archive fetched pages")
+    parser.add_argument("--reparse-from", metavar="ARCHIVE",
+                        help="Rebuild the output from a page archive instead of the network. Always "
+                             "a full run: rows in the --db store this parse does not produce are deleted")
+    parser.add_argument("--reparse-as-of", metavar="TIMESTAMP",
+                        help="With --reparse-from, use the newest copy of each page fetched at or "
+                             "before this ISO timestamp (default: the newest copy)")
+    parser.add_argument("--record", metavar="DIR",
+                        help="Record every HTTP exchange (including errors) to a cassette directory; "
+                             "implies --no-cache so the cassette holds full responses")
+    parser.add_argument("--replay", metavar="DIR",
+                        help="Serve every request from a recorded cassette — no network, no cache")
+    parser.add_argument("--replay-latency", type=float, default=0.0, metavar="FACTOR",
+                        help="With --replay, sleep the recorded response time × FACTOR "
+                             "(default 0: as fast as possible; 1: as recorded)")
+    parser.add_argument("--mode", choices=("by-mp", "by-date", "cross-check"), default="by-mp",
+                        help="by-mp: page through every MP's attendance (default); "
+                             "by-date: read the per-sitting house listing and join on names; "
+                             "cross-check: run both and diff them")
+    parser.add_argument("--resume", action="store_true",
+                        help="Skip MPs already recorded in the journal of a crashed run")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only page each MP back to the newest sitting in the previous "
+                             "run's records file, merging new rows in")
+    parser.add_argument("--db", default=DB_FILE,
+                        help="SQLite store to upsert into; the dashboard JSON is built from its "
+                             "views (default scraper/attendance.sqlite)")
+    parser.add_argument("--no-db", dest="db", action="store_const", const=None,
+                        help="Skip the SQLite store and build the JSON straight from the scrape")
+    parser.add_argument("--metrics", default=METRICS_FILE,
+                        help="Where to write the run's metrics JSON (default scraper/.cache/metrics.json)")
+    parser.add_argument("--prometheus-textfile",
+                        help="Also write the metrics in Prometheus text format to this .prom file, "
+                             "for node_exporter's textfile collector")
+    parser.add_argument("--legislatures",
+                        help="Comma-separated legislature ids (e.g. 995,994) to crawl in parallel "
+                             "processes, each written to its own mp_attendance.<id>.json shard")
+    parser.add_argument("--processes", type=int,
+                        help="Worker processes for --legislatures (default: one per legislature); "
+                             "--rate is shared between them")
+    args = parser.parse_args(argv)
+    if args.reparse_from and args.incremental:
+        # An incremental run starts from the records an earlier parse wrote
+        # and keeps the store's older rows, which is what a re-parse replaces.
+        parser.error("--reparse-from rebuilds everything from the archive; drop --incremental")
+    return args
+
+
+def legislature_paths(legislature, sharded=False):
+    """Output/state file paths for one legislature.
+
+    A single-legislature run keeps the original file names; with --legislatures
+    every legislature gets its own `mp_attendance.<id>.*` shard files.
+    """
+    if not sharded:
+        return {"output": OUTPUT_FILE, "records": RECORDS_FILE, "matrix": MATRIX_FILE,
+                "delta": DELTA_FILE, "shards": SHARD_DIR, "journal": JOURNAL_FILE, "crosscheck": CROSSCHECK_FILE,
+                "metrics": METRICS_FILE}
+    stem, state = os.path.join(OUTPUT_DIR, f"mp_attendance.{legislature}"), os.path.dirname(JOURNAL_FILE)
+    return {
+        "output": f"{stem}.json",
+        "records": f"{stem}.records.json",
+        "matrix": f"{stem}.matrix.json",
+        "delta": f"{stem}.delta.json",
+        "shards": stem,
+        "journal": os.path.join(state, f"attendance.{legislature}.journal.jsonl"),
+        "crosscheck": os.path.join(state, f"crosscheck.{legislature}.json"),
+        "metrics": os.path.join(state, f"metrics.{legislature}.json"),
+    }
+
+
+def legislature_name(legislature):
+    return LEGISLATURE_NAMES.get(legislature, f"Parliament of Sri Lanka (legislature {legislature})")
+
 
+def run_legislature(args, legislature=LEGISLATURE_ID, sharded=False):
+    """Scrape, aggregate and write one legislature. Returns its manifest entry."""
+    paths = legislature_paths(legislature, sharded)
     start_time = time.time()
+    METRICS.reset(legislature)
 
     # Step 1: Get all MPs
-    mps = scrape_mp_directory()
+    with METRICS.stage("directory"):
+        mps = scrape_mp_directory(concurrency=args.concurrency, legislature=legislature)
 
     if not mps:
-        print("❌ Failed to scrape MP directory. Exiting.")
-        sys.exit(1)
+        print(f"❌ Failed to scrape MP directory for legislature {legislature}. Exiting.")
+        raise SystemExit(f"empty MP directory for legislature {legislature}")
 
     # Step 2: Get attendance for each MP
-    attendance = scrape_all_attendance(mps)
-
-    # Step 3: Compute statistics
-    mp_stats, aggregate_stats = compute_statistics(mps, attendance)
+    checkpoints = None
+    if args.incremental:
+        checkpoints = load_checkpoints(paths["records"])
+        if checkpoints:
+            print(f"\n🔁 Incremental refresh from {len(checkpoints)} MPs' previous records")
+        else:
+            print(f"\n⚠ No previous records at {paths['records']} — running a full scrape")
+    journal = AttendanceJournal(paths["journal"], legislature=legislature, resume=args.resume)
+    if args.resume:
+        print(f"\n⏯  Resuming: {len(journal.completed)} MPs already in {paths['journal']}")
+    pending = [mp for mp in mps if mp["id"] not in journal.completed]
+    attendance = {mp_id: summarise_attendance(records) for mp_id, records in journal.completed.items()}
+    with METRICS.stage("attendance"):
+        if args.mode == "by-date":
+            # Names are matched against the whole directory: a matcher built
+            # from the pending MPs alone would fuzzy-match the finished MPs'
+            # rows onto pending MPs with similar names.
+            attendance.update(attendance_by_date(mps, legislature=legislature,
+                                                 checkpoints=checkpoints, journal=journal,
+                                                 skip=journal.completed))
+        elif args.engine == "pipeline":
+            attendance.update(scrape_all_attendance_pipeline(pending, fetchers=args.concurrency,
+                                                             parsers=args.parse_processes,
+                                                             checkpoints=checkpoints, journal=journal,
+                                                             legislature=legislature))
+        else:
+            attendance.update(scrape_all_attendance(pending, concurrency=args.concurrency,
+                                                    checkpoints=checkpoints, journal=journal,
+                                                    page_concurrency=args.page_concurrency,
+                                                    legislature=legislature))
+
+    mismatches = []
+    if args.mode == "cross-check":
+        with METRICS.stage("cross_check"):
+            by_date = attendance_by_date(mps, legislature=legislature, checkpoints=checkpoints)
+        mismatches = cross_check_attendance(mps, attendance, by_date)
+        _write_json_atomic(paths["crosscheck"], mismatches, indent=2, ensure_ascii=False)
+        print(f"\n🔍 Cross-check: {len(mismatches)} MP/sitting mismatches → {paths['crosscheck']}")
+        for m in mismatches[:10]:
+            print(f"   {m['date']} {m['name']}: by-mp={m['by_mp']} by-date={m['by_date']}")
+
+    # Step 3: Persist to SQLite, then compute statistics from what the store holds
+    store = None
+    if args.db:
+        with METRICS.stage("store"):
+            store = AttendanceStore(args.db)
+            # An incremental run does not re-read older sittings, so it
+            # cannot tell whether the site has dropped any of them.
+            upserted, deleted = store.upsert(legislature, mps, attendance, prune=not args.incremental)
+            attendance = store.load_attendance(legislature, mps)
+        print(f"\n🗃  Upserted {upserted} attendance rows into {args.db}"
+              + (f", deleted {deleted} no longer on the site" if deleted else ""))
+
+    with METRICS.stage("statistics"):
+        mp_stats, aggregate_stats = compute_statistics(mps, attendance, legislature=legislature, store=store)
+    if store:
+        store.close()
+    scraped_at = datetime.now().isoformat()
 
     # Step 4: Build output JSON
     output = {
         "metadata": {
-            "scraped_at": datetime.now().isoformat(),
-            "legislature": "10th Parliament of the D.S.R. of Sri Lanka (2024-present)",
-            "legislature_id": LEGISLATURE_ID,
+            "scraped_at": scraped_at,
+            "legislature": legislature_name(legislature),
+            "legislature_id": legislature,
             "total_mps": len(mps),
             "source": "https://www.parliament.lk",
             "scraper_version": "1.0"
@@ -459,24 +2749,226 @@ def main():
     }
 
     # Remove daily_records from the main output to keep size manageable
-    # (keep only summary stats per MP)
-    for member in output["members"]:
-        del member["daily_records"]
+    # (keep only summary stats per MP). They go to the records file instead,
+    # which is what the next --incremental run pages back to.
+    records = {
+        "metadata": {"scraped_at": scraped_at, "legislature_id": legislature},
+        "members": {member["id"]: member.pop("daily_records") for member in output["members"]},
+    }
 
-    # Step 5: Save
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    SESSION.close()
+
+    # Step 5: Diff against the previous run, then save (atomically — a crash
+    # here must not truncate last quarter's data)
+    with METRICS.stage("write"):
+        matrix = encode_attendance_matrix(mps, attendance, {"scraped_at": scraped_at, "legislature_id": legislature})
+        previous_output = _load_json(paths["output"])
+        delta = None
+        if previous_output:
+            delta = compute_delta(previous_output, _load_json(paths["matrix"]), output, matrix)
+
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        _write_json_atomic(paths["output"], output, indent=2, ensure_ascii=False)
+        _write_json_atomic(paths["records"], records, ensure_ascii=False)
+        if delta is not None:
+            _write_json_atomic(paths["delta"], delta, ensure_ascii=False, separators=(",", ":"))
+        _write_json_atomic(paths["matrix"], matrix, separators=(",", ":"))
+        index = write_member_shards(paths["shards"], output, records)
+        sizes = {
+            "output": write_compressed_variants(paths["output"], output),
+            "index": write_compressed_variants(os.path.join(paths["shards"], "index.json"), index,
+                                               minified_copy=False),
+        }
+    journal.finish()
+
+    metrics = METRICS.snapshot()
+    metrics_file = paths["metrics"] if sharded else args.metrics
+    METRICS.write_json(metrics_file, metrics)
+    if args.prometheus_textfile:
+        textfile = args.prometheus_textfile
+        if sharded:
+            root, ext = os.path.splitext(textfile)
+            textfile = f"{root}.{legislature}{ext}"
+        METRICS.write_prometheus(textfile, metrics)
 
     elapsed = time.time() - start_time
-    file_size = os.path.getsize(OUTPUT_FILE) / 1024
+    file_size = os.path.getsize(paths["output"]) / 1024
 
     print(f"\n{'=' * 60}")
-    print(f"  ✅ Done! Scraped {len(mps)} MPs in {elapsed:.0f}s")
-    print(f"  📁 Output: {OUTPUT_FILE} ({file_size:.0f} KB)")
+    print(f"  ✅ Done! Scraped {len(mps)} MPs in {elapsed:.0f}s — {legislature_name(legislature)}")
+    print(f"  📁 Output: {paths['output']} ({file_size:.0f} KB)")
+    print(f"  🧮 Matrix: {paths['matrix']} ({os.path.getsize(paths['matrix']) / 1024:.0f} KB, "
+          f"{len(matrix['members'])} MPs × {len(matrix['dates'])} sittings)")
+    print(f"  🧩 Shards: {paths['shards']}/index.json "
+          f"({os.path.getsize(os.path.join(paths['shards'], 'index.json')) / 1024:.0f} KB) "
+          f"+ {len(mps)} members/<id>.<hash>.json")
+    print(f"  📦 {format_size_report(os.path.basename(paths['output']), sizes['output'])}")
+    print(f"  📦 {format_size_report('index.json', sizes['index'])}")
+    print(f"  🌐 Transfer: {SESSION.transfer_summary()}")
+    print(f"  ⏱  Requests: {METRICS.summary(metrics)}")
+    print(f"  📈 Metrics: {metrics_file}" + (f" + {textfile}" if args.prometheus_textfile else ""))
+    if CACHE:
+        print(f"  🗄  Cache: {CACHE.summary()}")
+    if ARCHIVE:
+        print(f"  📼 Archive: {ARCHIVE.summary()}")
+    if delta is not None:
+        print(f"  🔀 Delta: {paths['delta']} ({os.path.getsize(paths['delta']) / 1024:.1f} KB)")
     print(f"  📊 Total sitting days: {aggregate_stats['overall']['total_sitting_days']}")
     print(f"  📉 Avg absentee rate: {aggregate_stats['overall']['avg_absentee_rate']}%")
     print(f"{'=' * 60}")
+    if delta is not None:
+        print_delta_summary(delta, output["members"])
+
+    return {
+        "legislature_id": legislature,
+        "legislature": legislature_name(legislature),
+        "file": os.path.basename(paths["output"]),
+        "records_file": os.path.basename(paths["records"]),
+        "matrix_file": os.path.basename(paths["matrix"]),
+        "index_file": f"{os.path.basename(paths['shards'])}/index.json",
+        "scraped_at": scraped_at,
+        "total_mps": len(mps),
+        "total_sitting_days": aggregate_stats["overall"]["total_sitting_days"],
+        "bytes": os.path.getsize(paths["output"]),
+        "sizes": sizes,
+        "mismatches": len(mismatches),
+    }
+
+
+def configure(args, rate):
+    """Set up this process's rate limiter, session, cache and page archive from the parsed args."""
+    global CACHE, ARCHIVE, REPARSE, SESSION
+    # --concurrency 1 is the original crawl, fixed pauses between requests included.
+    RATE_LIMITER.configure(rate=rate, burst=args.burst, adaptive=not args.no_adaptive and args.concurrency > 1)
+    if args.reparse_from:
+        REPARSE = PageArchive(args.reparse_from)
+        REPARSE.load(args.reparse_as_of)
+        return
+    if args.replay:
+        # The cassette alone decides what every request returns: no cache
+        # state, nothing written to the archive, and no politeness ceiling
+        # since no site is on the other end.
+        RATE_LIMITER.configure(rate=1e9)
+        SESSION = CassetteSession(args.replay, replay=True, latency=args.replay_latency)
+        return
+    if args.record:
+        SESSION = CassetteSession(args.record)
+    if not args.no_cache and not args.record:
+        CACHE = ResponseCache(args.cache_dir, max_bytes=int(args.cache_max_mb * 1024 * 1024))
+    if not args.no_archive:
+        ARCHIVE = PageArchive(args.archive_dir)
+
+
+def _legislature_worker(args, legislature, rate):
+    """Process-pool entry point: one legislature with its slice of the rate budget.
+
+    A failure comes back as {"legislature_id", "error"} rather than raised:
+    exceptions such as HTTPError cannot be unpickled in the parent, which
+    breaks the pool and takes the healthy legislatures down with it.
+    """
+    try:
+        configure(args, rate)
+        return run_legislature(args, legislature, sharded=True)
+    except (Exception, SystemExit) as e:
+        print(f"❌ Legislature {legislature} failed: {type(e).__name__}: {e}")
+        return {"legislature_id": legislature, "error": f"{type(e).__name__}: {e}"}
+
+
+def write_manifest(entries):
+    """Merge shard entries into MANIFEST_FILE, keeping legislatures not re-run."""
+    try:
+        with open(MANIFEST_FILE, encoding="utf-8") as f:
+            shards = {s["legislature_id"]: s for s in json.load(f).get("shards", [])}
+    except (OSError, ValueError):
+        shards = {}
+    for entry in entries:
+        shards[entry["legislature_id"]] = {k: v for k, v in entry.items() if k != "mismatches"}
+    manifest = {
+        "generated_at": datetime.now().isoformat(),
+        "shards": sorted(shards.values(), key=lambda s: s["legislature_id"], reverse=True),
+    }
+    _write_json_atomic(MANIFEST_FILE, manifest, indent=2, ensure_ascii=False)
+    return manifest
+
+
+def backfill_legislatures(args, legislatures):
+    """Crawl several legislatures in parallel worker processes.
+
+    They all hit the same host, so the --rate budget is split evenly between
+    the workers running at once: the site sees the same total load as a
+    single-legislature run, however many shards are being built. One
+    legislature failing does not stop the others; the manifest is written
+    for those that succeeded and the failures are returned as error entries.
+    """
+    workers = max(1, min(args.processes or len(legislatures), len(legislatures)))
+    rate = args.rate / workers
+    print(f"\n🗂  Backfilling {len(legislatures)} legislatures on {workers} processes "
+          f"({rate:g} req/s each, {args.rate:g} req/s total)")
+
+    entries = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_legislature_worker, args, leg, rate): leg for leg in legislatures}
+        for future in as_completed(futures):
+            entries.append(future.result())
+
+    succeeded = [entry for entry in entries if "error" not in entry]
+    failed = [entry for entry in entries if "error" in entry]
+    if succeeded:
+        manifest = write_manifest(succeeded)
+        print(f"\n🗂  Manifest: {MANIFEST_FILE} ({len(manifest['shards'])} shards)")
+    for entry in sorted(succeeded, key=lambda e: e["legislature_id"], reverse=True):
+        print(f"   {entry['legislature_id']}: {entry['file']} — {entry['total_mps']} MPs, "
+              f"{entry['total_sitting_days']} sittings, {entry['bytes'] / 1024:.0f} KB")
+    for entry in sorted(failed, key=lambda e: e["legislature_id"], reverse=True):
+        print(f"   ❌ {entry['legislature_id']}: {entry['error']}")
+    return entries
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    legislatures = [leg.strip() for leg in (args.legislatures or "").split(",") if leg.strip()]
+
+    print("=" * 60)
+    print("  Sri Lanka Parliament — MP Attendance Scraper")
+    if legislatures:
+        print(f"  Legislatures {', '.join(legislatures)}")
+    else:
+        print("  10th Parliament of the D.S.R. of Sri Lanka")
+    print("=" * 60)
+
+    if args.reparse_from:
+        if not os.path.exists(os.path.join(args.reparse_from, "index.jsonl")):
+            print(f"❌ No page archive at {args.reparse_from}. Exiting.")
+            sys.exit(1)
+        print(f"\n📼 Re-parsing from {args.reparse_from}"
+              + (f" as of {args.reparse_as_of}" if args.reparse_as_of else "") + " — no network")
+
+    if args.replay:
+        if not os.path.exists(os.path.join(args.replay, "interactions.jsonl")):
+            print(f"❌ No cassette at {args.replay}. Exiting.")
+            sys.exit(1)
+        print(f"\n📼 Replaying {args.replay} (latency × {args.replay_latency:g}) — no network")
+    elif args.record:
+        os.makedirs(args.record, exist_ok=True)
+        with open(os.path.join(args.record, "interactions.jsonl"), "w"):
+            pass  # a fresh cassette; bodies from earlier recordings are reused
+        print(f"\n⏺  Recording every HTTP exchange to {args.record}")
+
+    if legislatures:
+        entries = backfill_legislatures(args, legislatures)
+    else:
+        configure(args, args.rate)
+        try:
+            entries = [run_legislature(args)]
+        except CassetteMiss as e:
+            print(f"\n❌ Replay diverged from the recording: {e}")
+            print("   Replay with the same flags the cassette was recorded with. Exiting.")
+            sys.exit(1)
+
+    if any("error" in entry for entry in entries):
+        sys.exit(1)
+    if any(entry["mismatches"] for entry in entries):
+        sys.exit(2)
 
 
 if __name__ == "__main__":
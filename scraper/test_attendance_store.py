@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite attendance store.
+
+    cd scraper && python -m unittest test_attendance_store
+"""
+
+import os
+import tempfile
+import unittest
+
+from mp_scraper import AttendanceStore, compute_statistics, summarise_attendance
+
+SITTINGS = ["2025-01-07", "2025-01-08", "2025-01-09", "2025-01-14", "2025-01-15", "2025-01-16"]
+DIRECTORY = [
+    {"id": "3001", "name": "Hon. A. Perera", "party": "NPP", "district": "Colombo"},
+    {"id": "3002", "name": "Hon. B. Silva", "party": "SJB", "district": "Kandy"},
+    {"id": "3003", "name": "Hon. C. Fernando", "party": "NPP", "district": "Kandy"},
+    {"id": "3004", "name": "Hon. D. Kumar", "party": "", "district": "Jaffna"},
+    {"id": "3005", "name": "Hon. E. Raj", "party": "SJB", "district": "Colombo"},
+]
+
+
+def scrape(mps, sittings):
+    """What a scrape of a site with these MPs and sittings returns, newest sitting first."""
+    attendance = {}
+    for n, mp in enumerate(mps):
+        records = [{"date": d, "status": "Absent" if (n + k) % 3 == 0 else "Present"}
+                   for k, d in enumerate(sittings)]
+        attendance[mp["id"]] = summarise_attendance(records[::-1])
+    return attendance
+
+
+class AttendanceStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = AttendanceStore(os.path.join(self.tmp.name, "attendance.sqlite"))
+        self.store.upsert("995", DIRECTORY, scrape(DIRECTORY, SITTINGS), prune=True)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def from_store(self, mps):
+        return compute_statistics(mps, self.store.load_attendance("995", mps), legislature="995", store=self.store)
+
+    def test_matches_no_db_output(self):
+        attendance = scrape(DIRECTORY, SITTINGS)
+        self.assertEqual(self.from_store(DIRECTORY), compute_statistics(DIRECTORY, attendance, legislature="995"))
+
+    def test_matches_no_db_output_after_site_drops_a_sitting_and_an_mp(self):
+        mps = DIRECTORY[:-1]
+        attendance = scrape(mps, SITTINGS[:2] + SITTINGS[3:])
+        upserted, deleted = self.store.upsert("995", mps, attendance, prune=True)
+        self.assertEqual(upserted, 4 * 5)
+        self.assertEqual(deleted, 6 + 4)
+
+        expected = compute_statistics(mps, attendance, legislature="995")
+        self.assertEqual(self.from_store(mps), expected)
+        overall = expected[1]["overall"]
+        self.assertEqual((overall["total_mps"], overall["total_sitting_days"]), (4, 5))
+        self.assertEqual(sum(p["members"] for p in expected[1]["by_party"].values()), 4)
+
+    def test_incremental_upsert_keeps_rows_but_drops_departed_mps(self):
+        mps = DIRECTORY[:-1]
+        attendance = scrape(mps, SITTINGS[3:])
+        self.store.upsert("995", mps, attendance, prune=False)
+        totals = self.store.group_totals("995", "party_summary")
+        self.assertEqual(sum(t["members"] for t in totals.values()), 4)
+        self.assertEqual(len(self.store.sitting_totals("995")), len(SITTINGS))
+        self.assertEqual(self.store.sitting_totals("995")["2025-01-07"], (2, 2))
+
+    def test_other_legislatures_are_untouched(self):
+        self.store.upsert("994", DIRECTORY[:1], scrape(DIRECTORY[:1], SITTINGS[:1]), prune=True)
+        self.assertEqual(len(self.store.load_attendance("995", DIRECTORY)), len(DIRECTORY))
+        self.assertEqual(len(self.store.sitting_totals("995")), len(SITTINGS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+End-to-end tests: whole scraper runs against a small synthetic parliament.lk.
+
+    cd scraper && python -m unittest test_end_to_end
+
+testdata/cassette is record_cassette() of SyntheticSite — a cross-check run,
+so it holds both the per-MP and the per-sitting pages — with its URLs
+pointed back at parliament.lk. Every test that replays it runs offline.
+"""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+import mp_scraper
+
+CASSETTE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "testdata", "cassette")
+
+MPS = [
+    {"id": "3101", "name": "Hon. Anura Dissanayake", "party": "NPP", "district": "Colombo"},
+    {"id": "3102", "name": "Hon. Sajith Premadasa", "party": "SJB", "district": "Colombo"},
+    {"id": "3103", "name": "Hon. Harini Amarasuriya", "party": "NPP", "district": "Colombo"},
+    {"id": "3104", "name": "Hon. Namal Rajapaksa", "party": "SLPP", "district": "Hambantota"},
+    {"id": "3105", "name": "Hon. Nalin Fernando", "party": "SJB", "district": "Gampaha"},
+    {"id": "3106", "name": "Hon. Kamal Silva", "party": "NPP", "district": "Kandy"},
+    {"id": "3107", "name": "Hon. S. Shritharan", "party": "ITAK", "district": "Jaffna"},
+    {"id": "3108", "name": "Hon. Nimal Perera", "party": "NPP", "district": "Galle"},
+]
+SITTINGS = ["2025-01-07", "2025-01-08", "2025-01-09", "2025-01-21", "2025-01-22", "2025-01-23",
+            "2025-02-04", "2025-02-05", "2025-02-06", "2025-02-18", "2025-02-19", "2025-02-20"]
+SWORN_IN = {"3108": "2025-02-01"}  # a by-election: no rows before this
+DIRECTORY_PAGE, MEMBER_PAGE, HOUSE_PAGE = 5, 5, 4  # rows per page of each listing
+
+
+def status(mp_id, date):
+    """Deterministic attendance, about one absence in five."""
+    if date < SWORN_IN.get(mp_id, ""):
+        return None
+    return "Absent" if (int(mp_id) * 7 + SITTINGS.index(date) * 3) % 5 == 0 else "Present"
+
+
+class SyntheticSite(BaseHTTPRequestHandler):
+    """Serves the three listings the scraper reads, in parliament.lk's markup."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        page = int(parse_qs(url.query).get("page", ["1"])[0])
+        newest_first = sorted(SITTINGS, reverse=True)
+        if url.path.endswith("/mp-listing"):
+            body = "".join(
+                f'<div class="mp-card"><a href="/en/members-of-parliament/mp-profile/{mp["id"]}">{mp["name"]}</a>'
+                f'<p>Political Party</p><p>{mp["party"]}</p><p>District</p><p>{mp["district"]}</p></div>'
+                for mp in self.chunk(MPS, DIRECTORY_PAGE, page)) + self.pager(MPS, DIRECTORY_PAGE)
+        elif "/house-attendance/" in url.path:
+            mp_id = url.path.rsplit("/", 1)[-1]
+            dates = [d for d in newest_first if status(mp_id, d)]
+            body = "<table><tr><th>Date</th><th>Status</th></tr>" + "".join(
+                f"<tr><td>{d}</td><td>{status(mp_id, d)}</td></tr>"
+                for d in self.chunk(dates, MEMBER_PAGE, page)) + "</table>" + self.pager(dates, MEMBER_PAGE)
+        elif url.path.endswith("/house-attendance"):
+            body = "".join(
+                f'<button class="accordion-button">{d}</button><table>' + "".join(
+                    f"<tr><td>{mp['name']}</td><td>{status(mp['id'], d)}</td></tr>"
+                    for mp in MPS if status(mp["id"], d)) + "</table>"
+                for d in self.chunk(newest_first, HOUSE_PAGE, page)) + self.pager(newest_first, HOUSE_PAGE)
+        else:
+            body = None
+        data = f"<html><body>{body}</body></html>".encode()
+        self.send_response(200 if body is not None else 404)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    @staticmethod
+    def chunk(items, size, page):
+        return items[(page - 1) * size:page * size]
+
+    @staticmethod
+    def pager(items, size):
+        pages = (len(items) + size - 1) // size
+        return '<ul class="pagination">' + "".join(
+            f'<li><a class="page-link" href="?page={p}">{p}</a></li>' for p in range(1, pages + 1)) + "</ul>"
+
+
+def run_scraper(out, *argv):
+    """Run mp_scraper.main() with every file under `out`; returns the dashboard JSON minus its timestamp."""
+    state = os.path.join(out, ".cache")
+    paths = {
+        "OUTPUT_DIR": out,
+        "OUTPUT_FILE": os.path.join(out, "mp_attendance.json"),
+        "RECORDS_FILE": os.path.join(out, "mp_attendance.records.json"),
+        "MATRIX_FILE": os.path.join(out, "mp_attendance.matrix.json"),
+        "DELTA_FILE": os.path.join(out, "mp_attendance.delta.json"),
+        "SHARD_DIR": os.path.join(out, "mp_attendance"),
+        "MANIFEST_FILE": os.path.join(out, "mp_attendance.manifest.json"),
+        "JOURNAL_FILE": os.path.join(state, "attendance.journal.jsonl"),
+        "CROSSCHECK_FILE": os.path.join(state, "crosscheck.json"),
+        "METRICS_FILE": os.path.join(state, "metrics.json"),
+    }
+    argv = ["--no-archive", "--cache-dir", os.path.join(state, "http"), "--metrics", paths["METRICS_FILE"],
+            "--rate", "1000", "--burst", "100", *argv]
+    with mock.patch.multiple(mp_scraper, **paths, SESSION=mp_scraper.HTTPSession(), CACHE=None, ARCHIVE=None,
+                             REPARSE=None), contextlib.redirect_stdout(io.StringIO()):
+        mp_scraper.main(argv)
+    with open(paths["OUTPUT_FILE"], encoding="utf-8") as f:
+        output = json.load(f)
+    del output["metadata"]["scraped_at"]
+    return output
+
+
+def record_cassette(root, out):
+    """Record a cross-check run of SyntheticSite into `root`; returns the run's output."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SyntheticSite)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with mock.patch.multiple(mp_scraper, BASE_URL=base,
+                                 DIRECTORY_URL=f"{base}/en/members-of-parliament/mp-listing",
+                                 ATTENDANCE_URL=f"{base}/en/members-of-parliament/house-attendance"):
+            output = run_scraper(out, "--record", root, "--mode", "cross-check", "--no-db")
+    finally:
+        server.shutdown()
+        server.server_close()
+    log = os.path.join(root, "interactions.jsonl")
+    with open(log, encoding="utf-8") as f:
+        interactions = f.read().replace(base, mp_scraper.BASE_URL)
+    with open(log, "w", encoding="utf-8") as f:
+        f.write(interactions)
+    return output
+
+
+class CassetteTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.recorded = os.path.join(cls.tmp.name, "cassette")
+        cls.live = record_cassette(cls.recorded, os.path.join(cls.tmp.name, "live"))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def out(self):
+        return tempfile.mkdtemp(dir=self.tmp.name)
+
+    def test_live_run_scrapes_the_whole_site(self):
+        overall = self.live["statistics"]["overall"]
+        self.assertEqual((overall["total_mps"], overall["total_sitting_days"]), (len(MPS), len(SITTINGS)))
+        rows = sum(1 for mp in MPS for d in SITTINGS if status(mp["id"], d))
+        self.assertEqual(sum(m["total_sittings"] for m in self.live["members"]), rows)
+
+    def test_record_then_replay_offline(self):
+        # The site is gone by now: any request that missed the cassette would fail.
+        self.assertEqual(run_scraper(self.out(), "--replay", self.recorded, "--no-db"), self.live)
+
+    def test_committed_cassette_matches_the_site(self):
+        self.assertEqual(run_scraper(self.out(), "--replay", CASSETTE, "--no-db"), self.live)
+
+    def test_replay_that_leaves_the_cassette_exits(self):
+        cassette = shutil.copytree(self.recorded, os.path.join(self.out(), "cassette"))
+        with open(os.path.join(cassette, "interactions.jsonl"), encoding="utf-8") as f:
+            kept = [line for line in f if "mp-listing?itemCount=32&page=2" not in line]
+        with open(os.path.join(cassette, "interactions.jsonl"), "w", encoding="utf-8") as f:
+            f.writelines(kept)
+        with self.assertRaises(SystemExit) as exited:
+            run_scraper(self.out(), "--replay", cassette, "--no-db")
+        self.assertEqual(exited.exception.code, 1)
+
+
+class ModesTest(unittest.TestCase):
+    """Every engine and crawl mode reads the same site into the same output."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.threads = cls.replay("--engine", "threads")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    @classmethod
+    def replay(cls, *argv):
+        return run_scraper(tempfile.mkdtemp(dir=cls.tmp.name), "--replay", CASSETTE, "--no-db", *argv)
+
+    def test_pipeline_matches_threads(self):
+        self.assertEqual(self.replay("--engine", "pipeline", "--parse-processes", "2"), self.threads)
+
+    def test_by_date_matches_by_mp(self):
+        self.assertEqual(self.replay("--mode", "by-date"), self.threads)
+
+    def test_serial_page_fetching_matches(self):
+        self.assertEqual(self.replay("--concurrency", "2", "--page-concurrency", "1"), self.threads)
+
+    def test_store_matches_no_db(self):
+        out = tempfile.mkdtemp(dir=self.tmp.name)
+        db = os.path.join(out, "attendance.sqlite")
+        for _ in range(2):  # a second refresh into the same store changes nothing
+            self.assertEqual(run_scraper(out, "--replay", CASSETTE, "--db", db), self.threads)
+
+    def test_pipeline_abort_leaves_no_threads_behind(self):
+        class FailingJournal:
+            def record(self, mp_id, records):
+                raise RuntimeError("disk full")
+
+        before = set(threading.enumerate())
+        # A one-page raw queue, so fetchers are still blocked on it when the aggregator fails.
+        with mock.patch.multiple(mp_scraper, SESSION=mp_scraper.CassetteSession(CASSETTE, replay=True),
+                                 PIPELINE_QUEUE_SIZE=1), \
+                contextlib.redirect_stdout(io.StringIO()), self.assertRaises(RuntimeError):
+            mp_scraper.scrape_all_attendance_pipeline(MPS, fetchers=3, parsers=1, journal=FailingJournal())
+        self.assertEqual(set(threading.enumerate()) - before, set())
+
+
+if __name__ == "__main__":
+    unittest.main()
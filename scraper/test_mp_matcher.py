@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for mp_matcher.
+
+    cd scraper && python -m unittest test_mp_matcher
+"""
+
+import unittest
+
+from mp_matcher import MPNameMatcher, normalise_name
+
+DIRECTORY = [
+    {"id": "101", "name": "Hon. Anura Kumara Dissanayake"},
+    {"id": "102", "name": "Hon. Ranil Wickremesinghe"},
+    {"id": "103", "name": "Hon. Sajith Premadasa"},
+    {"id": "104", "name": "Hon. A. C. Perera"},
+    {"id": "105", "name": "Hon. A. K. Perera"},
+    {"id": "106", "name": "Hon. Nalin Fernando"},
+    {"id": "107", "name": "Hon. Kamal Silva"},
+    {"id": "108", "name": "Hon. W. D. J. Seneviratne"},
+]
+
+
+class NormaliseNameTest(unittest.TestCase):
+
+    def test_drops_honorifics_punctuation_and_case(self):
+        self.assertEqual(normalise_name("Hon. (Dr.) Sajith  PREMADASA, MP"), "sajith premadasa")
+
+    def test_splits_joined_initials(self):
+        self.assertEqual(normalise_name("AK. Dissanayake"), "a k dissanayake")
+
+
+class MatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.matcher = MPNameMatcher(DIRECTORY)
+
+    def assertMatch(self, name, mp_id, method):
+        result = self.matcher.match(name)
+        self.assertEqual((result.mp_id, result.method), (mp_id, method), result)
+
+    def test_exact(self):
+        self.assertMatch("Sajith Premadasa", "103", "exact")
+
+    def test_surname_first_with_comma(self):
+        self.assertMatch("Dissanayake, Anura Kumara", "101", "exact")
+
+    def test_tokens_in_any_order(self):
+        self.assertMatch("Premadasa Sajith", "103", "tokens")
+
+    def test_initials_against_spelled_out_name(self):
+        self.assertMatch("A. K. Dissanayake", "101", "initials")
+
+    def test_initials_against_abbreviated_directory_name(self):
+        self.assertMatch("W. D. Seneviratne", "108", "initials")
+
+    def test_shared_initials_are_ambiguous(self):
+        result = self.matcher.match("A. Perera")
+        self.assertEqual(result.method, "ambiguous")
+        self.assertEqual(result.candidates, ["104", "105"])
+
+    def test_fuzzy_surname_transliteration(self):
+        self.assertMatch("Ranil Wickramasinghe", "102", "fuzzy")
+
+    def test_fuzzy_given_name_transliteration(self):
+        self.assertMatch("Anura Kumar Dissanayake", "101", "fuzzy")
+
+    def test_conflicting_initials_are_not_fuzzy_matched(self):
+        # Same surname, but the initials pass has ruled out both Pereras.
+        result = self.matcher.match("A. B. Perera")
+        self.assertIsNone(result.mp_id)
+        self.assertEqual(result.method, "unresolved")
+        self.assertIn("104", result.candidates)
+
+    def test_conflicting_given_names_are_not_fuzzy_matched(self):
+        result = self.matcher.match("Hon. Nimal Fernando")
+        self.assertIsNone(result.mp_id)
+        self.assertEqual(result.method, "unresolved")
+        self.assertIn("106", result.candidates)
+
+    def test_unknown_name(self):
+        result = self.matcher.match("Zeb Unknownson")
+        self.assertEqual((result.mp_id, result.method), (None, "unresolved"))
+
+    def test_match_is_memoised(self):
+        self.assertIs(self.matcher.match("Sajith Premadasa"), self.matcher.match("Sajith Premadasa"))
+
+
+class ResolveAllTest(unittest.TestCase):
+
+    def test_splits_resolved_unresolved_and_ambiguous(self):
+        matcher = MPNameMatcher(DIRECTORY)
+        names = ["Sajith Premadasa", "A. Perera", "Hon. Nimal Fernando", "Sajith Premadasa"]
+        mapping, unresolved, ambiguous = matcher.resolve_all(names)
+        self.assertEqual(mapping, {"Sajith Premadasa": "103"})
+        self.assertEqual([r.name for r in unresolved], ["Hon. Nimal Fernando"])
+        self.assertEqual([r.name for r in ambiguous], ["A. Perera"])
+        self.assertIn("is ambiguous between", matcher.describe(ambiguous[0]))
+        self.assertIn("matched no MP; closest:", matcher.describe(unresolved[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-host rate limiting.
+
+    cd scraper && python -m unittest test_rate_limiting
+"""
+
+import unittest
+from unittest import mock
+
+import mp_scraper
+from mp_scraper import RATE_LIMITER, AdaptiveWindow, configure, parse_args
+
+
+class Clock:
+    """Stands in for time.monotonic, advanced by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class AdaptiveWindowTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = Clock()
+        patcher = mock.patch.object(mp_scraper.time, "monotonic", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.window = AdaptiveWindow(initial=2, maximum=16)
+
+    def respond(self, latency, n=1, **kwargs):
+        for _ in range(n):
+            self.window.enter()
+            self.clock.now += latency
+            self.window.exit(latency, **kwargs)
+
+    def test_healthy_responses_widen_the_window(self):
+        self.respond(0.1, 200)
+        self.assertEqual(self.window.limit, 16)
+        self.assertEqual(self.window.decreases, 0)
+
+    def test_congestion_halves_the_window_once_per_round_trip(self):
+        self.respond(0.1, 200)
+        self.respond(0.1, 5, congested=True)
+        self.assertEqual((self.window.limit, self.window.decreases), (8, 1))
+
+    def test_sustained_latency_shift_is_not_congestion_for_long(self):
+        self.respond(0.1, 50)
+        self.respond(0.5, 200)
+        self.assertLessEqual(self.window.decreases, 2)
+        self.assertEqual(self.window.limit, 16)
+        self.assertAlmostEqual(self.window.latency, 0.5)
+
+    def test_one_spike_still_counts_as_congestion(self):
+        self.respond(0.1, 50)
+        limit = self.window.limit
+        self.respond(1.0)
+        self.assertEqual((self.window.limit, self.window.decreases), (limit / 2, 1))
+
+
+class ConfigureTest(unittest.TestCase):
+
+    def tearDown(self):
+        RATE_LIMITER.configure(rate=mp_scraper.REQUEST_RATE, burst=mp_scraper.REQUEST_BURST, adaptive=True)
+
+    def configure(self, *argv):
+        configure(parse_args(["--no-cache", "--no-archive", *argv]), 2.0)
+        return RATE_LIMITER.adaptive
+
+    def test_adaptive_by_default(self):
+        self.assertTrue(self.configure())
+
+    def test_sequential_crawl_keeps_the_fixed_pauses(self):
+        self.assertFalse(self.configure("--concurrency", "1"))
+        self.assertFalse(self.configure("--no-adaptive"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for compute_statistics, against a plain-Python reference.
+
+    cd scraper && python -m unittest test_statistics
+"""
+
+import random
+import unittest
+from datetime import date, timedelta
+from unittest import mock
+
+import mp_scraper
+from mp_scraper import compute_statistics, summarise_attendance
+
+WINDOW, QUORUM = 10, 6
+
+
+def synthetic_legislature(seed=7, members=12, sittings=40):
+    """MPs with a mix of Present/Absent/other rows, some sworn in late, newest row first."""
+    rng = random.Random(seed)
+    dates = [(date(2025, 1, 7) + timedelta(days=2 * k)).isoformat() for k in range(sittings)]
+    mps, attendance = [], {}
+    for n in range(members):
+        mp = {"id": str(4000 + n), "name": f"Hon. Member {n}", "party": ["NPP", "SJB", ""][n % 3],
+              "district": ["Colombo", "Kandy", "Jaffna", "Galle"][n % 4]}
+        joined = rng.choice([0, 0, 0, 15])
+        records = [{"date": d, "status": rng.choices(["Present", "Absent", "Leave"], [70, 25, 5])[0]}
+                   for d in dates[joined:]]
+        mps.append(mp)
+        attendance[mp["id"]] = summarise_attendance(records[::-1])
+    return mps, attendance, dates
+
+
+def reference(mps, attendance, dates):
+    """The per-sitting, rolling and streak figures, one cell at a time."""
+    status = {(mp["id"], r["date"]): r["status"] for mp in mps for r in attendance[mp["id"]]["records"]}
+
+    def rate(absent, known):
+        return round(absent * 100.0 / known, 1) if known else 0.0
+
+    present = [sum(status.get((mp["id"], d)) == "Present" for mp in mps) for d in dates]
+    absent = [sum(status.get((mp["id"], d)) == "Absent" for mp in mps) for d in dates]
+    rolling = [rate(sum(absent[max(0, i + 1 - WINDOW):i + 1]),
+                    sum(present[max(0, i + 1 - WINDOW):i + 1]) + sum(absent[max(0, i + 1 - WINDOW):i + 1]))
+               for i in range(len(dates))]
+
+    members = {}
+    for mp in mps:
+        codes = [status.get((mp["id"], d)) for d in dates]
+        recent = codes[-WINDOW:]
+        streak = longest = 0
+        for code in codes:
+            streak = streak + 1 if code == "Absent" else 0
+            longest = max(longest, streak)
+        members[mp["id"]] = (rate(recent.count("Absent"), recent.count("Absent") + recent.count("Present")),
+                             longest)
+    return present, absent, rolling, members
+
+
+class ComputeStatisticsTest(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.multiple(mp_scraper, ROLLING_WINDOW=WINDOW, QUORUM=QUORUM)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mps, self.attendance, self.dates = synthetic_legislature()
+        self.members, self.stats = compute_statistics(self.mps, self.attendance)
+        self.present, self.absent, self.rolling, self.per_mp = reference(self.mps, self.attendance, self.dates)
+
+    def test_per_sitting_counts_and_quorum(self):
+        by_sitting = self.stats["by_sitting"]
+        self.assertEqual(by_sitting["dates"], self.dates)
+        self.assertEqual(by_sitting["present"], self.present)
+        self.assertEqual(by_sitting["absent"], self.absent)
+        self.assertEqual(by_sitting["quorum_met"], [p >= QUORUM for p in self.present])
+        self.assertEqual(self.stats["overall"]["sittings_without_quorum"], sum(p < QUORUM for p in self.present))
+
+    def test_rolling_absentee_rate(self):
+        for got, want in zip(self.stats["by_sitting"]["rolling_absentee_rate"], self.rolling):
+            self.assertAlmostEqual(got, want, delta=0.05)
+
+    def test_per_mp_rolling_rate_and_absence_streak(self):
+        for member in self.members:
+            recent, longest = self.per_mp[member["id"]]
+            self.assertAlmostEqual(member["rolling_absentee_rate"], recent, delta=0.05)
+            self.assertEqual(member["longest_absence_streak"], longest)
+
+    def test_group_and_overall_totals(self):
+        for key, field in (("by_party", "party"), ("by_district", "district")):
+            for group, totals in self.stats[key].items():
+                mine = [m for m in self.members if (m[field] or "Unknown") == group]
+                self.assertEqual(totals["members"], len(mine))
+                self.assertEqual(totals["present"], sum(m["present"] for m in mine))
+                self.assertEqual(totals["absent"], sum(m["absent"] for m in mine))
+        overall = self.stats["overall"]
+        self.assertEqual((overall["total_mps"], overall["total_sitting_days"]), (len(self.mps), len(self.dates)))
+        absent, present = sum(self.absent), sum(self.present)
+        self.assertEqual(overall["avg_absentee_rate"], round(absent / (absent + present) * 100, 1))
+
+    def test_rankings(self):
+        rates = {m["id"]: m["absentee_rate"] for m in self.members}
+        worst = self.stats["worst_absentees"]
+        self.assertEqual([rates[i] for i in worst], sorted(rates.values(), reverse=True)[:len(worst)])
+
+    def test_no_sittings(self):
+        mps = self.mps[:2]
+        members, stats = compute_statistics(mps, {})
+        self.assertEqual(stats["overall"]["total_sitting_days"], 0)
+        self.assertEqual([m["longest_absence_streak"] for m in members], [0, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Tests for translate-dossier.py's request packing and batching, with the
+Translation API mocked.
+
+    python3 -m unittest discover -s scripts -p "test_*.py"
+"""
+
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import re
+import unittest
+
+spec = importlib.util.spec_from_file_location(
+    "translate_dossier", os.path.join(os.path.dirname(os.path.abspath(__file__)), "translate-dossier.py"))
+td = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(td)
+
+BAD_KEY = {"error": {"message": "API key not valid. Please pass a valid API key.", "status": "INVALID_ARGUMENT"}}
+BAD_SEGMENT = {"error": {"message": "Invalid value at 'q'", "status": "INVALID_ARGUMENT"}}
+
+
+class FakeResponse:
+
+    def __init__(self, status_code: int, body: dict):
+        self.status_code = status_code
+        self.text = json.dumps(body)
+        self.headers = {}
+        self._body = body
+
+    def json(self) -> dict:
+        return self._body
+
+
+class FakeSession:
+    """Answers v2 translate calls: 'T' + text, or `refusal` for every request."""
+
+    def __init__(self, refusal: tuple[int, dict] = None, poison: str = "POISON"):
+        self.refusal = refusal
+        self.poison = poison
+        self.requests = 0
+
+    def post(self, url, timeout=None, params=None, data=None, json=None):
+        self.requests += 1
+        if self.refusal:
+            return FakeResponse(*self.refusal)
+        if any(self.poison in t for t in data["q"]):
+            return FakeResponse(400, BAD_SEGMENT)
+        return FakeResponse(200, {"data": {"translations": [{"translatedText": "T" + t} for t in data["q"]]}})
+
+
+class RejectedContentTest(unittest.TestCase):
+
+    def translate(self, texts: list[str], refusal: tuple[int, dict] = None) -> tuple[td.TranslationClient, list]:
+        client = td.TranslationClient("key", "project", max_in_flight=1)
+        client.session = FakeSession(refusal)
+        with contextlib.redirect_stdout(io.StringIO()):
+            return client, client.translate_batch(texts, "en", "si")
+
+    def blocks(self, *poisoned: int) -> list[str]:
+        return [f"POISON block {i}" if i in poisoned else f"block {i}" for i in range(100)]
+
+    def test_one_bad_block_fails_alone(self):
+        client, out = self.translate(self.blocks(10))
+        self.assertEqual([i for i, t in enumerate(out) if t is None], [10])
+        self.assertEqual(out[11], "Tblock 11")
+        self.assertIn("POISON block 10", client.rejected)
+
+    def test_bad_blocks_in_both_halves_fail_alone(self):
+        client, out = self.translate(self.blocks(10, 90))
+        self.assertEqual([i for i, t in enumerate(out) if t is None], [10, 90])
+        self.assertEqual(sorted(client.rejected), ["POISON block 10", "POISON block 90"])
+
+    def test_whole_request_refusals_are_raised_without_bisecting(self):
+        for refusal in ((400, BAD_KEY), (403, {"error": {"message": "quota", "status": "PERMISSION_DENIED"}})):
+            client = td.TranslationClient("key", "project", max_in_flight=1)
+            client.session = FakeSession(refusal)
+            with self.assertRaises(td.TranslationAPIError), contextlib.redirect_stdout(io.StringIO()):
+                client.translate_batch(self.blocks(), "en", "si")
+            self.assertEqual(client.session.requests, 1, refusal)
+
+
+def well_formed(html: str) -> bool:
+    """Every non-void element closed, in order."""
+    stack = []
+    for closing, name in re.findall(r"<(/?)([a-zA-Z0-9-]+)[^>]*>", html):
+        name = name.lower()
+        if name in td.VOID_TAGS:
+            continue
+        if not closing:
+            stack.append(name)
+        elif not stack or stack.pop() != name:
+            return False
+    return not stack
+
+
+class SplitHtmlTest(unittest.TestCase):
+
+    HTML = ("<p class='lead'>" + " ".join(
+        f"Sentence {i} has <b>bold {i}</b> and <a href='/x{i}'>a link</a> &amp; more.<br>" for i in range(300))
+        + "</p><ul>" + "".join(f"<li>Item {i}. Second part is <em>{'word ' * 40}</em>indeed.</li>" for i in range(80))
+        + "</ul><table><tr><td>" + "Cell sentence. " * 1500 + "</td></tr></table>")
+
+    def split(self, limit: int) -> list[tuple[str, int]]:
+        pieces = td.split_html(self.HTML, limit)
+        self.assertGreater(len(pieces), 1)
+        return pieces
+
+    def test_short_fragment_comes_back_whole(self):
+        self.assertEqual(td.split_html("<p>short</p>", 100), [("<p>short</p>", 0)])
+
+    def test_pieces_fit_and_are_well_formed(self):
+        for limit in (400, 3000, 30000):
+            for piece, _ in self.split(limit):
+                self.assertLessEqual(len(piece), limit)
+                self.assertTrue(well_formed(piece), piece[:80])
+                self.assertNotRegex(piece, r"<[^>]*$|&[a-z]*$")
+
+    def test_round_trip_is_exact(self):
+        for limit in (400, 3000, 30000):
+            pieces = self.split(limit)
+            self.assertEqual(td.stitch_segments([(p, c, p) for p, c in pieces]), self.HTML)
+
+    def test_trimmed_translations_keep_words_apart_and_elements_whole(self):
+        for limit in (400, 3000, 30000):
+            pieces = self.split(limit)
+            stitched = td.stitch_segments([(p, c, p.strip()) for p, c in pieces])
+            self.assertEqual(re.sub(r"\s+", " ", stitched), re.sub(r"\s+", " ", self.HTML))
+            for tag in ("<p", "<li", "<td", "<table", "<b>", "<em>"):
+                self.assertEqual(stitched.count(tag), self.HTML.count(tag), (limit, tag))
+
+    def test_seam_left_alone_when_the_api_moves_the_tags(self):
+        pieces = [("<p>One. </p>", 0, "<p>Eins.</p>"), ("<p>Two.</p>", 1, "Zwei.<p></p>")]
+        self.assertEqual(td.stitch_segments(pieces), "<p>Eins.</p> Zwei.<p></p>")
+
+
+class PackBatchesTest(unittest.TestCase):
+
+    def test_first_fit_decreasing(self):
+        batches = td.pack_batches([10, 50, 25, 25, 40, 100], 100, 3)
+        self.assertEqual(sorted(map(sorted, batches)), [[0, 1, 4], [2, 3], [5]])
+
+    def test_limits_hold(self):
+        lengths = [(i * 7919) % 900 + 1 for i in range(500)]
+        batches = td.pack_batches(lengths, 3000, 16)
+        self.assertEqual(sorted(i for b in batches for i in b), list(range(len(lengths))))
+        for batch in batches:
+            self.assertEqual(batch, sorted(batch))
+            self.assertLessEqual(len(batch), 16)
+            self.assertLessEqual(sum(lengths[i] for i in batch), 3000)
+
+    def test_oversized_item_goes_alone(self):
+        self.assertEqual(sorted(td.pack_batches([5, 150, 5], 100, 10)), [[0, 2], [1]])
+
+
+if __name__ == "__main__":
+    unittest.main()
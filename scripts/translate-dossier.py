@@ -27,6 +27,11 @@
     # Dry run (show what would be translated)
     python3 scripts/translate-dossier.py translate public/<dossier>/index.html --dry-run
 
+    # Whole site: shared chrome (nav, evidence chips, disclaimers, footers)
+    # is translated once for all pages instead of once per dossier
+    python3 scripts/translate-dossier.py translate-site public
+    python3 scripts/translate-dossier.py translate-site public --dry-run
+
     # Translate a single string (for testing)
     python3 scripts/translate-dossier.py text "The Buddha taught non-self"
     python3 scripts/translate-dossier.py text "The Buddha taught non-self" --target-lang ta
@@ -61,15 +66,20 @@
 """
 
 import argparse
+import hashlib
 import json
 import os
+import random
 import re
+import sqlite3
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     print("ERROR: pip install requests")
     sys.exit(1)
@@ -93,6 +103,32 @@ DEFAULT_LOCATION = "us-central1"
 # Override with GOOGLE_CLOUD_PROJECT env var or --project.
 DEFAULT_PROJECT = "yan-news-503217"
 
+# Translation requests in flight at once. The API quota is per minute, so
+# this bounds the burst rather than the total; 4 keeps well inside the
+# default quota while hiding most of each request's round trip.
+DEFAULT_MAX_IN_FLIGHT = 4
+
+# Retry policy for the Translation API. 408/429/5xx and dropped connections
+# are retried with full-jitter exponential backoff (a random sleep up to
+# BACKOFF_BASE * 2**attempt, capped), honouring Retry-After when sent; any
+# other error is a rejection of the request itself and is not retried.
+MAX_ATTEMPTS = 5
+BACKOFF_BASE = 1.0   # seconds
+BACKOFF_CAP = 30.0   # seconds
+RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+
+# Whether TLLM serves a (project, language pair), as found by the one-off
+# probe. Re-probed after CAPABILITY_TTL_DAYS in case Google adds the pair.
+CAPABILITY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "capabilities.json")
+CAPABILITY_TTL_DAYS = 30
+
+# Per-request limits of translateText: 128 segments (v2 cap; v3 allows 1024)
+# and 30,000 codepoints of content in total. Batches are packed by codepoint
+# up to both, and a block longer than the codepoint limit on its own is split
+# at HTML-safe points (see split_html) and stitched back after translation.
+MAX_REQUEST_SEGMENTS = 128
+MAX_REQUEST_CODEPOINTS = 30000
+
 # Supported target languages
 SUPPORTED_TARGET_LANGS = ("si", "ta", "fr")
 LANG_NAMES = {"si": "Sinhala", "ta": "Tamil", "fr": "French"}
@@ -216,10 +252,237 @@ SINHALA_FIXES = [
 ]
 
 
+# ═══════════════════════════════════════════════════════════════════════
+# TRANSLATION MEMORY
+# ═══════════════════════════════════════════════════════════════════════
+
+# Local SQLite cache of API results. Kept beside the script, never committed.
+TM_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "translation-memory.sqlite")
+
+# Part of every memory key. Bump it when something changes what the API
+# returns for byte-identical input — e.g. attaching a Cloud glossary — so
+# stale entries stop matching. Keep-list edits do NOT need a bump: they
+# change the protected source itself, so only the affected blocks miss.
+GLOSSARY_VERSION = "1"
+
+
+class TranslationMemory:
+    """
+    Persistent cache of API translations, keyed by
+    sha256(protected source, source lang, target lang, model, glossary
+    version, mime type).
+
+    It stores the raw API output, before restore_singlish_terms() and
+    post_process(), so fixing the post-processing maps never needs a
+    re-translation. We pay per character; a --force re-run after a keep-list
+    change should only bill the blocks whose protected HTML actually changed.
+    """
+
+    def __init__(self, path: str = TM_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS memory (
+                key         TEXT PRIMARY KEY,
+                source_lang TEXT NOT NULL,
+                target_lang TEXT NOT NULL,
+                model       TEXT NOT NULL,
+                source      TEXT NOT NULL,
+                translated  TEXT NOT NULL,
+                created_at  TEXT NOT NULL,
+                hits        INTEGER NOT NULL DEFAULT 0
+            )""")
+        self.conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(text: str, source_lang: str, target_lang: str, model: str, mime_type: str) -> str:
+        material = json.dumps([text, source_lang, target_lang, model, GLOSSARY_VERSION, mime_type],
+                              ensure_ascii=False)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def lookup(self, texts: list[str], source_lang: str, target_lang: str,
+               model: str, mime_type: str) -> dict:
+        """Return {text: translated} for every text already in memory."""
+        keys = {self.key(t, source_lang, target_lang, model, mime_type): t for t in texts}
+        found = {}
+        key_list = list(keys)
+        for i in range(0, len(key_list), 500):  # SQLite caps bound parameters
+            chunk = key_list[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT key, translated FROM memory WHERE key IN ({','.join('?' * len(chunk))})", chunk)
+            for key, translated in rows:
+                found[keys[key]] = translated
+        if found:
+            self.conn.executemany("UPDATE memory SET hits = hits + 1 WHERE key = ?",
+                                  [(k,) for k, t in keys.items() if t in found])
+            self.conn.commit()
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def store(self, pairs: list[tuple[str, str]], source_lang: str, target_lang: str,
+              model: str, mime_type: str) -> None:
+        now = time.strftime("%Y-%m-%dT%H:%M:%S")
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO memory (key, source_lang, target_lang, model, source, translated, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(self.key(s, source_lang, target_lang, model, mime_type), source_lang, target_lang,
+              model, s, t, now) for s, t in pairs])
+        self.conn.commit()
+
+    def summary(self) -> str:
+        total = self.hits + self.misses
+        rate = self.hits / total * 100 if total else 0
+        return f"{self.hits} hits, {self.misses} misses ({rate:.0f}% served from memory)"
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# REQUEST PACKING
+# ═══════════════════════════════════════════════════════════════════════
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+             "source", "track", "wbr"}
+
+
+def pack_batches(lengths: list[int], budget: int, max_items: int) -> list[list[int]]:
+    """
+    Bin-pack items by length into batches of at most `budget` total and
+    `max_items` entries (first-fit decreasing). Returns lists of item indexes.
+
+    A fixed 80-item batch either overflowed the request size limit on long
+    paragraphs or wasted a round trip on 80 short labels; packing by
+    codepoints fills every request to the limit instead.
+    """
+    bins = []  # [remaining budget, [indexes]]
+    for i in sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True):
+        for b in bins:
+            if b[0] >= lengths[i] and len(b[1]) < max_items:
+                b[0] -= lengths[i]
+                b[1].append(i)
+                break
+        else:
+            bins.append([budget - lengths[i], [i]])
+    return [sorted(b[1]) for b in bins]
+
+
+def split_html(html: str, limit: int) -> list[tuple[str, int]]:
+    """
+    Split an HTML fragment into well-formed pieces of at most `limit` codepoints.
+
+    Cuts fall only between tags or between sentences (words as a last
+    resort), never inside a tag or an entity. An element open at a cut is
+    closed at the end of one piece and re-opened at the start of the next, so
+    each piece is valid HTML on its own. Returns (piece, carried) pairs, where
+    `carried` counts the elements re-opened at the start of the piece, for
+    stitch_segments() to take out again. Fragments within the limit come
+    back whole.
+    """
+    if len(html) <= limit:
+        return [(html, 0)]
+
+    units = []  # (text, open-tag stack before this unit, stack after it)
+    stack = []  # [(name, opening tag)]
+    for token in re.findall(r"<[^>]*>|[^<]+", html):
+        if token.startswith("<"):
+            before = list(stack)
+            name = re.match(r"</?\s*([a-zA-Z0-9-]+)", token)
+            name = name.group(1).lower() if name else ""
+            if token.startswith("</"):
+                for depth in range(len(stack) - 1, -1, -1):
+                    if stack[depth][0] == name:
+                        del stack[depth:]
+                        break
+            elif name and name not in VOID_TAGS and not token.endswith("/>") and not token.startswith("<!"):
+                stack.append((name, token))
+            units.append((token, before, list(stack)))
+            continue
+        for sentence in re.findall(r".+?(?:[.!?;:](?=\s)|$)\s*", token, flags=re.S):
+            words = [sentence] if len(sentence) <= limit // 2 else re.findall(r"\S+\s*|\s+", sentence)
+            units.extend((word, list(stack), list(stack)) for word in words)
+
+    def closing(open_tags):
+        return "".join(f"</{name}>" for name, _ in reversed(open_tags))
+
+    pieces = []
+    current = ""
+    carried = 0
+    held = None  # opening tags waiting for the content they wrap: (text, before)
+    for text, before, after in units:
+        if len(after) > len(before):
+            held = (held[0] + text, held[1]) if held else (text, before)
+            continue
+        if held:
+            text, before, held = held[0] + text, held[1], None
+        # Cut before this unit if taking it would leave no room to close
+        # whatever is open after it.
+        if current and len(current) + len(text) + len(closing(after)) > limit:
+            pieces.append((current + closing(before), carried))
+            current = "".join(tag for _, tag in before)
+            carried = len(before)
+        current += text
+    if held:
+        current += held[0]
+    if current:
+        pieces.append((current, carried))
+    return pieces
+
+
+def stitch_segments(pieces: list[tuple[str, int, str]]) -> str:
+    """
+    Join the translations of one block's split_html() pieces, given as
+    (source, carried, translation).
+
+    The tags split_html closed and re-opened at each cut are taken out
+    again, so a <p>, <li>, <td> or <table> cut in two comes back as one
+    element rather than two. Should the API have moved them, the seam is
+    left as it is — still valid HTML, just split. A piece whose source text
+    ended in whitespace gets a space after its translation — the API trims
+    it, and the next sentence would otherwise be welded onto this one.
+    """
+    out = ""
+    spaced = False
+    for source, carried, translated in pieces:
+        if carried:
+            closed = re.search(r"(?:</[^>]+>){%d}$" % carried, out)
+            opened = re.match(r"(?:<[a-zA-Z][^>]*>){%d}" % carried, translated)
+            if closed and opened:
+                out, translated = out[:closed.start()], translated[opened.end():]
+        if spaced and not re.search(r"\s(?:</[^>]+>)*$", out):
+            out += " "
+        out += translated
+        text_end = re.sub(r"(?:</[^>]+>)+$", "", source)
+        spaced = text_end != text_end.rstrip()
+    return out
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # GOOGLE CLOUD TRANSLATION API v3 CLIENT
 # ═══════════════════════════════════════════════════════════════════════
 
+class TranslationAPIError(RuntimeError):
+    """A Translation API call that failed; `transient` if retrying could help."""
+
+    def __init__(self, message: str, status: Optional[int] = None, transient: bool = False):
+        super().__init__(message)
+        self.status = status
+        self.transient = transient
+
+    @property
+    def rejects_content(self) -> bool:
+        """
+        A 400 about the texts sent, which bisecting the batch can pin down.
+        A bad key also comes back as 400 ("API key not valid"), and 401/403/
+        404 are auth, quota or endpoint errors: those fail the whole request.
+        """
+        return self.status == 400 and "API key" not in str(self) and "API_KEY" not in str(self)
+
+
 class TranslationClient:
     """
     Google Cloud Translation API v3 Advanced client.
@@ -233,14 +496,59 @@ class TranslationClient:
     # for en->si or en->ta anyway, so v2 NMT is the same engine we would land on.
     V2_BASE = "https://translation.googleapis.com/language/translate/v2"
 
-    def __init__(self, api_key: str, project: str, location: str = DEFAULT_LOCATION):
+    def __init__(self, api_key: str, project: str, location: str = DEFAULT_LOCATION,
+                 memory: Optional[TranslationMemory] = None,
+                 max_in_flight: int = DEFAULT_MAX_IN_FLIGHT):
         self.api_key = api_key
+        self.memory = memory
+        self.max_in_flight = max(1, max_in_flight)
+        # One pooled session for every batch: keep-alive TLS connections
+        # instead of a fresh handshake per request.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=self.max_in_flight)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.project = project
         self.location = location
         self.model_tllm = f"projects/{project}/locations/{location}/models/general/translation-llm"
         self.model_nmt = f"projects/{project}/locations/{location}/models/general/nmt"
         self.active_model = None  # Will be set on first call
-        self._tllm_supported = None  # Cache: None=untested, True/False
+        self._tllm_supported = {}  # (source, target) -> True/False; absent = untested
+        self.rejected = {}  # text -> API error, for blocks the API refused on their own
+        self.retries = 0
+
+    def _post(self, url: str, api: str, **kwargs) -> dict:
+        """
+        POST with retries. Transient failures (RETRYABLE_STATUS, timeouts,
+        dropped connections) back off and retry up to MAX_ATTEMPTS times;
+        anything else raises TranslationAPIError straight away.
+        """
+        for attempt in range(MAX_ATTEMPTS):
+            retry_after = None
+            try:
+                resp = self.session.post(url, timeout=120, **kwargs)
+            except requests.RequestException as e:
+                error = TranslationAPIError(f"Translation API {api} request failed: {e}", transient=True)
+            else:
+                if resp.status_code == 200:
+                    return resp.json()
+                error = TranslationAPIError(
+                    f"Translation API {api} error {resp.status_code}: {resp.text[:500]}",
+                    status=resp.status_code, transient=resp.status_code in RETRYABLE_STATUS)
+                try:
+                    retry_after = float(resp.headers.get("Retry-After", ""))
+                except ValueError:
+                    pass
+            if not error.transient or attempt == MAX_ATTEMPTS - 1:
+                raise error
+            self.retries += 1
+            delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, BACKOFF_CAP * 4))
+            print(f"    ⚠ {error.status or 'network'} from Translation API {api}; "
+                  f"retry {attempt + 1}/{MAX_ATTEMPTS - 1} in {delay:.1f}s")
+            time.sleep(delay)
+        raise AssertionError("unreachable")
 
     @property
     def endpoint(self) -> str:
@@ -263,35 +571,16 @@ class TranslationClient:
             "model": model,
         }
 
-        resp = requests.post(
-            self.endpoint,
-            params={"key": self.api_key},
-            json=payload,
-            timeout=120,
-        )
-
-        if resp.status_code != 200:
-            error_msg = resp.text[:500]
-            raise RuntimeError(f"Translation API v3 error {resp.status_code}: {error_msg}")
-
-        data = resp.json()
+        data = self._post(self.endpoint, "v3", params={"key": self.api_key}, json=payload)
         return [t["translatedText"] for t in data["translations"]]
 
     def _call_v2(self, texts: list[str], source: str, target: str,
                  mime_type: str = "text/plain") -> list[str]:
         """Call Translation API v2 (NMT). Accepts an API key."""
         fmt = "html" if mime_type == "text/html" else "text"
-        resp = requests.post(
-            self.V2_BASE,
-            params={"key": self.api_key},
-            data={"q": texts, "source": source, "target": target,
-                  "format": fmt, "model": "nmt"},
-            timeout=120,
-        )
-        if resp.status_code != 200:
-            raise RuntimeError(
-                f"Translation API v2 error {resp.status_code}: {resp.text[:500]}")
-        data = resp.json()
+        data = self._post(self.V2_BASE, "v2", params={"key": self.api_key},
+                          data={"q": texts, "source": source, "target": target,
+                                "format": fmt, "model": "nmt"})
         return [t["translatedText"] for t in data["data"]["translations"]]
 
     def _try_tllm(self, texts: list[str], source: str, target: str,
@@ -315,6 +604,157 @@ class TranslationClient:
                 return False, []
             raise  # Re-raise unexpected errors
 
+    def _model_id(self, source_lang: str, target_lang: str) -> str:
+        """The engine that actually serves requests — part of every memory key."""
+        if self.api_key:
+            return "v2/nmt"
+        return "v3/translation-llm" if self._tllm_supported.get((source_lang, target_lang)) else "v3/nmt"
+
+    def _capability_key(self, source_lang: str, target_lang: str) -> str:
+        return f"{self.project}/{self.location}:{source_lang}->{target_lang}"
+
+    def _cached_capability(self, source_lang: str, target_lang: str) -> Optional[bool]:
+        """TLLM support for this pair from an earlier run's probe, if still fresh."""
+        try:
+            with open(CAPABILITY_PATH, encoding="utf-8") as f:
+                entry = json.load(f).get(self._capability_key(source_lang, target_lang))
+        except (OSError, ValueError):
+            return None
+        if not entry or time.time() - entry.get("checked_at", 0) > CAPABILITY_TTL_DAYS * 86400:
+            return None
+        return entry["tllm"]
+
+    def _save_capability(self, source_lang: str, target_lang: str, supported: bool) -> None:
+        try:
+            with open(CAPABILITY_PATH, encoding="utf-8") as f:
+                capabilities = json.load(f)
+        except (OSError, ValueError):
+            capabilities = {}
+        capabilities[self._capability_key(source_lang, target_lang)] = {
+            "tllm": supported, "checked_at": int(time.time())}
+        os.makedirs(os.path.dirname(CAPABILITY_PATH), exist_ok=True)
+        tmp = f"{CAPABILITY_PATH}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(capabilities, f, indent=2)
+        os.replace(tmp, CAPABILITY_PATH)
+
+    def _select_model(self, sample: str, source_lang: str, target_lang: str,
+                      mime_type: str) -> Optional[str]:
+        """
+        First call for a language pair: settle the model. A probe result
+        cached on disk is reused; otherwise TLLM is probed with one text and
+        the answer saved, so the probe round trip happens once per project
+        and pair. Returns the probe's translation of `sample` when TLLM
+        answered.
+        """
+        cached = None if self.api_key else self._cached_capability(source_lang, target_lang)
+        if cached is not None:
+            self._tllm_supported[(source_lang, target_lang)] = cached
+            self.active_model = "TLLM" if cached else "NMT"
+            print(f"    Using {self.active_model} for {source_lang}→{target_lang} (cached capability)")
+            return None
+        print(f"    Testing TLLM model for {source_lang}→{target_lang}...")
+        success, translated_list = self._try_tllm([sample], source_lang, target_lang, mime_type)
+        if not self.api_key:
+            self._save_capability(source_lang, target_lang, success)
+        self._tllm_supported[(source_lang, target_lang)] = success
+        if success:
+            self.active_model = "TLLM"
+            print(f"    ✓ TLLM supported! Using Translation LLM (highest quality)")
+            return translated_list[0]
+        self.active_model = "NMT"
+        print(f"    ⚠ TLLM not available for {source_lang}→{target_lang}")
+        print(f"    → Falling back to NMT (v3 Advanced)")
+        return None
+
+    def _translate_uncached(self, texts: list[str], source_lang: str, target_lang: str,
+                            mime_type: str, on_translated=None) -> list[str]:
+        """
+        Send non-empty texts to the API in batches, on the already-selected model.
+
+        Texts over MAX_REQUEST_CODEPOINTS are split into segments first; all
+        segments are then bin-packed into as few requests as the per-request
+        limits allow. Up to max_in_flight batches are sent at once over the
+        shared session, and results come back in input order whatever order
+        the batches finish in.
+
+        `on_translated([(text, translation), ...])` is called on this thread
+        as each batch lands, for the texts it completed, so work already paid
+        for is kept (in the translation memory) even if a later batch fails.
+        A failure is raised once every batch in flight has landed.
+        """
+        model = self.model_tllm if self._tllm_supported.get((source_lang, target_lang)) else self.model_nmt
+        segments = []  # (owner text index, segment, elements carried into it)
+        for i, text in enumerate(texts):
+            for piece, carried in split_html(text, MAX_REQUEST_CODEPOINTS):
+                segments.append((i, piece, carried))
+        batches = pack_batches([len(s) for _, s, _ in segments], MAX_REQUEST_CODEPOINTS, MAX_REQUEST_SEGMENTS)
+
+        def call(batch: list[int]) -> list[str]:
+            return self._call_v3([segments[k][1] for k in batch], source_lang, target_lang,
+                                 model, mime_type)
+
+        def bisect(batch: list[int], error: TranslationAPIError) -> list[Optional[str]]:
+            """`batch` was rejected for its content: narrow it down to the offending segments."""
+            if len(batch) == 1:
+                self.rejected[texts[segments[batch[0]][0]]] = str(error)
+                return [None]
+            middle = len(batch) // 2
+            return send(batch[:middle]) + send(batch[middle:])
+
+        def send(batch: list[int]) -> list[Optional[str]]:
+            """
+            Translate a batch; if the API rejects its content, bisect down to
+            the offending segments, however many there are. Errors that
+            refuse the whole request (see rejects_content) are raised.
+            """
+            try:
+                return call(batch)
+            except TranslationAPIError as e:
+                if not e.rejects_content:
+                    raise
+                return bisect(batch, e)
+
+        owned = [[] for _ in texts]  # text index -> its segment indexes, in order
+        for k, (owner, _, _) in enumerate(segments):
+            owned[owner].append(k)
+        outstanding = [len(ks) for ks in owned]
+        by_segment = {}
+
+        def assemble(owner: int) -> Optional[str]:
+            pieces = [(segments[k][1], segments[k][2], by_segment[k]) for k in owned[owner]]
+            return None if any(t is None for _, _, t in pieces) else stitch_segments(pieces)
+
+        def landed(batch: list[int], results: list[Optional[str]]) -> None:
+            by_segment.update(zip(batch, results))
+            completed = []
+            for k in batch:
+                owner = segments[k][0]
+                outstanding[owner] -= 1
+                if outstanding[owner] == 0:
+                    completed.append((texts[owner], assemble(owner)))
+            if on_translated and completed:
+                on_translated(completed)
+
+        if len(batches) == 1 or self.max_in_flight == 1:
+            for batch in batches:
+                landed(batch, send(batch))
+        else:
+            print(f"    Sending {len(segments)} segments in {len(batches)} batches, "
+                  f"{min(self.max_in_flight, len(batches))} at a time...")
+            error = None
+            with ThreadPoolExecutor(max_workers=min(self.max_in_flight, len(batches))) as pool:
+                futures = {pool.submit(send, batch): batch for batch in batches}
+                for future in as_completed(futures):
+                    try:
+                        landed(futures[future], future.result())
+                    except Exception as e:
+                        error = error or e
+            if error is not None:
+                raise error
+
+        return [assemble(i) for i in range(len(texts))]
+
     def translate_batch(
         self,
         texts: list[str],
@@ -325,76 +765,51 @@ class TranslationClient:
         """
         Translate texts using best available model.
         TLLM first → NMT fallback.
+
+        Blank texts pass through, repeated texts are sent once, and texts
+        already in the translation memory never reach the API. A text the API
+        rejects on its own comes back as None, with the error in
+        self.rejected; the rest of its batch is still translated.
         """
         if not texts:
             return []
 
-        MAX_BATCH = 80  # v3 supports up to 1024 but keep batches reasonable
-        results = []
-
-        for i in range(0, len(texts), MAX_BATCH):
-            batch = texts[i:i + MAX_BATCH]
-            non_empty = [(j, t) for j, t in enumerate(batch) if t.strip()]
-
-            if not non_empty:
-                results.extend(batch)
-                continue
-
-            batch_texts = [t for _, t in non_empty]
-
-            # Model selection
-            if self._tllm_supported is None:
-                # First call: try TLLM
-                print(f"    Testing TLLM model for {source_lang}→{target_lang}...")
-                success, translated_list = self._try_tllm(
-                    batch_texts[:1], source_lang, target_lang, mime_type
-                )
-                if success:
-                    self._tllm_supported = True
-                    self.active_model = "TLLM"
-                    print(f"    ✓ TLLM supported! Using Translation LLM (highest quality)")
-                    # Translate the rest of this batch
-                    if len(batch_texts) > 1:
-                        remaining = self._call_v3(
-                            batch_texts[1:], source_lang, target_lang,
-                            self.model_tllm, mime_type
-                        )
-                        translated_list = translated_list + remaining
-                    else:
-                        pass  # Already have the single result
-                else:
-                    self._tllm_supported = False
-                    self.active_model = "NMT"
-                    print(f"    ⚠ TLLM not available for {source_lang}→{target_lang}")
-                    print(f"    → Falling back to NMT (v3 Advanced)")
-                    translated_list = self._call_v3(
-                        batch_texts, source_lang, target_lang,
-                        self.model_nmt, mime_type
-                    )
-            elif self._tllm_supported:
-                translated_list = self._call_v3(
-                    batch_texts, source_lang, target_lang,
-                    self.model_tllm, mime_type
-                )
-            else:
-                translated_list = self._call_v3(
-                    batch_texts, source_lang, target_lang,
-                    self.model_nmt, mime_type
-                )
-
-            # Map back to original positions
-            translated = {
-                non_empty[k][0]: translated_list[k]
-                for k in range(len(non_empty))
-            }
-
-            for j, t in enumerate(batch):
-                results.append(translated.get(j, t))
-
-            # Rate limit courtesy
-            if i + MAX_BATCH < len(texts):
-                time.sleep(0.3)
-
+        results = list(texts)
+        positions = {}  # text -> indexes in `texts`
+        for i, t in enumerate(texts):
+            if t.strip():
+                positions.setdefault(t, []).append(i)
+        if not positions:
+            return results
+        unique = list(positions)
+
+        fresh = {}  # translations that came from the API this call
+        if (source_lang, target_lang) not in self._tllm_supported:
+            probe = self._select_model(unique[0], source_lang, target_lang, mime_type)
+            if probe is not None:
+                fresh[unique[0]] = probe
+
+        model_id = self._model_id(source_lang, target_lang)
+        done = dict(fresh)
+        if self.memory:
+            done.update(self.memory.lookup([t for t in unique if t not in done],
+                                           source_lang, target_lang, model_id, mime_type))
+        def remember(pairs: list[tuple[str, Optional[str]]]) -> None:
+            pairs = [(s, t) for s, t in pairs if t is not None]
+            if self.memory and pairs:
+                self.memory.store(pairs, source_lang, target_lang, model_id, mime_type)
+
+        remember(list(fresh.items()))
+        misses = [t for t in unique if t not in done]
+        if misses:
+            # Stored batch by batch as they land, not after the last one: a
+            # failure partway through must not throw away what was paid for.
+            done.update(zip(misses, self._translate_uncached(misses, source_lang, target_lang, mime_type,
+                                                             on_translated=remember)))
+
+        for text, translated in done.items():
+            for i in positions[text]:
+                results[i] = translated
         return results
 
     def translate_text(self, text: str, source_lang: str = "en",
@@ -403,6 +818,8 @@ class TranslationClient:
         if not text.strip():
             return text
         results = self.translate_batch([text], source_lang, target_lang)
+        if results[0] is None:
+            raise TranslationAPIError(self.rejected.get(text, "Translation API rejected the text"))
         return results[0]
 
 
@@ -536,30 +953,15 @@ def post_process(text: str, target_lang: str = "si") -> str:
 # DOSSIER HTML TRANSLATION
 # ═══════════════════════════════════════════════════════════════════════
 
-def translate_dossier(
-    html_path: str,
-    client: TranslationClient,
-    dry_run: bool = False,
-    target_lang: str = "si",
-    force: bool = False,
-) -> dict:
+def collect_pending(html_path: str, target_lang: str = "si", force: bool = False) -> dict:
     """
-    Translate a dossier HTML file's English content into the target language.
+    Parse a dossier HTML file and gather the lang-en elements whose
+    lang-<target> sibling still needs copy, with Singlish terms protected.
 
-    Pipeline:
-    1. Parse HTML, find all lang-en elements
-    2. For each, find its corresponding lang-<target> sibling (lang-si/lang-ta)
-    3. Skip elements that already have target-language content
-    4. Protect Singlish terms with placeholders
-    5. Batch translate via Google Cloud v3 (TLLM preferred)
-    6. Restore placeholders, apply language-aware post-processing
-    7. Inject into lang-<target> elements
-    8. Write back to file
-
-    Returns a report dict with statistics.
+    Returns a job dict: soup, report, element_map and the parallel lists
+    protected (what goes to the API) and placeholders (to restore after).
     """
     lang_attr = f"lang-{target_lang}"
-    lang_name = LANG_NAMES.get(target_lang, target_lang)
 
     with open(html_path, "r", encoding="utf-8") as f:
         soup = BeautifulSoup(f.read(), "lxml")
@@ -579,8 +981,6 @@ def translate_dossier(
     en_elements = soup.find_all(attrs={"lang-en": True})
     report["total_en_elements"] = len(en_elements)
 
-    # Collect texts to translate in batch
-    to_translate = []
     element_map = []
 
     for en_el in en_elements:
@@ -608,53 +1008,50 @@ def translate_dossier(
             report["already_translated"] += 1
             continue
 
-        to_translate.append(en_html)
         element_map.append((en_el, si_el, en_html))
 
-    print(f"\n  Target language: {lang_name} ({target_lang}) → <{lang_attr}> siblings")
-    print(f"  Total EN elements: {report['total_en_elements']}")
-    print(f"  Already translated: {report['already_translated']}")
-    print(f"  Need translation: {len(to_translate)}")
-
-    if not to_translate:
-        print("\n  ✓ All entries already translated!")
-        return report
-
-    if dry_run:
-        print(f"\n  [DRY RUN] Would translate {len(to_translate)} elements:")
-        for i, (en_el, si_el, en_html) in enumerate(element_map[:15]):
-            tag = en_el.name
-            cms_id = en_el.get("data-cms-id", "—")
-            preview = element_text(en_el)[:70].replace("\n", " ")
-            print(f"    [{i+1}] <{tag} cms={cms_id}> {preview}...")
-        if len(element_map) > 15:
-            print(f"    ... and {len(element_map) - 15} more")
-        return report
-
     # ── Protect Singlish terms ──
     protected_texts = []
     all_placeholders = []
-    for text in to_translate:
-        protected, placeholders = protect_singlish_terms(text)
+    for _, _, en_html in element_map:
+        protected, placeholders = protect_singlish_terms(en_html)
         protected_texts.append(protected)
         all_placeholders.append(placeholders)
 
-    # ── Batch translate via API ──
-    print(f"\n  Translating {len(protected_texts)} blocks via Google Cloud Translation v3...")
-    translated_texts = client.translate_batch(
-        protected_texts,
-        source_lang="en",
-        target_lang=target_lang,
-        mime_type="text/html",
-    )
+    return {
+        "path": html_path,
+        "soup": soup,
+        "report": report,
+        "element_map": element_map,
+        "protected": protected_texts,
+        "placeholders": all_placeholders,
+    }
+
+
+def apply_translations(job: dict, translated_texts: list[Optional[str]],
+                       client: TranslationClient, target_lang: str = "si") -> dict:
+    """
+    Restore placeholders, post-process and inject translations into a job
+    from collect_pending, then write the HTML and its translation map back.
+    Blocks the API rejected (None) are reported as errors and left as-is.
+    """
+    lang_name = LANG_NAMES.get(target_lang, target_lang)
+    html_path = job["path"]
+    report = job["report"]
 
     report["model"] = client.active_model
+    if client.memory:
+        report["memory"] = {"hits": client.memory.hits, "misses": client.memory.misses}
 
     # ── Post-process and inject ──
-    for i, (en_el, si_el, en_html) in enumerate(element_map):
+    for i, (en_el, si_el, en_html) in enumerate(job["element_map"]):
         try:
             translated = translated_texts[i]
-            translated = restore_singlish_terms(translated, all_placeholders[i])
+            if translated is None:
+                report["errors"].append(
+                    f"Element {i} rejected by Translation API: {client.rejected.get(job['protected'][i], '')[:200]}")
+                continue
+            translated = restore_singlish_terms(translated, job["placeholders"][i])
             translated = post_process(translated, target_lang)
 
             # Replace the target-language element's content
@@ -674,10 +1071,12 @@ def translate_dossier(
 
     # ── Write back ──
     with open(html_path, "w", encoding="utf-8") as f:
-        f.write(str(soup))
+        f.write(str(job["soup"]))
 
     print(f"\n  ═══ TRANSLATION COMPLETE ({lang_name}) ═══")
     print(f"  Model: {report['model']} (Google Cloud Translation v3 Advanced)")
+    if client.memory:
+        print(f"  Translation memory: {client.memory.summary()}")
     print(f"  Newly translated: {report['newly_translated']}")
     print(f"  Previously translated: {report['already_translated']}")
     print(f"  Errors: {len(report['errors'])}")
@@ -688,6 +1087,10 @@ def translate_dossier(
     # Save translation map
     dossier = os.path.basename(os.path.dirname(os.path.abspath(html_path)))
     suffix = "" if target_lang == "si" else f"-{target_lang}"
+    page = os.path.splitext(os.path.basename(html_path))[0]
+    if page != "index":
+        # Secondary pages (betting-web.html, policy-paper.html) get their own map
+        suffix = f"-{page}{suffix}"
     map_path = os.path.join(
         os.path.dirname(html_path), f"{dossier}-translations{suffix}.json"
     )
@@ -698,6 +1101,175 @@ def translate_dossier(
     return report
 
 
+def translate_dossier(
+    html_path: str,
+    client: TranslationClient,
+    dry_run: bool = False,
+    target_lang: str = "si",
+    force: bool = False,
+) -> dict:
+    """
+    Translate a dossier HTML file's English content into the target language.
+
+    Pipeline:
+    1. Parse HTML, find all lang-en elements
+    2. For each, find its corresponding lang-<target> sibling (lang-si/lang-ta)
+    3. Skip elements that already have target-language content
+    4. Protect Singlish terms with placeholders
+    5. Batch translate via Google Cloud v3 (TLLM preferred)
+    6. Restore placeholders, apply language-aware post-processing
+    7. Inject into lang-<target> elements
+    8. Write back to file
+
+    Returns a report dict with statistics.
+    """
+    lang_attr = f"lang-{target_lang}"
+    lang_name = LANG_NAMES.get(target_lang, target_lang)
+
+    job = collect_pending(html_path, target_lang, force)
+    report = job["report"]
+    element_map = job["element_map"]
+
+    print(f"\n  Target language: {lang_name} ({target_lang}) → <{lang_attr}> siblings")
+    print(f"  Total EN elements: {report['total_en_elements']}")
+    print(f"  Already translated: {report['already_translated']}")
+    print(f"  Need translation: {len(element_map)}")
+
+    if not element_map:
+        print("\n  ✓ All entries already translated!")
+        return report
+
+    if dry_run:
+        print(f"\n  [DRY RUN] Would translate {len(element_map)} elements:")
+        for i, (en_el, si_el, en_html) in enumerate(element_map[:15]):
+            tag = en_el.name
+            cms_id = en_el.get("data-cms-id", "—")
+            preview = element_text(en_el)[:70].replace("\n", " ")
+            print(f"    [{i+1}] <{tag} cms={cms_id}> {preview}...")
+        if len(element_map) > 15:
+            print(f"    ... and {len(element_map) - 15} more")
+        return report
+
+    # ── Batch translate via API ──
+    print(f"\n  Translating {len(job['protected'])} blocks via Google Cloud Translation v3...")
+    translated_texts = client.translate_batch(
+        job["protected"],
+        source_lang="en",
+        target_lang=target_lang,
+        mime_type="text/html",
+    )
+
+    return apply_translations(job, translated_texts, client, target_lang)
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# SITE-WIDE TRANSLATION
+# ═══════════════════════════════════════════════════════════════════════
+
+def find_site_pages(paths: list[str]) -> list[str]:
+    """
+    Expand files and directories into the HTML pages that carry lang-en
+    copy. Directories are walked recursively; generated review pages are
+    skipped.
+    """
+    candidates = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+                candidates.extend(os.path.join(root, name) for name in sorted(files)
+                                  if name.endswith(".html"))
+        else:
+            candidates.append(path)
+
+    pages = []
+    for page in dict.fromkeys(candidates):
+        if os.path.basename(page).startswith("translation-review"):
+            continue
+        with open(page, "r", encoding="utf-8", errors="replace") as f:
+            if "lang-en" in f.read():
+                pages.append(page)
+    return pages
+
+
+def translate_site(
+    paths: list[str],
+    client: TranslationClient,
+    dry_run: bool = False,
+    target_lang: str = "si",
+    force: bool = False,
+) -> list[dict]:
+    """
+    Translate many dossier pages in one pass.
+
+    Every page's pending blocks are collected first, identical protected
+    sources are merged across pages (shared nav labels, evidence chips,
+    disclaimers, footers), each unique source is translated once through
+    one client, and the results are fanned back out to every page that
+    uses it. API spend and wall time scale with unique text, not with the
+    number of pages.
+
+    Returns one report dict per page that had pending blocks.
+    """
+    lang_name = LANG_NAMES.get(target_lang, target_lang)
+    pages = find_site_pages(paths)
+    jobs = [collect_pending(page, target_lang, force) for page in pages]
+
+    print(f"\n  Target language: {lang_name} ({target_lang}) → <lang-{target_lang}> siblings")
+    print(f"  Pages with lang-en copy: {len(pages)}")
+    for job in jobs:
+        print(f"    {job['path']}: {len(job['element_map'])} pending, "
+              f"{job['report']['already_translated']} already translated")
+
+    jobs = [job for job in jobs if job["element_map"]]
+    sources = [text for job in jobs for text in job["protected"]]
+    unique = list(dict.fromkeys(sources))
+    total_chars = sum(len(s) for s in sources)
+    unique_chars = sum(len(s) for s in unique)
+
+    print(f"  Pending blocks: {len(sources)} ({total_chars:,} chars)")
+    print(f"  Unique sources: {len(unique)} ({unique_chars:,} chars)")
+
+    if not sources:
+        print("\n  ✓ All entries already translated!")
+        return []
+
+    if dry_run:
+        shared = {}
+        for job in jobs:
+            for text in dict.fromkeys(job["protected"]):
+                shared[text] = shared.get(text, 0) + 1
+        repeated = sorted((n, text) for text, n in shared.items() if n > 1)[::-1]
+        print(f"\n  [DRY RUN] Would translate {len(unique)} unique blocks; "
+              f"{len(repeated)} are shared between pages:")
+        for n, text in repeated[:15]:
+            preview = BeautifulSoup(text, "html.parser").get_text(" ", strip=True)[:60]
+            print(f"    [{n} pages] {preview}")
+        return [job["report"] for job in jobs]
+
+    # ── One batch for the whole site ──
+    print(f"\n  Translating {len(unique)} unique blocks via Google Cloud Translation v3...")
+    translated = dict(zip(unique, client.translate_batch(
+        unique,
+        source_lang="en",
+        target_lang=target_lang,
+        mime_type="text/html",
+    )))
+
+    reports = []
+    for job in jobs:
+        print(f"\n  ── {job['path']} ──")
+        reports.append(apply_translations(
+            job, [translated[text] for text in job["protected"]], client, target_lang))
+
+    errors = sum(len(r["errors"]) for r in reports)
+    print(f"\n  ═══ SITE TRANSLATION COMPLETE ({lang_name}) ═══")
+    print(f"  Pages: {len(reports)} | Blocks: {len(sources)} | "
+          f"Sent for translation: {len(unique)} unique ({unique_chars:,} of {total_chars:,} chars)")
+    print(f"  Errors: {errors}")
+    return reports
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # QA TESTING
 # ═══════════════════════════════════════════════════════════════════════
@@ -1009,6 +1581,15 @@ def main():
     parser.add_argument("--target-lang", choices=SUPPORTED_TARGET_LANGS, default="si",
                         help="Target language: si (Sinhala, default) or ta (Tamil). "
                              "Selects the lang-si/lang-ta siblings and -si/-ta CMS ids.")
+    parser.add_argument("--memory", default=TM_PATH,
+                        help="SQLite translation memory; blocks whose protected source is "
+                             "unchanged are served from it instead of the API "
+                             "(default: scripts/.cache/translation-memory.sqlite)")
+    parser.add_argument("--max-in-flight", type=int, default=DEFAULT_MAX_IN_FLIGHT,
+                        help="Translation requests sent concurrently; lower it if the "
+                             f"project's quota is tight (default: {DEFAULT_MAX_IN_FLIGHT})")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="Bypass the translation memory and send every block to the API")
 
     subparsers = parser.add_subparsers(dest="command")
 
@@ -1029,6 +1610,18 @@ def main():
                                "the keep-term glossary)")
     add_target_lang(t_parser)
 
+    # translate-site command
+    site_parser = subparsers.add_parser(
+        "translate-site",
+        help="Translate many dossier pages at once, sending each unique block to the API once")
+    site_parser.add_argument("paths", nargs="+",
+                             help="Dossier HTML files or directories to scan (e.g. public)")
+    site_parser.add_argument("--dry-run", action="store_true")
+    site_parser.add_argument("--force", action="store_true",
+                             help="Re-translate elements that already have "
+                                  "target-language content")
+    add_target_lang(site_parser)
+
     # text command
     txt_parser = subparsers.add_parser("text", help="Translate a single text string")
     txt_parser.add_argument("content", help="Text to translate")
@@ -1066,7 +1659,7 @@ def main():
 
     # Commands that need API
     needs_api = args.command in ("text",) or \
-                (args.command == "translate" and not getattr(args, "dry_run", False)) or \
+                (args.command in ("translate", "translate-site") and not getattr(args, "dry_run", False)) or \
                 (args.command == "test" and getattr(args, "backtranslate", False))
 
     client = None
@@ -1084,10 +1677,14 @@ def main():
             print("    # or visit console.cloud.google.com\n")
             sys.exit(1)
 
-        client = TranslationClient(args.api_key, args.project, args.location)
+        memory = None if args.no_memory else TranslationMemory(args.memory)
+        client = TranslationClient(args.api_key, args.project, args.location, memory=memory,
+                                   max_in_flight=args.max_in_flight)
         print(f"\n  API key: ...{args.api_key[-6:]}")
         print(f"  Project: {args.project}")
         print(f"  Region:  {args.location}")
+        if memory:
+            print(f"  Memory:  {args.memory}")
 
     # Execute command
     if args.command == "translate":
@@ -1100,6 +1697,16 @@ def main():
             print("\n  Generating review page...")
             generate_review_html(args.html_file, target_lang=target_lang)
 
+    elif args.command == "translate-site":
+        reports = translate_site(args.paths, client, dry_run=args.dry_run,
+                                 target_lang=target_lang, force=args.force)
+        if not args.dry_run:
+            # Review pages are per dossier, built from its index.html
+            for report in reports:
+                if os.path.basename(report["file"]) == "index.html":
+                    print(f"\n  Generating review page for {report['file']}...")
+                    generate_review_html(report["file"], target_lang=target_lang)
+
     elif args.command == "text":
         protected, placeholders = protect_singlish_terms(args.content)
         translated = client.translate_text(protected, source_lang="en", target_lang=target_lang)